@@ -0,0 +1,386 @@
+"""Benchmarks for simplify_curve() and simplify_curve_to().
+
+Each case simplifies one curve shape of one size with one distance function on
+one backend, and reports points per second (best of several runs), peak memory
+allocated while simplifying (measured in a separate run with `tracemalloc`),
+and the number of distance evaluations (recorded with `record_stats()`).
+
+Results can be saved as a baseline and compared against later, in which case
+the script exits with status 1 if any case got slower or used more memory by
+more than the threshold, or needed more distance evaluations at all. Baselines
+are only comparable on the same machine.
+
+By default, curves of up to 10^5 points are benchmarked, and up to 10^4 points
+without NumPy; use `--max-points 10000000` for the full sweep.
+
+Usage, with the package installed (e.g. `pip install -e .`):
+
+    python __tests__/benchmark/benchmark.py --save baseline.json
+    python __tests__/benchmark/benchmark.py --compare baseline.json
+"""
+# pylint: disable=invalid-name
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from math import cos, exp, sin
+from random import Random
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from curvereduce import (
+    perpendicular_distance,
+    rdp,
+    record_stats,
+    shortest_distance,
+    simplify_curve,
+    simplify_curve_to,
+)
+
+SIZES = [10**3, 10**4, 10**5, 10**6, 10**7]
+"""Number of points of the benchmarked curves."""
+
+SCAN_WORST_CASE_MAX_POINTS = 10**3
+"""The scan algorithm is quadratic on the worst-case curve, so it's only
+benchmarked up to this many points."""
+
+Curve = List[Tuple[float, float]]
+"""Type representing a benchmarked curve."""
+
+
+def sensor_curve(count: int) -> Curve:
+    """Smooth sensor response with a little ripple, like the `many_points`
+    fixture of the unit tests.
+
+    Args:
+        count (int): number of points
+
+    Returns:
+        Curve: points describing the curve
+    """
+    return [
+        (x, 100 * (1 - exp(-x / 20)) + sin(x * 3) / 10)
+        for x in (i * 100 / count for i in range(count))
+    ]
+
+
+def gps_curve(count: int) -> Curve:
+    """Noisy GPS track: a random walk with a slowly changing heading and some
+    measurement noise.
+
+    Args:
+        count (int): number of points
+
+    Returns:
+        Curve: points describing the curve
+    """
+
+    rng = Random(count)
+    x = y = heading = 0.0
+    result = []
+
+    for _ in range(count):
+        heading += rng.gauss(0, 0.1)
+        x += cos(heading)
+        y += sin(heading)
+        result.append((x + rng.gauss(0, 0.5), y + rng.gauss(0, 0.5)))
+
+    return result
+
+
+def zigzag_curve(count: int) -> Curve:
+    """Growing zigzag, where every split only peels off a single point, which
+    is the worst case of the scan algorithm.
+
+    Args:
+        count (int): number of points
+
+    Returns:
+        Curve: points describing the curve
+    """
+    return [(i, (-1) ** i * i * i) for i in range(count)]
+
+
+CURVES: Dict[str, Tuple[Callable[[int], Curve], float]] = {
+    "sensor": (sensor_curve, 0.05),
+    "gps": (gps_curve, 1.0),
+    "zigzag": (zigzag_curve, 0.5),
+}
+"""Curve shapes, and the epsilon used to simplify them."""
+
+DISTANCE_FUNCTIONS = {
+    "shortest": shortest_distance,
+    "perpendicular": perpendicular_distance,
+}
+"""Benchmarked distance functions."""
+
+
+def backends() -> List[str]:
+    """Lists the backends that can be benchmarked here.
+
+    Returns:
+        List[str]: backend names
+    """
+
+    result = ["python", "hull"]
+    if rdp._numpy is not None:  # pylint: disable=protected-access
+        result.insert(1, "numpy")
+
+    return result
+
+
+def cases(
+    max_points: int, python_max_points: int
+) -> Iterator[Tuple[str, str, str, str, int]]:
+    """Lists the benchmark cases.
+
+    Args:
+        max_points (int): largest curve to benchmark
+        python_max_points (int): largest curve to benchmark without NumPy
+
+    Yields:
+        Tuple[str, str, str, str, int]: function, curve, distance function,
+            backend and number of points
+    """
+
+    for size in SIZES:
+        for function in ("simplify_curve", "simplify_curve_to"):
+            for curve in CURVES:
+                for distance in DISTANCE_FUNCTIONS:
+                    for backend in backends():
+                        if size > max_points:
+                            continue
+                        if backend != "numpy" and size > python_max_points:
+                            continue
+                        if backend == "hull" and (
+                            distance != "perpendicular" or function != "simplify_curve"
+                        ):
+                            continue
+                        if (
+                            backend != "hull"
+                            and curve == "zigzag"
+                            and size > SCAN_WORST_CASE_MAX_POINTS
+                        ):
+                            continue
+                        yield function, curve, distance, backend, size
+
+
+def runner(
+    function: str, points: Curve, epsilon: float, distance_function: Any, backend: str
+) -> Callable[[], Any]:
+    """Builds the call being benchmarked.
+
+    Args:
+        function (str): "simplify_curve" or "simplify_curve_to"
+        points (Curve): points describing the curve
+        epsilon (float): minimum distance from the curve
+        distance_function (Any): function used for determining distance
+        backend (str): "python", "numpy" or "hull"
+
+    Returns:
+        Callable[[], Any]: the call
+    """
+
+    algorithm = "hull" if backend == "hull" else "scan"
+
+    if function == "simplify_curve":
+        result = lambda: simplify_curve(  # noqa: E731
+            points, epsilon, distance_function, algorithm
+        )
+    else:
+        result = lambda: simplify_curve_to(  # noqa: E731
+            points, len(points) // 100 + 2, distance_function
+        )
+
+    return result
+
+
+def without_numpy(backend: str) -> Any:
+    """Disables the vectorized kernels unless benchmarking them.
+
+    Args:
+        backend (str): "python", "numpy" or "hull"
+
+    Returns:
+        Any: the NumPy module to restore afterwards
+    """
+
+    # pylint: disable=protected-access
+    saved = rdp._numpy
+    if backend != "numpy":
+        rdp._numpy = None
+
+    return saved
+
+
+def measure(
+    function: str,
+    curve: str,
+    distance: str,
+    backend: str,
+    size: int,
+    repeat: int,
+) -> Dict[str, Any]:
+    """Runs one benchmark case.
+
+    Args:
+        function (str): "simplify_curve" or "simplify_curve_to"
+        curve (str): curve shape
+        distance (str): distance function
+        backend (str): "python", "numpy" or "hull"
+        size (int): number of points
+        repeat (int): number of timed runs
+
+    Returns:
+        Dict[str, Any]: points per second, peak memory in bytes and distance
+            evaluations
+    """
+
+    make_curve, epsilon = CURVES[curve]
+    points = make_curve(size)
+    distance_function = DISTANCE_FUNCTIONS[distance]
+    saved = without_numpy(backend)
+
+    try:
+        call = runner(function, points, epsilon, distance_function, backend)
+
+        # speed
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            call()
+            best = min(best, time.perf_counter() - started)
+
+        # memory and distance evaluations
+        with record_stats() as stats:
+            tracemalloc.start()
+            call()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    finally:
+        rdp._numpy = saved  # pylint: disable=protected-access
+
+    return {
+        "points_per_second": size / best,
+        "peak_memory": peak,
+        "evaluations": stats.distance_evaluations,
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float,
+) -> List[str]:
+    """Compares results against a baseline.
+
+    Args:
+        results (Dict[str, Dict[str, Any]]): results by case
+        baseline (Dict[str, Dict[str, Any]]): baseline results by case
+        threshold (float): tolerated slowdown or memory growth, in percent
+
+    Returns:
+        List[str]: description of every regression
+    """
+
+    regressions = []
+
+    for case, result in results.items():
+        base = baseline.get(case)
+        if base is None:
+            continue
+
+        slower = 1 - result["points_per_second"] / base["points_per_second"]
+        if slower * 100 > threshold:
+            regressions.append(f"{case}: {slower:.0%} slower")
+
+        bigger = result["peak_memory"] / max(base["peak_memory"], 1) - 1
+        if bigger * 100 > threshold:
+            regressions.append(f"{case}: {bigger:.0%} more memory")
+
+        if (
+            result["evaluations"] is not None
+            and base["evaluations"] is not None
+            and result["evaluations"] > base["evaluations"]
+        ):
+            regressions.append(
+                f"{case}: {result['evaluations']} distance evaluations instead "
+                f"of {base['evaluations']}"
+            )
+
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Runs the benchmarks.
+
+    Args:
+        argv (Optional[List[str]], optional): command line arguments. Defaults
+            to `sys.argv[1:]`.
+
+    Returns:
+        int: exit status
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--max-points", type=int, default=10**5)
+    parser.add_argument("--python-max-points", type=int, default=10**4)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--filter", default="", help="only run matching cases")
+    parser.add_argument("--save", metavar="PATH", help="save the results")
+    parser.add_argument("--compare", metavar="PATH", help="compare to a baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=20, help="tolerated regression (%%)"
+    )
+    args = parser.parse_args(argv)
+
+    results = {}
+
+    print(f"{'case':<56} {'points/s':>12} {'peak MiB':>9} {'evaluations':>12}")
+    for function, curve, distance, backend, size in cases(
+        args.max_points, args.python_max_points
+    ):
+        case = f"{function}/{curve}/{distance}/{backend}/{size}"
+        if args.filter not in case:
+            continue
+
+        result = measure(
+            function,
+            curve,
+            distance,
+            backend,
+            size,
+            args.repeat,
+        )
+        results[case] = result
+
+        print(
+            f"{case:<56} {result['points_per_second']:>12,.0f} "
+            f"{result['peak_memory'] / 2**20:>9.2f} "
+            f"{result['evaluations']:>12,}",
+            flush=True,
+        )
+
+    status = 0
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump({"results": results}, file, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            status = 1
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""Fixtures shared by the unit tests."""
+# pylint: disable=redefined-outer-name
+
+from math import sin
+
+from pytest import fixture
+
+from curvereduce import rdp
+
+
+@fixture
+def numpy_modules():
+    """Fixture for the modules, besides `rdp`, whose own reference to the NumPy
+    backend is disabled along with the vectorized kernels. Test modules for code
+    that calls the backend directly override it."""
+    return []
+
+
+@fixture
+def disable_numpy(monkeypatch, numpy_modules):
+    """Fixture for a function that disables the vectorized kernels for the rest
+    of the test."""
+
+    def disable():
+        for module in [rdp, *numpy_modules]:
+            monkeypatch.setattr(module, "_numpy", None)
+
+    return disable
+
+
+@fixture
+def pure_python(disable_numpy):
+    """Fixture that disables the vectorized kernels."""
+    disable_numpy()
+
+
+@fixture(params=[True, False], ids=["numpy", "python"])
+def backend(request, disable_numpy):
+    """Fixture that runs a test with and without the vectorized kernels, and
+    tells whether they are enabled."""
+    if not request.param:
+        disable_numpy()
+    return request.param
+
+
+@fixture
+def wavy_point_count():
+    """Fixture for the number of points of the noisy curve. Test modules that
+    need a shorter or longer curve override it."""
+    return 1000
+
+
+@fixture
+def wavy_points(wavy_point_count):
+    """Fixture for a noisy curve."""
+    return [
+        (x / 10, sin(x / 25) + ((x * 7919) % 13) / 100)
+        for x in range(wavy_point_count)
+    ]
@@ -0,0 +1,189 @@
+"""Test cases for the curvereduce command-line tool."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+import json
+from array import array
+from math import sin
+
+from pytest import fixture, mark, raises
+
+from curvereduce import (
+    perpendicular_distance,
+    simplify_curve_indices,
+    simplify_curve_to_indices,
+)
+from curvereduce.cli import main
+
+
+@fixture
+def curves():
+    """Fixture for three noisy curves."""
+    return [
+        [(i / 10, sin(i / (20 + c)) + ((i * 7919) % 13) / 100) for i in range(400)]
+        for c in range(3)
+    ]
+
+
+@fixture
+def csv_file(tmp_path, curves):
+    """Fixture for the curves as a CSV file with an id and an extra column."""
+    path = tmp_path / "curves.csv"
+    lines = ["id,t,x,y"]
+    for c, curve in enumerate(curves):
+        lines.extend(f"c{c},{i},{x!r},{y!r}" for i, (x, y) in enumerate(curve))
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def expected_rows(curves, epsilon):
+    """Lists the rows of the CSV file that should be kept."""
+    return [
+        f"c{c},{i},{curve[i][0]!r},{curve[i][1]!r}"
+        for c, curve in enumerate(curves)
+        for i in simplify_curve_indices(curve, epsilon)
+    ]
+
+
+def test_no_target(csv_file):
+    """Test the tool without epsilon or point count."""
+    with raises(SystemExit) as exit_info:
+        main([str(csv_file)])
+    assert exit_info.value.code == 2
+
+
+def test_missing_file(tmp_path, capsys):
+    """Test the tool with a missing input file."""
+    with raises(SystemExit) as exit_info:
+        main([str(tmp_path / "missing.csv"), "-e", "1"])
+    assert exit_info.value.code == 1
+    assert "No such file" in capsys.readouterr().err
+
+
+def test_missing_column(csv_file, capsys):
+    """Test the tool with a CSV file without the coordinate columns."""
+    with raises(SystemExit):
+        main([str(csv_file), "-e", "1", "--columns", "x,z"])
+    assert "No such column: z." in capsys.readouterr().err
+
+
+@mark.parametrize("workers", ["1", "2"])
+def test_short_row(tmp_path, capsys, workers):
+    """Test the tool with a CSV row missing some of the columns it needs."""
+    path = tmp_path / "short.csv"
+    path.write_text("id,x,y\n1,0,0\n1,1\n1,2,0\n")
+    with raises(SystemExit) as exit_info:
+        main([str(path), "-e", "0.1", "--id-column", "id", "-w", workers])
+    assert exit_info.value.code == 1
+    assert "Line 3 is missing columns." in capsys.readouterr().err
+
+
+@mark.parametrize("points", ["[[0, 0], [1, 1], 5]", '[[0, 0], [1, "a"], [2, 0]]'])
+@mark.parametrize("workers", ["1", "2"])
+def test_ndjson_invalid_point(tmp_path, capsys, points, workers):
+    """Test the tool with an NDJSON line holding a point that isn't a list of
+    numbers."""
+    path = tmp_path / "curves.ndjson"
+    path.write_text('{"points": [[0, 0], [1, 1]]}\n{"points": ' + points + "}\n")
+    with raises(SystemExit) as exit_info:
+        main([str(path), "-e", "0.1", "-w", workers])
+    assert exit_info.value.code == 1
+    assert "Line 2 has an invalid point." in capsys.readouterr().err
+
+
+@mark.parametrize("workers", ["1", "2"])
+def test_csv(csv_file, curves, capsys, workers):
+    """Test the tool with a CSV file of several curves."""
+    assert main([str(csv_file), "-e", "0.05", "--id-column", "id", "-w", workers]) == 0
+    assert capsys.readouterr().out.splitlines() == ["id,t,x,y"] + expected_rows(
+        curves, 0.05
+    )
+
+
+def test_csv_single_curve(tmp_path, curves):
+    """Test the tool with a CSV file of a single curve, written to a file."""
+    path = tmp_path / "curve.csv"
+    path.write_text("x,y\n" + "".join(f"{x!r},{y!r}\n" for x, y in curves[0]))
+    output = tmp_path / "simplified.csv"
+
+    main([str(path), "-n", "20", "-d", "perpendicular", "-o", str(output), "-w", "1"])
+
+    kept = simplify_curve_to_indices(curves[0], 20, perpendicular_distance)
+    assert output.read_text().splitlines() == ["x,y"] + [
+        f"{curves[0][i][0]!r},{curves[0][i][1]!r}" for i in kept
+    ]
+
+
+def test_csv_empty(tmp_path, capsys):
+    """Test the tool with an empty CSV file."""
+    path = tmp_path / "empty.csv"
+    path.write_text("")
+    assert main([str(path), "-e", "1"]) == 0
+    assert capsys.readouterr().out == ""
+
+
+def test_ndjson(tmp_path, curves, capsys):
+    """Test the tool with an NDJSON file, keeping the other fields."""
+    path = tmp_path / "curves.ndjson"
+    path.write_text(
+        "".join(
+            json.dumps({"id": c, "points": curve}) + "\n"
+            for c, curve in enumerate(curves)
+        )
+    )
+
+    main([str(path), "-e", "0.05", "-w", "2"])
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert records == [
+        {
+            "id": c,
+            "points": [list(curve[i]) for i in simplify_curve_indices(curve, 0.05)],
+        }
+        for c, curve in enumerate(curves)
+    ]
+
+
+@mark.parametrize("workers", ["1", "2"])
+def test_ndjson_short(tmp_path, capsys, workers):
+    """Test the tool passes curves of fewer than three points through
+    unchanged."""
+    path = tmp_path / "short.ndjson"
+    lines = ['{"points": []}', '{"points": [[1, 2]]}', '{"points": [[0, 0], [1, 1]]}']
+    path.write_text("\n".join(lines) + "\n")
+
+    assert main([str(path), "-n", "2", "-w", workers]) == 0
+    assert capsys.readouterr().out.splitlines() == lines
+
+
+def test_ndjson_missing_field(tmp_path, capsys):
+    """Test the tool with an NDJSON line without points."""
+    path = tmp_path / "curves.jsonl"
+    path.write_text('{"id": 1}\n')
+    with raises(SystemExit):
+        main([str(path), "-e", "1", "-w", "1"])
+    assert "Every line must be an object with points." in capsys.readouterr().err
+
+
+@mark.parametrize("target", [["-e", "0.05"], ["-n", "25"]])
+def test_binary(tmp_path, curves, target):
+    """Test the tool with a raw binary file."""
+    path = tmp_path / "curve.bin"
+    path.write_bytes(array("d", [c for p in curves[0] for c in p]).tobytes())
+    output = tmp_path / "simplified.bin"
+
+    main([str(path), *target, "-o", str(output)])
+
+    if target[0] == "-e":
+        kept = simplify_curve_indices(curves[0], 0.05)
+    else:
+        kept = simplify_curve_to_indices(curves[0], 25)
+    assert array("d", output.read_bytes()).tolist() == [
+        c for i in kept for c in curves[0][i]
+    ]
+
+
+def test_binary_stdin(capsys):
+    """Test the tool with binary input from standard input."""
+    with raises(SystemExit):
+        main(["-", "-e", "1", "-f", "binary"])
+    assert "Binary input must be a file." in capsys.readouterr().err
@@ -0,0 +1,140 @@
+"""Test cases for the geodesic_distance() function and its vectorized kernel."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+from math import cos, radians, sin
+
+from pytest import approx, fixture, importorskip, mark
+
+from curvereduce import (
+    EARTH_RADIUS,
+    geodesic_distance,
+    geodesic_segment,
+    max_distance,
+    simplify_curve,
+    simplify_curve_indices,
+    simplify_curve_to,
+)
+
+DEGREE = EARTH_RADIUS * radians(1)
+
+ARCS = [((0, 0), (10, 0)), ((-20, 40), (30, 60)), ((179, -5), (-179, 5)), ((1, 1),) * 2]
+POINTS = [(5, 1), (-1, 0), (12, 0), (0, 89), (-170, -30), (1.5, 1.25)]
+
+
+@fixture
+def track():
+    """Fixture for a noisy GPS track of about 30 km, as (longitude, latitude)
+    points."""
+    return [
+        (
+            13.4 + t / 2000 + cos(t / 300) / 100 + ((t * 7919) % 13) / 1e6,
+            52.5 + sin(t / 500) / 50 + ((t * 104729) % 11) / 1e6,
+        )
+        for t in range(2000)
+    ]
+
+
+def test_cross_track():
+    """Test geodesic_distance() with a point abreast of an arc of the
+    equator."""
+    assert geodesic_distance((5, 1), (0, 0), (10, 0)) == approx(DEGREE)
+
+
+def test_close_a():
+    """Test geodesic_distance() with P closest to A."""
+    assert geodesic_distance((-1, 0), (0, 0), (10, 0)) == approx(DEGREE)
+
+
+def test_close_b():
+    """Test geodesic_distance() with P closest to B."""
+    assert geodesic_distance((12, 0), (0, 0), (10, 0)) == approx(2 * DEGREE)
+
+
+def test_zero_length():
+    """Test geodesic_distance() with a zero-length arc."""
+    assert geodesic_distance((0, 1), (0, 0), (0, 0)) == approx(DEGREE)
+
+
+def test_meridian():
+    """Test geodesic_distance() with an arc along a meridian, which doesn't
+    shrink towards the poles."""
+    assert geodesic_distance((1, 60), (0, 50), (0, 70)) == approx(
+        EARTH_RADIUS * radians(1) * cos(radians(60)), rel=1e-4
+    )
+
+
+def test_antimeridian():
+    """Test geodesic_distance() with an arc crossing the antimeridian."""
+    assert geodesic_distance((180, 1), (179, 0), (-179, 0)) == approx(DEGREE)
+
+
+def test_small_distances():
+    """Test geodesic_distance() keeps its precision over a few centimeters."""
+    offset = 0.05 / (DEGREE * cos(radians(47)))
+    assert geodesic_distance((8.5 + offset, 47), (8.5, 46.9), (8.5, 47.1)) == approx(
+        0.05, rel=1e-6
+    )
+
+
+def test_altitude_ignored():
+    """Test geodesic_distance() ignores altitudes."""
+    assert geodesic_distance((5, 1, 100), (0, 0, 0), (10, 0, 50)) == approx(DEGREE)
+
+
+@mark.parametrize("a, b", ARCS)
+@mark.parametrize("p", POINTS)
+def test_segment(a, b, p):
+    """Test geodesic_segment() gives the squared distance, divided by the
+    squared radius of the Earth."""
+    measure = geodesic_segment(a, b)
+    assert measure(p) * EARTH_RADIUS**2 == approx(geodesic_distance(p, a, b) ** 2)
+
+
+@mark.parametrize("a, b", ARCS)
+def test_kernel(a, b):
+    """Test the vectorized kernel against geodesic_distance()."""
+    np = importorskip("numpy")
+    from curvereduce import _numpy  # pylint: disable=import-outside-toplevel
+
+    points = np.array(POINTS, dtype=float)
+    distances = _numpy.geodesic_distances(
+        points[:, 0], points[:, 1], a[0], a[1], b[0], b[1]
+    )
+    assert distances.tolist() == approx([geodesic_distance(p, a, b) for p in POINTS])
+
+
+def test_simplify_curve(backend, track):
+    """Test simplify_curve() keeps every point within epsilon meters of the
+    simplified track."""
+    # pylint: disable=unused-argument
+    kept = simplify_curve_indices(track, 10, geodesic_distance)
+    assert 2 < len(kept) < len(track) / 4
+    for start, end in zip(kept[:-1], kept[1:]):
+        for i in range(start + 1, end):
+            assert geodesic_distance(track[i], track[start], track[end]) <= 10
+
+
+def test_backends_agree(track, disable_numpy):
+    """Test simplify_curve(), simplify_curve_to() and max_distance() give the
+    same results with and without NumPy."""
+    importorskip("numpy")
+    vectorized = (
+        simplify_curve(track, 5, geodesic_distance),
+        simplify_curve_to(track, 40, geodesic_distance),
+        max_distance(track, geodesic_distance),
+    )
+    disable_numpy()
+    assert vectorized[:2] == (
+        simplify_curve(track, 5, geodesic_distance),
+        simplify_curve_to(track, 40, geodesic_distance),
+    )
+    assert vectorized[2][0] == approx(max_distance(track, geodesic_distance)[0])
+    assert vectorized[2][1] == max_distance(track, geodesic_distance)[1]
+
+
+def test_3d_track(track):
+    """Test that altitudes are carried along but not measured."""
+    track_3d = [(x, y, float(i % 50)) for i, (x, y) in enumerate(track)]
+    assert list(simplify_curve_indices(track_3d, 5, geodesic_distance)) == list(
+        simplify_curve_indices(track, 5, geodesic_distance)
+    )
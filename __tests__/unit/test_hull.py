@@ -0,0 +1,128 @@
+"""Test cases for the HullTree class and simplify_curve() with the hull
+algorithm."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+from random import Random
+
+from pytest import fixture, mark, raises
+
+from curvereduce import (
+    max_distance,
+    perpendicular_distance,
+    shortest_distance,
+    simplify_curve,
+)
+from curvereduce.hull import HullTree
+
+
+@fixture
+def random_points():
+    """Fixture for a random walk."""
+    rng = Random(7)
+    points = [(0.0, 0.0)]
+    for _ in range(999):
+        x, y = points[-1]
+        points.append((x + rng.uniform(-1, 1), y + rng.uniform(-1, 1)))
+    return points
+
+
+@fixture
+def wavy_point_count():
+    """Fixture for the number of points of the noisy curve."""
+    return 2000
+
+
+@fixture
+def zigzag_points():
+    """Fixture for a growing zigzag, where every split only peels off a single
+    point."""
+    return [(i, (-1) ** i * i * i) for i in range(1000)]
+
+
+@mark.parametrize("leaf_size", [1, 2, 3, 32])
+def test_farthest(random_points, leaf_size):
+    """Test HullTree.farthest() finds the same point as max_distance()."""
+    points = random_points[:200]
+    tree = HullTree(points, leaf_size)
+    rng = Random(11)
+    for _ in range(500):
+        start = rng.randrange(len(points) - 2)
+        end = rng.randrange(start + 2, len(points))
+        d, i = max_distance(points[start : end + 1], perpendicular_distance)
+        assert tree.farthest(start, end) == (d, start + i)
+
+
+def test_farthest_axis_aligned():
+    """Test HullTree.farthest() with vertical and horizontal lines."""
+    points = [(0, 0), (1, 5), (-3, 2), (2, -1), (0, 4), (4, 4), (4, 0)]
+    tree = HullTree(points, 2)
+    assert tree.farthest(0, 4) == max_distance(points[:5], perpendicular_distance)
+    assert tree.farthest(4, 5) == (0.0, 4)
+    assert tree.farthest(0, 6) == max_distance(points, perpendicular_distance)
+
+
+@mark.parametrize("epsilon", [0.1, 1, 10])
+def test_same_as_scan(random_points, wavy_points, epsilon):
+    """Test the hull algorithm gives the same result as the scan algorithm."""
+    for points in (random_points, wavy_points):
+        expected = simplify_curve(points, epsilon, perpendicular_distance)
+        simplified = simplify_curve(
+            points, epsilon, perpendicular_distance, algorithm="hull"
+        )
+        assert simplified == expected
+
+
+def test_peel_off(zigzag_points):
+    """Test the hull algorithm on a curve that is the worst case for the scan
+    algorithm."""
+    expected = simplify_curve(zigzag_points, 0.5, perpendicular_distance)
+    simplified = simplify_curve(
+        zigzag_points, 0.5, perpendicular_distance, algorithm="hull"
+    )
+    assert simplified == expected
+
+
+def test_ties():
+    """Test the hull algorithm on a curve with many points at exactly the same
+    distance, where it may split at a different point than the scan algorithm
+    but still keeps every dropped point within epsilon."""
+    rng = Random(3)
+    points = [(i, rng.randrange(4)) for i in range(300)]
+    tree = HullTree(points)
+
+    for _ in range(200):
+        start = rng.randrange(len(points) - 2)
+        end = rng.randrange(start + 2, len(points))
+        d, i = tree.farthest(start, end)
+        assert d == max_distance(points[start : end + 1], perpendicular_distance)[0]
+        assert perpendicular_distance(points[i], points[start], points[end]) == d
+
+    simplified = simplify_curve(points, 1, perpendicular_distance, algorithm="hull")
+    kept = [points.index(p) for p in simplified]
+    assert kept[0] == 0 and kept[-1] == len(points) - 1
+    for start, end in zip(kept, kept[1:]):
+        for p in points[start + 1 : end]:
+            assert perpendicular_distance(p, points[start], points[end]) <= 1
+
+
+def test_unknown_algorithm():
+    """Test simplify_curve() with an unknown algorithm."""
+    with raises(ValueError, match="Unknown algorithm: magic."):
+        simplify_curve([], 1, algorithm="magic")
+
+
+def test_hull_distance_function():
+    """Test the hull algorithm with a distance function it can't use."""
+    with raises(ValueError, match="requires perpendicular_distance"):
+        simplify_curve([], 1, shortest_distance, algorithm="hull")
+
+
+def test_hull_3d():
+    """Test the hull algorithm with points it can't use."""
+    with raises(ValueError, match="requires 2-dimensional points"):
+        simplify_curve(
+            [(0, 0, 0), (1, 1, 1), (2, 0, 2)],
+            0.1,
+            perpendicular_distance,
+            algorithm="hull",
+        )
@@ -0,0 +1,154 @@
+"""Test cases for the IncrementalSimplifier class."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+from math import cos, sin
+
+from pytest import fixture, mark, raises
+
+from curvereduce import (
+    IncrementalSimplifier,
+    incremental,
+    perpendicular_distance,
+    record_stats,
+    shortest_distance,
+    simplify_curve,
+    simplify_curve_indices,
+)
+
+
+@fixture
+def wavy_point_count():
+    """Fixture for the number of points of the noisy curve."""
+    return 1500
+
+
+@fixture
+def numpy_modules():
+    """Fixture for the modules calling the NumPy backend directly."""
+    return [incremental]
+
+
+@fixture
+def backend(backend, monkeypatch):
+    """Fixture that runs a test with and without the vectorized kernels, which
+    also measure small ranges."""
+    if backend:
+        monkeypatch.setattr(incremental, "VECTORIZE_MIN_POINTS", 8)
+    return backend
+
+
+def test_epsilon_subzero():
+    """Test IncrementalSimplifier with epsilon < 0."""
+    with raises(ValueError, match="Epsilon must not be a negative number."):
+        IncrementalSimplifier(-1)
+
+
+def test_empty():
+    """Test IncrementalSimplifier with no points."""
+    simplifier = IncrementalSimplifier(1)
+    assert len(simplifier) == 0
+    assert list(simplifier.indices()) == []
+    assert simplifier.simplified() == []
+
+
+def test_zero_epsilon(wavy_points):
+    """Test IncrementalSimplifier with epsilon = 0."""
+    simplifier = IncrementalSimplifier(0, wavy_points)
+    assert simplifier.simplified() == wavy_points
+
+
+@mark.parametrize("distance_function", [shortest_distance, perpendicular_distance])
+def test_append(backend, wavy_points, distance_function):
+    """Test IncrementalSimplifier against simplify_curve() after every append."""
+    # pylint: disable=unused-argument
+    simplifier = IncrementalSimplifier(0.05, distance_function=distance_function)
+
+    for count, point in enumerate(wavy_points[:300], 1):
+        simplifier.append(point)
+        assert simplifier.simplified() == simplify_curve(
+            wavy_points[:count], 0.05, distance_function
+        )
+
+
+def test_extend(backend, wavy_points):
+    """Test IncrementalSimplifier against simplify_curve_indices() after
+    extending the curve a few points at a time."""
+    # pylint: disable=unused-argument
+    simplifier = IncrementalSimplifier(0.05, wavy_points[:1000])
+
+    for count in range(1000, len(wavy_points), 37):
+        simplifier.extend(wavy_points[count : count + 37])
+        assert list(simplifier.indices()) == list(
+            simplify_curve_indices(wavy_points[: count + 37], 0.05)
+        )
+
+
+def test_replace(backend, wavy_points):
+    """Test IncrementalSimplifier against simplify_curve_indices() after
+    replacing points."""
+    # pylint: disable=unused-argument
+    wavy_points = wavy_points[:]
+    simplifier = IncrementalSimplifier(0.05, wavy_points)
+    simplifier.indices()
+
+    for step, index in enumerate([700, 0, -1, 3, 1200, 701, 701]):
+        point = (wavy_points[index][0], wavy_points[index][1] + (step % 3 - 1) / 2)
+        wavy_points[index] = simplifier[index] = point
+        assert list(simplifier.indices()) == list(
+            simplify_curve_indices(wavy_points, 0.05)
+        )
+
+
+def test_replace_and_append(backend, wavy_points):
+    """Test IncrementalSimplifier after replacing points and appending more
+    before simplifying again."""
+    # pylint: disable=unused-argument
+    curve = wavy_points[:1000]
+    simplifier = IncrementalSimplifier(0.05, curve)
+    simplifier.indices()
+
+    curve[999] = simplifier[999] = (99.9, 3.0)
+    curve[10] = simplifier[10] = (1.0, -3.0)
+    curve.extend(wavy_points[1000:])
+    simplifier.extend(wavy_points[1000:])
+
+    assert simplifier.simplified() == simplify_curve(curve, 0.05)
+
+
+def test_custom_distance_function(wavy_points):
+    """Test IncrementalSimplifier with a custom distance function."""
+
+    def distance(p, a, b):
+        return shortest_distance(p, a, b) / 2
+
+    simplifier = IncrementalSimplifier(0.02, wavy_points[:1000], distance)
+    simplifier.extend(wavy_points[1000:])
+    assert simplifier.simplified() == simplify_curve(wavy_points, 0.02, distance)
+
+
+def test_3d(backend):
+    """Test IncrementalSimplifier with 3D points."""
+    # pylint: disable=unused-argument
+    track = [(x / 10, sin(x / 40), cos(x / 30) * (x % 5)) for x in range(1000)]
+    simplifier = IncrementalSimplifier(0.1, track[:600])
+    simplifier.indices()
+    simplifier.extend(track[600:])
+    assert simplifier.simplified() == simplify_curve(track, 0.1)
+
+
+def test_only_changed_ranges_measured(wavy_points):
+    """Test that appending a point only measures the ranges ending at the last
+    point."""
+    simplifier = IncrementalSimplifier(0.05, wavy_points[:-1])
+    simplifier.indices()
+
+    with record_stats() as unchanged:
+        simplifier.indices()
+    assert unchanged.ranges == 0
+
+    simplifier.append(wavy_points[-1])
+    with record_stats() as appended:
+        simplifier.indices()
+    with record_stats() as scratch:
+        simplify_curve(wavy_points, 0.05)
+    assert 0 < appended.ranges < scratch.ranges
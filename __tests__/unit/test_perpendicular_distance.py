@@ -42,3 +42,27 @@ def test_sloped():
     p, a, b = (0, 0), (5, 0), (0, 4.0 / cos(pi / 2.0 - atan(0.75)))
     distance = perpendicular_distance(p, a, b)
     assert distance == approx(4)
+
+
+def test_3d():
+    """Test perpendicular_distance() in three dimensions, beyond the ends of
+    the line."""
+    p, a, b = (5, 1, 1), (-1, 0, 0), (1, 0, 0)
+    distance = perpendicular_distance(p, a, b)
+    assert distance == approx(sqrt(2))
+
+
+def test_3d_zero_length():
+    """Test perpendicular_distance() in three dimensions, with a zero-length
+    line."""
+    p, a, b = (3, 4, 0), (0, 0, 0), (0, 0, 0)
+    distance = perpendicular_distance(p, a, b)
+    assert distance == 5
+
+
+def test_flat_3d():
+    """Test perpendicular_distance() of points in a plane matches two
+    dimensions."""
+    p, a, b = (0.3, 2.5), (-1.5, 0.25), (1.75, 1.0)
+    distance = perpendicular_distance((*p, 0), (*a, 0), (*b, 0))
+    assert distance == approx(perpendicular_distance(p, a, b))
@@ -0,0 +1,86 @@
+"""Test cases for the PointArray class."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+from array import array
+
+from pytest import mark, raises
+
+from curvereduce import (
+    PointArray,
+    max_distance,
+    simplify_curve,
+    simplify_curve_to,
+    simplify_many,
+)
+
+
+def test_construction():
+    """Test the ways to create a PointArray."""
+    points = [(0.0, 1.0), (2.0, 3.0)]
+    assert PointArray(points).tolist() == points
+    assert PointArray.from_xy([0, 2], [1, 3]).tolist() == points
+    assert PointArray.from_coordinates([0, 1, 2, 3]).tolist() == points
+    assert PointArray().tolist() == []
+
+
+def test_from_coordinates_no_copy():
+    """Test PointArray.from_coordinates() uses an array('d') as is."""
+    coordinates = array("d", [0, 1, 2, 3])
+    assert PointArray.from_coordinates(coordinates).coordinates is coordinates
+
+
+def test_from_coordinates_odd():
+    """Test PointArray.from_coordinates() with an odd number of coordinates."""
+    with raises(ValueError, match="Coordinates must come in"):
+        PointArray.from_coordinates([0, 1, 2])
+
+
+def test_compact():
+    """Test a PointArray holds 16 bytes per point."""
+    points = PointArray((x, x) for x in range(1000))
+    assert len(points) == 1000
+    assert points.coordinates.itemsize * len(points.coordinates) == 16 * 1000
+
+
+def test_sequence():
+    """Test PointArray behaves like a sequence of (x, y) tuples."""
+    points = PointArray([(0, 0), (1, 1), (2, 4), (3, 9)])
+    assert points[1] == (1.0, 1.0)
+    assert points[-1] == (3.0, 9.0)
+    assert points[1:3] == PointArray([(1, 1), (2, 4)])
+    assert points[::-2] == PointArray([(3, 9), (1, 1)])
+    assert points[:] == points and points[:] is not points
+    assert points.take([3, 0]) == PointArray([(3, 9), (0, 0)])
+    assert list(points) == points.tolist()
+    assert (2, 4) in points
+    with raises(IndexError):
+        points[4]  # pylint: disable=pointless-statement
+    with raises(IndexError):
+        points.take([-5])
+
+
+def test_max_distance(wavy_points, backend):
+    """Test max_distance() gives the same result for a PointArray."""
+    assert max_distance(PointArray(wavy_points)) == max_distance(wavy_points)
+
+
+@mark.parametrize("epsilon", [0, 0.01, 0.1, 1])
+def test_simplify_curve(wavy_points, backend, epsilon):
+    """Test simplify_curve() gives the same result for a PointArray."""
+    simplified = simplify_curve(PointArray(wavy_points), epsilon)
+    assert isinstance(simplified, PointArray)
+    assert simplified.tolist() == simplify_curve(wavy_points, epsilon)
+
+
+@mark.parametrize("point_count", [2, 20, 1000])
+def test_simplify_curve_to(wavy_points, backend, point_count):
+    """Test simplify_curve_to() gives the same result for a PointArray."""
+    simplified = simplify_curve_to(PointArray(wavy_points), point_count)
+    assert isinstance(simplified, PointArray)
+    assert simplified.tolist() == simplify_curve_to(wavy_points, point_count)
+
+
+def test_simplify_many(wavy_points):
+    """Test simplify_many() gives the same result for PointArrays."""
+    simplified = simplify_many([PointArray(wavy_points)], 0.1, workers=1)
+    assert simplified == [PointArray(simplify_curve(wavy_points, 0.1))]
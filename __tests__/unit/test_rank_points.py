@@ -0,0 +1,52 @@
+"""Test cases for the rank_points() function."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+from math import inf, sqrt
+
+from pytest import approx
+
+from curvereduce import perpendicular_distance, rank_points
+
+
+def test_no_points():
+    """Test rank_points() with no points."""
+    assert rank_points([]) == []
+
+
+def test_two_points():
+    """Test rank_points() with two points."""
+    ranking = rank_points([(0, 0), (1, 1)])
+    assert ranking == [(inf, 0), (inf, 1)]
+
+
+def test_four_points():
+    """Test rank_points() with four points."""
+    points = [(-2, 4), (0, 2), (0, 0), (2, 0)]
+    ranking = rank_points(points, perpendicular_distance)
+    expected = [(inf, 0), (inf, 3), (approx(sqrt(2)), 2), (approx(2 / sqrt(5)), 1)]
+    assert ranking == expected
+
+
+def test_significance_capped_by_parent():
+    """Test rank_points() caps the significance of a point by the split above
+    it, so a point is never ranked above the point that exposed it."""
+    points = [(0, 0), (1, 10), (2, 1), (3, 100), (4, 0)]
+    ranking = rank_points(points, perpendicular_distance)
+    assert [i for _, i in ranking] == [0, 4, 3, 2, 1]
+    assert ranking[4][0] == ranking[3][0]
+
+
+def test_collinear_points():
+    """Test rank_points() ranks collinear points with zero significance, in
+    the order the hierarchy splits them."""
+    points = [(x, 0) for x in range(5)]
+    ranking = rank_points(points, perpendicular_distance)
+    assert ranking == [(inf, 0), (inf, 4), (0, 1), (0, 2), (0, 3)]
+
+
+def test_custom_function():
+    """Test rank_points() with a custom function."""
+    points = [(0, 0), (1, 1), (2, 2), (3, 3)]
+    ranking = rank_points(points, lambda p, a, b: p[0])
+    assert [i for _, i in ranking] == [0, 3, 2, 1]
+    assert ranking[2:] == [(2, 2), (1, 1)]
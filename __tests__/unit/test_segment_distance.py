@@ -0,0 +1,75 @@
+"""Test cases for the segment distance functions and how max_distance() and
+simplify_curve() use them."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+
+from pytest import approx, fixture, mark
+
+from curvereduce import (
+    SEGMENT_DISTANCE_FUNCS,
+    geodesic_segment,
+    perpendicular_distance_squared,
+    perpendicular_segment,
+    shortest_distance,
+    shortest_distance_squared,
+    shortest_segment,
+    simplify_curve,
+)
+
+LINES = [((0, 0), (0, 4)), ((0, 0), (4, 0)), ((-1, 2), (3, -5)), ((1, 1), (1, 1))]
+POINTS = [(0, 0), (1, 1), (-3, 2), (5, -7), (0.25, 3.5)]
+
+
+@fixture
+def wavy_point_count():
+    """Fixture for the number of points of the noisy curve."""
+    return 200
+
+
+@mark.parametrize("a, b", LINES)
+@mark.parametrize("p", POINTS)
+def test_shortest_segment(a, b, p):
+    """Test shortest_segment() gives exactly shortest_distance_squared()."""
+    assert shortest_segment(a, b)(p) == shortest_distance_squared(p, a, b)
+
+
+@mark.parametrize("a, b", LINES[:3])
+@mark.parametrize("p", POINTS)
+def test_perpendicular_segment(a, b, p):
+    """Test perpendicular_segment() gives perpendicular_distance_squared() up
+    to a constant factor for each line."""
+    measure = perpendicular_segment(a, b)
+    scale = 1
+    if a[0] != b[0] and a[1] != b[1]:
+        slope = (b[1] - a[1]) / (b[0] - a[0])
+        scale = slope * slope + 1
+    assert measure(p) / scale == approx(perpendicular_distance_squared(p, a, b))
+
+
+def test_registered():
+    """Test the built-in distance functions have segment versions."""
+    assert set(SEGMENT_DISTANCE_FUNCS.values()) == {
+        geodesic_segment,
+        perpendicular_segment,
+        shortest_segment,
+    }
+
+
+def test_custom_opt_in(wavy_points, monkeypatch, pure_python):
+    """Test a custom distance function with a segment version gives the same
+    result, while preparing each line only once."""
+    # pylint: disable=unused-argument
+    lines = []
+
+    def custom(p, a, b):
+        return shortest_distance(p, a, b)
+
+    def custom_segment(a, b):
+        lines.append((a, b))
+        return shortest_segment(a, b)
+
+    expected = simplify_curve(wavy_points, 0.05, custom)
+
+    monkeypatch.setitem(SEGMENT_DISTANCE_FUNCS, custom, custom_segment)
+    assert simplify_curve(wavy_points, 0.05, custom) == expected
+    assert lines and len(lines) == len(set(lines))
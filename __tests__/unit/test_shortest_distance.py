@@ -56,3 +56,31 @@ def test_close_b():
     p, a, b = (3, 0), (1, 0), (2, 0)
     distance = shortest_distance(p, a, b)
     assert distance == 1
+
+
+def test_3d():
+    """Test shortest_distance() in three dimensions."""
+    p, a, b = (0, 1, 1), (-1, 0, 0), (1, 0, 0)
+    distance = shortest_distance(p, a, b)
+    assert distance == approx(sqrt(2))
+
+
+def test_3d_close_b():
+    """Test shortest_distance() in three dimensions, beyond point B."""
+    p, a, b = (4, 0, 4), (-1, 0, 0), (1, 0, 0)
+    distance = shortest_distance(p, a, b)
+    assert distance == 5
+
+
+def test_4d_zero_length():
+    """Test shortest_distance() in four dimensions, with a zero-length line."""
+    p, a, b = (1, 1, 1, 1), (0, 0, 0, 0), (0, 0, 0, 0)
+    distance = shortest_distance(p, a, b)
+    assert distance == 2
+
+
+def test_flat_3d():
+    """Test shortest_distance() of points in a plane matches two dimensions."""
+    p, a, b = (0.3, 2.5), (-1.5, 0.25), (1.75, 1.0)
+    distance = shortest_distance((*p, 0), (*a, 0), (*b, 0))
+    assert distance == approx(shortest_distance(p, a, b))
@@ -0,0 +1,230 @@
+"""Test cases for the SimplificationCache class."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+from array import array
+
+from pytest import importorskip, mark, raises
+
+from curvereduce import (
+    PointArray,
+    SimplificationCache,
+    perpendicular_distance,
+    simplify_curve,
+    simplify_curve_indices,
+    simplify_curve_to,
+    simplify_curve_to_indices,
+)
+from curvereduce import cache as cache_module
+
+
+def test_epsilon_subzero(wavy_points):
+    """Test SimplificationCache with epsilon < 0."""
+    with raises(ValueError, match="Epsilon must not be a negative number."):
+        SimplificationCache().simplify_curve(wavy_points, -1)
+
+
+def test_hit(wavy_points):
+    """Test that the same curve and parameters hit the cache, whatever object
+    holds the curve, and results come back in the same form as the curve."""
+    cache = SimplificationCache()
+
+    assert cache.simplify_curve(wavy_points, 0.05) == simplify_curve(wavy_points, 0.05)
+    assert cache.simplify_curve(wavy_points[:], 0.05) == simplify_curve(
+        wavy_points, 0.05
+    )
+    simplified = cache.simplify_curve(PointArray(wavy_points), 0.05)
+    assert isinstance(simplified, PointArray)
+    assert simplified == simplify_curve(PointArray(wavy_points), 0.05)
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_keys(wavy_points):
+    """Test that other parameters, distance functions and curves miss the
+    cache."""
+    cache = SimplificationCache()
+    changed = wavy_points[:]
+    changed[500] = (50.0, 10.0)
+
+    cache.simplify_curve(wavy_points, 0.05)
+    cache.simplify_curve(wavy_points, 0.1)
+    cache.simplify_curve(wavy_points, 0.05, perpendicular_distance)
+    cache.simplify_curve(changed, 0.05)
+    cache.simplify_curve_to(wavy_points, 20)
+    cache.simplify_curve_to(wavy_points, 20, exact=True)
+
+    assert (cache.hits, cache.misses) == (0, 6)
+    assert len(cache) == 6
+
+
+def test_to(wavy_points):
+    """Test SimplificationCache.simplify_curve_to() and the indices methods."""
+    cache = SimplificationCache()
+
+    for _ in range(2):
+        assert cache.simplify_curve_to(wavy_points, 30) == simplify_curve_to(
+            wavy_points, 30
+        )
+        assert list(
+            cache.simplify_curve_to_indices(wavy_points, 30, exact=True)
+        ) == list(simplify_curve_to_indices(wavy_points, 30, exact=True))
+        assert list(cache.simplify_curve_indices(wavy_points, 0.05)) == list(
+            simplify_curve_indices(wavy_points, 0.05)
+        )
+
+    assert (cache.hits, cache.misses) == (3, 3)
+
+
+@mark.parametrize("points", [[(1.0, 2.0)], [(1.0, 2.0), (3.0, 4.0)]])
+@mark.parametrize("point_count", [1, 2, 5])
+def test_to_short(points, point_count):
+    """Test SimplificationCache.simplify_curve_to() with curves too short to
+    simplify."""
+    assert SimplificationCache().simplify_curve_to(
+        points, point_count
+    ) == simplify_curve_to(points, point_count)
+
+
+def test_copies(wavy_points):
+    """Test that changing a result doesn't change the cached result."""
+    cache = SimplificationCache()
+    kept = cache.simplify_curve_indices(wavy_points, 0.05)
+    kept[0] = 42
+    assert cache.simplify_curve_indices(wavy_points, 0.05)[0] == 0
+
+
+def test_numpy(wavy_points):
+    """Test SimplificationCache with a NumPy array."""
+    np = importorskip("numpy")
+    cache = SimplificationCache()
+    cache.simplify_curve(wavy_points, 0.05)
+
+    simplified = cache.simplify_curve(np.array(wavy_points), 0.05)
+    assert isinstance(simplified, np.ndarray)
+    assert simplified.tolist() == [list(p) for p in simplify_curve(wavy_points, 0.05)]
+    assert isinstance(
+        cache.simplify_curve_indices(np.array(wavy_points), 0.05), np.ndarray
+    )
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_eviction(wavy_points):
+    """Test that the least recently used results are evicted once they take
+    more than max_bytes."""
+    a, b, c = ([(x + k, y) for x, y in wavy_points] for k in range(3))
+    size = 8 * len(simplify_curve_indices(a, 0.05))
+    cache = SimplificationCache(max_bytes=2 * size)
+
+    cache.simplify_curve(a, 0.05)
+    cache.simplify_curve(b, 0.05)
+    cache.simplify_curve(a, 0.05)
+    cache.simplify_curve(c, 0.05)
+
+    assert cache.evictions == 1
+    assert cache.current_bytes == 2 * size
+
+    cache.simplify_curve(a, 0.05)
+    cache.simplify_curve(b, 0.05)
+    assert cache.as_dict() == {
+        "hits": 2,
+        "disk_hits": 0,
+        "misses": 4,
+        "evictions": 2,
+        "entries": 2,
+        "current_bytes": 2 * size,
+    }
+
+
+def test_too_big(wavy_points):
+    """Test that results larger than max_bytes aren't held."""
+    cache = SimplificationCache(max_bytes=8)
+    cache.simplify_curve(wavy_points, 0.05)
+    assert len(cache) == 0
+    assert cache.current_bytes == 0
+
+
+def test_disk(wavy_points, tmp_path):
+    """Test that results survive in the on-disk tier."""
+    SimplificationCache(directory=str(tmp_path)).simplify_curve(wavy_points, 0.05)
+
+    cache = SimplificationCache(directory=str(tmp_path))
+    assert cache.simplify_curve(wavy_points, 0.05) == simplify_curve(wavy_points, 0.05)
+    assert cache.simplify_curve(wavy_points, 0.05) == simplify_curve(wavy_points, 0.05)
+    assert (cache.hits, cache.disk_hits, cache.misses) == (1, 1, 0)
+
+
+def test_disk_unnamed_function(wavy_points, tmp_path):
+    """Test that results of lambdas aren't written to disk."""
+    cache = SimplificationCache(directory=str(tmp_path))
+    cache.simplify_curve(wavy_points, 0.05, lambda p, a, b: abs(p[1] - a[1]))
+    assert list(tmp_path.iterdir()) == []
+    assert len(cache) == 1
+
+
+def test_disk_main_function(wavy_points, tmp_path):
+    """Test that results of functions defined in a script aren't written to
+    disk."""
+
+    def distance(p, a, b):
+        return abs(p[1] - a[1])
+
+    distance.__qualname__ = "distance"
+    distance.__module__ = "__main__"
+
+    cache = SimplificationCache(directory=str(tmp_path))
+    cache.simplify_curve(wavy_points, 0.05, distance)
+    assert list(tmp_path.iterdir()) == []
+    assert len(cache) == 1
+
+
+@mark.parametrize("name", ["PACKAGE_VERSION", "FORMAT_VERSION"])
+def test_disk_versions(wavy_points, tmp_path, monkeypatch, name):
+    """Test that results written by another version of the package or of the
+    cache format aren't reused."""
+    SimplificationCache(directory=str(tmp_path)).simplify_curve(wavy_points, 0.05)
+    monkeypatch.setattr(cache_module, name, "other")
+
+    cache = SimplificationCache(directory=str(tmp_path))
+    assert cache.simplify_curve(wavy_points, 0.05) == simplify_curve(wavy_points, 0.05)
+    assert (cache.disk_hits, cache.misses) == (0, 1)
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_disk_cut_short(wavy_points, tmp_path):
+    """Test that files cut short are ignored."""
+    SimplificationCache(directory=str(tmp_path)).simplify_curve(wavy_points, 0.05)
+    (path,) = tmp_path.iterdir()
+    path.write_bytes(path.read_bytes()[:-3])
+
+    cache = SimplificationCache(directory=str(tmp_path))
+    assert cache.simplify_curve(wavy_points, 0.05) == simplify_curve(wavy_points, 0.05)
+    assert (cache.disk_hits, cache.misses) == (0, 1)
+    assert array("q", path.read_bytes()).tolist() == list(
+        simplify_curve_indices(wavy_points, 0.05)
+    )
+    # pylint: disable-next=protected-access
+    assert cache._disk_bytes == path.stat().st_size
+
+
+def test_disk_empty(tmp_path):
+    """Test that empty results are read back from the on-disk tier."""
+    SimplificationCache(directory=str(tmp_path)).simplify_curve([], 0.05)
+    (path,) = tmp_path.iterdir()
+    assert path.stat().st_size == 0
+
+    cache = SimplificationCache(directory=str(tmp_path))
+    assert cache.simplify_curve([], 0.05) == []
+    assert (cache.disk_hits, cache.misses) == (1, 0)
+
+
+def test_disk_limit(wavy_points, tmp_path):
+    """Test that the least recently used files are removed once they take more
+    than max_disk_bytes."""
+    a, b, c = ([(x + k, y) for x, y in wavy_points] for k in range(3))
+    size = 8 * len(simplify_curve_indices(a, 0.05))
+    cache = SimplificationCache(directory=str(tmp_path), max_disk_bytes=2 * size)
+
+    for curve in (a, b, c):
+        cache.simplify_curve(curve, 0.05)
+
+    assert len(list(tmp_path.iterdir())) == 2
+    assert sum(p.stat().st_size for p in tmp_path.iterdir()) == 2 * size
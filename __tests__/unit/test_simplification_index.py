@@ -0,0 +1,108 @@
+"""Test cases for the SimplificationIndex class."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+import pickle
+from math import sin
+
+from pytest import fixture, mark, raises
+
+from curvereduce import (
+    SimplificationIndex,
+    perpendicular_distance,
+    simplify_curve,
+)
+
+
+@fixture
+def wavy_point_count():
+    """Fixture for the number of points of the noisy curve."""
+    return 500
+
+
+@fixture
+def index(wavy_points):
+    """Fixture for an index of the noisy curve."""
+    return SimplificationIndex.build(wavy_points)
+
+
+def test_epsilon_subzero(index):
+    """Test at_epsilon() with epsilon < 0."""
+    with raises(ValueError, match="Epsilon must not be a negative number."):
+        index.at_epsilon(-1)
+
+
+@mark.parametrize("epsilon", [0, 0.01, 0.05, 0.1, 0.5, 1, 10])
+def test_at_epsilon(wavy_points, index, epsilon):
+    """Test at_epsilon() gives the same result as simplify_curve()."""
+    expected = simplify_curve(wavy_points, epsilon)
+    assert index.at_epsilon(epsilon) == expected
+    assert index.count_at_epsilon(epsilon) == len(expected)
+
+
+def test_at_epsilon_perpendicular_distance(wavy_points):
+    """Test at_epsilon() with an index built using the perpendicular distance
+    calculation."""
+    index = SimplificationIndex.build(wavy_points, perpendicular_distance)
+    expected = simplify_curve(wavy_points, 0.1, perpendicular_distance)
+    assert index.at_epsilon(0.1) == expected
+
+
+@mark.parametrize("point_count", [0, 2, 3, 20, 499])
+def test_at_count(wavy_points, index, point_count):
+    """Test at_count() returns exactly the desired number of points."""
+    simplified = index.at_count(point_count)
+    assert len(simplified) == max(point_count, 2)
+    assert simplified[0] == wavy_points[0]
+    assert simplified[-1] == wavy_points[-1]
+
+
+def test_at_count_too_large(wavy_points, index):
+    """Test at_count() with more points than the curve has."""
+    assert index.at_count(1000) == wavy_points
+
+
+def test_short_curve():
+    """Test an index of a two-point curve."""
+    points = [(0.0, 0.0), (1.0, 1.0)]
+    index = SimplificationIndex.build(points)
+    assert index.at_epsilon(1) == points
+    assert index.at_count(1) == points
+
+
+def test_round_trip(index):
+    """Test to_bytes() and from_bytes()."""
+    loaded = SimplificationIndex.from_bytes(index.to_bytes())
+    assert loaded.points == index.points
+    assert loaded.significance == index.significance
+    assert loaded.at_epsilon(0.1) == index.at_epsilon(0.1)
+    assert loaded.at_count(20) == index.at_count(20)
+
+
+def test_pickle(index):
+    """Test the index can be pickled."""
+    loaded = pickle.loads(pickle.dumps(index))
+    assert loaded.at_epsilon(0.1) == index.at_epsilon(0.1)
+
+
+def test_from_bytes_invalid(index):
+    """Test from_bytes() with data that isn't a serialized index."""
+    with raises(ValueError, match="Data is not a serialized simplification index."):
+        SimplificationIndex.from_bytes(b"XXXX" + index.to_bytes()[4:])
+    with raises(ValueError, match="Serialized simplification index is truncated."):
+        SimplificationIndex.from_bytes(index.to_bytes()[:-1])
+
+
+@mark.parametrize("data", [b"", b"ab"])
+def test_from_bytes_short(data):
+    """Test from_bytes() with data shorter than the header."""
+    with raises(ValueError, match="Data is not a serialized simplification index."):
+        SimplificationIndex.from_bytes(data)
+
+
+def test_3d():
+    """Test an index of a 3D curve, which can't be serialized."""
+    points = [(x / 10, sin(x / 25), x % 7 / 100) for x in range(100)]
+    index = SimplificationIndex.build(points)
+    assert index.at_epsilon(0.05) == simplify_curve(points, 0.05)
+    with raises(ValueError, match="Only 2-dimensional curves can be serialized."):
+        index.to_bytes()
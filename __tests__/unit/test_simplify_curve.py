@@ -116,3 +116,11 @@ def test_four_points_epsilon_2_perpendicular_distance(four_points):
     expected = [four_points[0], four_points[3]]
     simplified = simplify_curve(four_points, 2, perpendicular_distance)
     assert simplified == expected
+
+
+def test_deep_split_no_recursion_error():
+    """Test simplify_curve() on a curve where every split only peels off a
+    single point, which is deeper than the interpreter's recursion limit."""
+    points = [(float(x), 0.0) for x in range(1500)]
+    simplified = simplify_curve(points, 0.5, lambda p, a, b: p[0] - a[0])
+    assert simplified == points
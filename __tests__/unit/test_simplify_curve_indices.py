@@ -0,0 +1,104 @@
+"""Test cases for the simplify_curve_indices(), simplify_curve_to_indices() and
+simplify_curve_mask() functions."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+from array import array
+
+from pytest import importorskip, mark, raises
+
+from curvereduce import (
+    PointArray,
+    perpendicular_distance,
+    simplify_curve,
+    simplify_curve_indices,
+    simplify_curve_mask,
+    simplify_curve_to,
+    simplify_curve_to_indices,
+)
+
+
+def test_epsilon_subzero():
+    """Test simplify_curve_indices() and simplify_curve_mask() with epsilon < 0."""
+    with raises(ValueError, match="Epsilon must not be a negative number."):
+        simplify_curve_indices([], -1)
+    with raises(ValueError, match="Epsilon must not be a negative number."):
+        simplify_curve_mask([], -1)
+
+
+@mark.parametrize("epsilon", [0, 0.01, 0.1, 1])
+def test_indices(wavy_points, backend, epsilon):
+    """Test simplify_curve_indices() picks the points simplify_curve() keeps."""
+    kept = simplify_curve_indices(wavy_points, epsilon)
+    assert isinstance(kept, array) and kept.typecode == "q"
+    assert [wavy_points[i] for i in kept] == simplify_curve(wavy_points, epsilon)
+
+
+def test_indices_hull(wavy_points):
+    """Test simplify_curve_indices() with the hull algorithm."""
+    kept = simplify_curve_indices(
+        wavy_points, 0.1, perpendicular_distance, algorithm="hull"
+    )
+    expected = simplify_curve(wavy_points, 0.1, perpendicular_distance)
+    assert [wavy_points[i] for i in kept] == expected
+
+
+@mark.parametrize("point_count", [2, 20, 1000])
+def test_to_indices(wavy_points, backend, point_count):
+    """Test simplify_curve_to_indices() picks the points simplify_curve_to()
+    keeps."""
+    kept = simplify_curve_to_indices(wavy_points, point_count)
+    expected = simplify_curve_to(wavy_points, point_count)
+    assert [wavy_points[i] for i in kept] == expected
+
+
+@mark.parametrize("points", [[], [(0.0, 0.0)], [(0.0, 0.0), (1.0, 1.0)]])
+@mark.parametrize("point_count", [1, 2, 5])
+@mark.parametrize("exact", [False, True])
+def test_to_indices_short(points, point_count, exact):
+    """Test simplify_curve_to_indices() keeps every point of curves too short
+    to simplify, like simplify_curve_indices()."""
+    kept = simplify_curve_to_indices(points, point_count, exact=exact)
+    assert kept == simplify_curve_indices(points, 1.0)
+    assert list(kept) == list(range(len(points)))
+
+
+@mark.parametrize("epsilon", [0, 0.1])
+def test_mask(wavy_points, backend, epsilon):
+    """Test simplify_curve_mask() flags the points simplify_curve() keeps."""
+    keep = simplify_curve_mask(wavy_points, epsilon)
+    assert isinstance(keep, bytearray) and len(keep) == len(wavy_points)
+    expected = simplify_curve(wavy_points, epsilon)
+    assert [p for p, k in zip(wavy_points, keep) if k] == expected
+
+
+def test_point_array(wavy_points):
+    """Test simplify_curve_indices() with a PointArray."""
+    kept = simplify_curve_indices(PointArray(wavy_points), 0.1)
+    assert kept == simplify_curve_indices(wavy_points, 0.1)
+
+
+def test_numpy(wavy_points):
+    """Test the NumPy array results for NumPy array points."""
+    np = importorskip("numpy")
+    points = np.array(wavy_points)
+    expected = simplify_curve(points, 0.1)
+
+    kept = simplify_curve_indices(points, 0.1)
+    assert kept.dtype == np.int64
+    assert np.array_equal(points[kept], expected)
+
+    keep = simplify_curve_mask(points, 0.1)
+    assert keep.dtype == bool
+    assert np.array_equal(points[keep], expected)
+
+    kept = simplify_curve_to_indices(points, 20)
+    assert np.array_equal(points[kept], simplify_curve_to(points, 20))
+
+
+@mark.parametrize("point_count", [2, 20, 1000])
+def test_to_indices_exact(wavy_points, backend, point_count):
+    """Test simplify_curve_to_indices() with exact=True picks the points
+    simplify_curve_to() keeps."""
+    kept = simplify_curve_to_indices(wavy_points, point_count, exact=True)
+    expected = simplify_curve_to(wavy_points, point_count, exact=True)
+    assert [wavy_points[i] for i in kept] == expected
@@ -0,0 +1,106 @@
+"""Test cases for the simplify_curve_parallel() and
+simplify_curve_parallel_indices() functions."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+from math import cos, sin
+
+from pytest import fixture, importorskip, mark, raises
+
+from curvereduce import (
+    PointArray,
+    parallel,
+    perpendicular_distance,
+    shortest_distance,
+    simplify_curve,
+    simplify_curve_indices,
+    simplify_curve_parallel,
+    simplify_curve_parallel_indices,
+)
+
+
+@fixture
+def wavy_point_count():
+    """Fixture for the number of points of the noisy curve."""
+    return 3000
+
+
+@fixture
+def numpy_modules():
+    """Fixture for the modules calling the NumPy backend directly."""
+    return [parallel]
+
+
+def abs_y_distance(p, a, b):
+    """Distance function measuring only the difference in y from the line
+    endpoint it's closest to in x, picklable for the worker processes."""
+    return abs(p[1] - (a[1] if p[0] - a[0] < b[0] - p[0] else b[1]))
+
+
+def test_epsilon_subzero(wavy_points):
+    """Test simplify_curve_parallel() with epsilon < 0."""
+    with raises(ValueError, match="Epsilon must not be a negative number."):
+        simplify_curve_parallel(wavy_points, -1)
+
+
+def test_small_curve():
+    """Test simplify_curve_parallel() with a curve too small to split."""
+    assert simplify_curve_parallel([(0, 0), (1, 1)], 1, workers=2) == [(0, 0), (1, 1)]
+
+
+@mark.parametrize("workers", [1, 2, 3])
+@mark.parametrize("distance_function", [shortest_distance, perpendicular_distance])
+def test_matches_simplify_curve(backend, wavy_points, workers, distance_function):
+    """Test simplify_curve_parallel() against simplify_curve()."""
+    # pylint: disable=unused-argument
+    assert simplify_curve_parallel(
+        wavy_points, 0.05, distance_function, workers=workers, chunk_points=200
+    ) == simplify_curve(wavy_points, 0.05, distance_function)
+
+
+def test_zero_epsilon(wavy_points):
+    """Test simplify_curve_parallel() with epsilon = 0."""
+    assert (
+        simplify_curve_parallel(wavy_points, 0, workers=2, chunk_points=200)
+        == wavy_points
+    )
+
+
+def test_point_array(wavy_points):
+    """Test simplify_curve_parallel() with a PointArray."""
+    curve = PointArray(wavy_points)
+    simplified = simplify_curve_parallel(curve, 0.05, workers=2, chunk_points=200)
+    assert isinstance(simplified, PointArray)
+    assert simplified == simplify_curve(curve, 0.05)
+
+
+def test_3d(backend):
+    """Test simplify_curve_parallel() with 3D points."""
+    # pylint: disable=unused-argument
+    track = [(x / 10, sin(x / 40), cos(x / 30) * (x % 5)) for x in range(2000)]
+    assert simplify_curve_parallel(
+        track, 0.1, workers=2, chunk_points=150
+    ) == simplify_curve(track, 0.1)
+
+
+def test_custom_distance_function(wavy_points):
+    """Test simplify_curve_parallel() with a custom distance function."""
+    assert simplify_curve_parallel(
+        wavy_points, 0.02, abs_y_distance, workers=2, chunk_points=200
+    ) == simplify_curve(wavy_points, 0.02, abs_y_distance)
+
+
+def test_indices(wavy_points):
+    """Test simplify_curve_parallel_indices() with a list."""
+    assert list(
+        simplify_curve_parallel_indices(wavy_points, 0.05, workers=2, chunk_points=200)
+    ) == list(simplify_curve_indices(wavy_points, 0.05))
+
+
+def test_indices_numpy(wavy_points):
+    """Test simplify_curve_parallel_indices() with a NumPy array."""
+    np = importorskip("numpy")
+    kept = simplify_curve_parallel_indices(
+        np.array(wavy_points), 0.05, workers=2, chunk_points=200
+    )
+    assert isinstance(kept, np.ndarray)
+    assert kept.tolist() == list(simplify_curve_indices(wavy_points, 0.05))
@@ -1,9 +1,21 @@
 """Test cases for the simplify_curve_to() function."""
 # pylint: disable=invalid-name,redefined-outer-name
 
-from pytest import fixture
 
-from curvereduce import simplify_curve_to
+from pytest import fixture, mark
+
+from curvereduce import (
+    rank_points,
+    record_stats,
+    simplify_curve_to,
+    simplify_ranked_to,
+)
+
+
+@fixture
+def grid_points():
+    """Fixture for a curve with many points at exactly the same distance."""
+    return [(i, (i * 7) % 5) for i in range(300)]
 
 
 @fixture
@@ -226,3 +238,58 @@ def test_many_points_to_many_points(many_points):
     expected = many_points
     simplified = simplify_curve_to(many_points, 1000)
     assert simplified == expected
+
+
+@mark.parametrize("point_count", [3, 5, 20, 100, 150, 500, 999])
+def test_closest(wavy_points, grid_points, backend, point_count):
+    """Test simplify_curve_to() keeps the number of points closest to the
+    target that any epsilon value gives, preferring more points on a tie."""
+    for points in (wavy_points, grid_points):
+        ranking = rank_points(points)
+        significance = [s for s, _ in ranking] + [float("-inf")]
+        possible = [
+            count
+            for count in range(2, len(points) + 1)
+            if significance[count - 1] > significance[count]
+        ]
+        count = min(possible, key=lambda c: (abs(c - point_count), -c))
+        expected = simplify_ranked_to(points, ranking, count)
+        simplified = simplify_curve_to(points, point_count)
+        assert simplified == expected
+
+
+@mark.parametrize("point_count", [3, 20, 100, 500])
+def test_few_runs(wavy_points, backend, point_count):
+    """Test simplify_curve_to() only needs a few runs of the algorithm."""
+    with record_stats() as stats:
+        simplify_curve_to(wavy_points, point_count)
+    assert 1 <= stats.search_iterations <= 3
+
+
+@mark.parametrize("point_count", [3, 5, 20, 100, 150, 500, 999])
+def test_exact(wavy_points, grid_points, backend, point_count):
+    """Test simplify_curve_to() with exact=True keeps the top of the ranking."""
+    for points in (wavy_points, grid_points):
+        expected = simplify_ranked_to(points, rank_points(points), point_count)
+        simplified = simplify_curve_to(points, point_count, exact=True)
+        assert len(simplified) == min(point_count, len(points))
+        assert simplified == expected
+
+
+def test_exact_only_measures_kept(wavy_points):
+    """Test simplify_curve_to() with exact=True only searches the ranges on
+    either side of the kept points."""
+    with record_stats() as stats:
+        simplify_curve_to(wavy_points, 20, exact=True)
+    assert stats.splits == 18
+    assert stats.ranges <= 2 * 18 + 1
+    assert stats.search_iterations == 0
+    assert set(stats.phases) == {"rank"}
+
+
+def test_exact_unreachable():
+    """Test simplify_curve_to() with exact=True fills up with points no split
+    reaches, like the ranking does."""
+    points = [(0, 0), (1, 0), (1, 0), (2, 0), (3, 0)]
+    expected = simplify_ranked_to(points, rank_points(points), 4)
+    assert simplify_curve_to(points, 4, exact=True) == expected
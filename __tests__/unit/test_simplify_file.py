@@ -0,0 +1,192 @@
+"""Test cases for the simplify_file(), simplify_file_to() and
+simplify_file_indices() functions."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+from array import array
+from io import BytesIO
+from math import cos, sin
+
+from pytest import fixture, importorskip, mark, raises
+
+from curvereduce import (
+    mapped,
+    perpendicular_distance,
+    shortest_distance,
+    simplify_curve_indices,
+    simplify_curve_to_indices,
+    simplify_file,
+    simplify_file_indices,
+    simplify_file_to,
+)
+
+
+@fixture
+def wavy_point_count():
+    """Fixture for the number of points of the noisy curve."""
+    return 3000
+
+
+@fixture
+def source(tmp_path, wavy_points):
+    """Fixture for the curve as a raw file of interleaved float64 coordinates."""
+    path = tmp_path / "curve.bin"
+    path.write_bytes(array("d", [c for p in wavy_points for c in p]).tobytes())
+    return path
+
+
+@fixture
+def numpy_modules():
+    """Fixture for the modules calling the NumPy backend directly."""
+    return [mapped]
+
+
+def test_epsilon_subzero(source):
+    """Test simplify_file() with epsilon < 0."""
+    with raises(ValueError, match="Epsilon must not be a negative number."):
+        simplify_file(source, -1, BytesIO())
+
+
+def test_partial_point(tmp_path):
+    """Test simplify_file_indices() with a file that ends mid-point."""
+    path = tmp_path / "partial.bin"
+    path.write_bytes(bytes(24))
+    with raises(ValueError, match="The file must hold a whole number of points."):
+        simplify_file_indices(path, 1)
+
+
+def test_unknown_dtype(source):
+    """Test simplify_file_indices() with an unknown coordinate type."""
+    with raises(ValueError, match="Unknown coordinate type: q."):
+        simplify_file_indices(source, 1, dtype="q")
+
+
+def test_empty(backend, tmp_path):
+    """Test simplify_file_indices() with an empty file."""
+    # pylint: disable=unused-argument
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    assert list(simplify_file_indices(path, 1)) == []
+
+
+@mark.parametrize("distance_function", [shortest_distance, perpendicular_distance])
+def test_indices(backend, source, wavy_points, distance_function):
+    """Test simplify_file_indices() against simplify_curve_indices()."""
+    # pylint: disable=unused-argument
+    assert list(simplify_file_indices(source, 0.05, distance_function)) == list(
+        simplify_curve_indices(wavy_points, 0.05, distance_function)
+    )
+
+
+def test_custom_distance_function(source, wavy_points):
+    """Test simplify_file_indices() with a custom distance function."""
+
+    def distance(p, a, b):
+        return shortest_distance(p, a, b) / 2
+
+    assert list(simplify_file_indices(source, 0.05, distance)) == list(
+        simplify_curve_indices(wavy_points, 0.05, distance)
+    )
+
+
+def test_zero_epsilon(backend, source, wavy_points):
+    """Test simplify_file_indices() with epsilon = 0."""
+    # pylint: disable=unused-argument
+    assert list(simplify_file_indices(source, 0)) == list(range(len(wavy_points)))
+
+
+def test_write_points(backend, source, wavy_points, tmp_path, monkeypatch):
+    """Test simplify_file() writing the kept points to a file, a few chunks at
+    a time."""
+    # pylint: disable=unused-argument
+    monkeypatch.setattr(mapped, "MAPPED_CHUNK_POINTS", 1000)
+    output = tmp_path / "simplified.bin"
+    kept = list(simplify_curve_indices(wavy_points, 0.05))
+
+    assert simplify_file(source, 0.05, output) == len(kept)
+    assert array("d", output.read_bytes()).tolist() == [
+        c for i in kept for c in wavy_points[i]
+    ]
+
+
+@mark.parametrize("point_count", [1, 25, 5000])
+def test_to(backend, source, wavy_points, tmp_path, point_count):
+    """Test simplify_file_to() writing the points kept at a point count."""
+    # pylint: disable=unused-argument
+    output = tmp_path / "simplified.bin"
+    kept = list(simplify_curve_to_indices(wavy_points, point_count))
+
+    assert simplify_file_to(source, point_count, output) == len(kept)
+    assert array("d", output.read_bytes()).tolist() == [
+        c for i in kept for c in wavy_points[i]
+    ]
+
+
+def test_write_indices(backend, source, wavy_points, monkeypatch):
+    """Test simplify_file_indices() writing the kept indices to a buffer, a few
+    chunks at a time."""
+    # pylint: disable=unused-argument
+    monkeypatch.setattr(mapped, "MAPPED_CHUNK_POINTS", 1000)
+    output = BytesIO()
+    kept = list(simplify_curve_indices(wavy_points, 0.05))
+
+    assert simplify_file_indices(source, 0.05, output=output) == len(kept)
+    assert array("q", output.getvalue()).tolist() == kept
+
+
+def test_float32_offset(backend, wavy_points, tmp_path):
+    """Test simplify_file_indices() with float32 coordinates after a header."""
+    # pylint: disable=unused-argument
+    coordinates = array("f", [c for p in wavy_points for c in p])
+    path = tmp_path / "curve32.bin"
+    path.write_bytes(b"header" + coordinates.tobytes())
+    rounded = list(zip(coordinates[::2], coordinates[1::2]))
+
+    assert list(simplify_file_indices(path, 0.05, dtype="f", offset=6)) == list(
+        simplify_curve_indices(rounded, 0.05)
+    )
+
+
+def test_3d(backend, tmp_path):
+    """Test simplify_file_indices() with 3D points."""
+    # pylint: disable=unused-argument
+    track = [(x / 10, sin(x / 40), cos(x / 30) * (x % 5)) for x in range(2000)]
+    path = tmp_path / "track.bin"
+    path.write_bytes(array("d", [c for p in track for c in p]).tobytes())
+
+    assert list(simplify_file_indices(path, 0.1, dimensions=3)) == list(
+        simplify_curve_indices(track, 0.1)
+    )
+
+
+def test_npy(wavy_points, tmp_path):
+    """Test simplify_file() and simplify_file_indices() with a .npy file."""
+    np = importorskip("numpy")
+    path = tmp_path / "curve.npy"
+    np.save(path, np.array(wavy_points))
+    kept = list(simplify_curve_indices(wavy_points, 0.05))
+
+    indices = simplify_file_indices(path, 0.05)
+    assert isinstance(indices, np.ndarray)
+    assert indices.tolist() == kept
+
+    output = BytesIO()
+    simplify_file(str(path), 0.05, output)
+    assert np.frombuffer(output.getvalue()).reshape(-1, 2).tolist() == [
+        list(wavy_points[i]) for i in kept
+    ]
+
+
+def test_npy_not_points(tmp_path):
+    """Test simplify_file_indices() with a .npy file that isn't (N, D)."""
+    np = importorskip("numpy")
+    path = tmp_path / "flat.npy"
+    np.save(path, np.zeros(10))
+    with raises(ValueError, match=r".npy files must hold an \(N, D\) array"):
+        simplify_file_indices(path, 1)
+
+
+def test_npy_without_numpy(tmp_path, monkeypatch):
+    """Test simplify_file_indices() with a .npy file and no NumPy."""
+    monkeypatch.setattr(mapped, "_numpy", None)
+    with raises(ValueError, match="Reading .npy files requires NumPy."):
+        simplify_file_indices(tmp_path / "curve.npy", 1)
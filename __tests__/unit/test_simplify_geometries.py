@@ -0,0 +1,283 @@
+"""Test cases for the simplify_wkb() and simplify_geojson() functions."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+import struct
+from math import cos, pi, sin
+
+from pytest import fixture, mark, raises
+
+from curvereduce import (
+    geometry,
+    perpendicular_distance,
+    point_distance_squared,
+    record_stats,
+    simplify_curve,
+    simplify_geojson,
+    simplify_wkb,
+)
+
+
+def wkb(kind, body, order="<", dimensions=2):
+    """Writes a WKB geometry out of its body: a list of points for a
+    LineString, of rings for a Polygon, or of WKB geometries."""
+    code = kind + {2: 0, 3: 1000}[dimensions]
+    result = struct.pack(order + "BI", order == "<", code)
+    if kind == 2:
+        result += points_wkb(body, order)
+    elif kind == 3:
+        result += struct.pack(order + "I", len(body))
+        result += b"".join(points_wkb(ring, order) for ring in body)
+    else:
+        result += struct.pack(order + "I", len(body)) + b"".join(body)
+    return result
+
+
+def points_wkb(points, order="<"):
+    """Writes the count and coordinates of a line or ring."""
+    return struct.pack(order + "I", len(points)) + b"".join(
+        struct.pack(f"{order}{len(p)}d", *p) for p in points
+    )
+
+
+def read_points(blob, offset, dimensions):
+    """Reads the count and coordinates of a line or ring of little-endian WKB."""
+    (count,) = struct.unpack_from("<I", blob, offset)
+    offset += 4
+    points = [
+        struct.unpack_from(f"<{dimensions}d", blob, offset + 8 * dimensions * i)
+        for i in range(count)
+    ]
+    return points, offset + 8 * dimensions * count
+
+
+@fixture
+def line():
+    """Fixture for a noisy line."""
+    return [(x / 10, sin(x / 20) + ((x * 7919) % 13) / 100) for x in range(500)]
+
+
+@fixture
+def ring():
+    """Fixture for a noisy closed ring."""
+    points = [
+        (cos(t * pi / 200) * (10 + (t * 7919) % 7 / 50), sin(t * pi / 200) * 10)
+        for t in range(400)
+    ]
+    return points + [points[0]]
+
+
+@fixture
+def numpy_modules():
+    """Fixture for the modules calling the NumPy backend directly."""
+    return [geometry]
+
+
+def test_epsilon_subzero(line):
+    """Test simplify_wkb() with epsilon < 0."""
+    with raises(ValueError, match="Epsilon must not be a negative number."):
+        simplify_wkb([wkb(2, line)], -1)
+
+
+@mark.parametrize("order", ["<", ">"])
+def test_lines(backend, line, order):
+    """Test simplify_wkb() against simplify_curve() with LineStrings of either
+    byte order, written back in little-endian order."""
+    # pylint: disable=unused-argument
+    lines = [line[:n] for n in (0, 1, 2, 3, 50, 500)]
+
+    simplified = simplify_wkb([wkb(2, p, order) for p in lines], 0.05)
+
+    for points, blob in zip(lines, simplified):
+        assert blob[:5] == struct.pack("<BI", 1, 2)
+        assert read_points(blob, 5, 2) == (simplify_curve(points, 0.05), len(blob))
+
+
+def test_zero_epsilon(backend, line):
+    """Test simplify_wkb() with epsilon = 0."""
+    # pylint: disable=unused-argument
+    (blob,) = simplify_wkb([wkb(2, line, ">")], 0)
+    assert blob == wkb(2, line)
+
+
+def test_custom_distance_function(line):
+    """Test simplify_wkb() with a custom distance function."""
+
+    def distance(p, a, b):
+        return perpendicular_distance(p, a, b) / 2
+
+    (blob,) = simplify_wkb([wkb(2, line)], 0.02, distance)
+    assert read_points(blob, 5, 2)[0] == simplify_curve(line, 0.02, distance)
+
+
+def test_z(backend, line):
+    """Test that z values are carried along but not measured."""
+    # pylint: disable=unused-argument
+    track = [(x, y, float(i % 17)) for i, (x, y) in enumerate(line)]
+    (blob,) = simplify_wkb([wkb(2, track, dimensions=3)], 0.05)
+    kept = [(x, y) for x, y, _ in read_points(blob, 5, 3)[0]]
+    assert kept == simplify_curve(line, 0.05)
+
+
+def test_ewkb(backend, line):
+    """Test the extended WKB of PostGIS, with z and m values and an SRID."""
+    # pylint: disable=unused-argument
+    track = [(x, y, 1.0, 2.0) for x, y in line]
+    blob = struct.pack("<BII", 1, 0xE0000002, 4326) + points_wkb(track)
+    (simplified,) = simplify_wkb([blob], 0.05)
+    assert simplified[:9] == blob[:9]
+    assert read_points(simplified, 9, 4)[0] == [
+        (x, y, 1.0, 2.0) for x, y in simplify_curve(line, 0.05)
+    ]
+
+
+def test_ring(backend, ring):
+    """Test that closed rings are simplified as two halves, split at the point
+    furthest from their first point."""
+    # pylint: disable=unused-argument
+    (blob,) = simplify_wkb([wkb(3, [ring])], 0.1)
+    far = max(
+        range(1, len(ring) - 1),
+        key=lambda i: point_distance_squared(ring[i], ring[0]),
+    )
+    expected = (
+        simplify_curve(ring[: far + 1], 0.1) + simplify_curve(ring[far:], 0.1)[1:]
+    )
+    assert struct.unpack_from("<I", blob, 5) == (1,)
+    assert read_points(blob, 9, 2)[0] == expected
+
+
+def test_ring_min_points(backend):
+    """Test that polygon rings keep at least four points, but lines don't."""
+    # pylint: disable=unused-argument
+    sliver = [(0.0, 0.0), (1.0, 0.01), (2.0, 0.0), (3.0, 0.02), (4.0, 0.0), (0.0, 0.0)]
+
+    polygon, closed_line = simplify_wkb([wkb(3, [sliver]), wkb(2, sliver)], 1)
+
+    assert read_points(polygon, 9, 2)[0] == [
+        (0.0, 0.0),
+        (3.0, 0.02),
+        (4.0, 0.0),
+        (0.0, 0.0),
+    ]
+    assert read_points(closed_line, 5, 2)[0] == [(0.0, 0.0), (4.0, 0.0), (0.0, 0.0)]
+
+
+def test_collections(backend, line, ring):
+    """Test multi-geometries, geometry collections and points."""
+    # pylint: disable=unused-argument
+    point = wkb(1, [], ">")[:5] + struct.pack(">2d", 1.5, 2.5)
+    collection = wkb(
+        7, [point, wkb(5, [wkb(2, line), wkb(2, line[:100], ">")]), wkb(3, [ring])]
+    )
+
+    (blob,) = simplify_wkb([collection], 0.1)
+
+    expected = wkb(
+        7,
+        [
+            wkb(1, [])[:5] + struct.pack("<2d", 1.5, 2.5),
+            wkb(
+                5,
+                [
+                    wkb(2, simplify_curve(line, 0.1)),
+                    wkb(2, simplify_curve(line[:100], 0.1)),
+                ],
+            ),
+            wkb(3, [simplify_wkb_ring(ring, 0.1)]),
+        ],
+    )
+    assert blob == expected
+
+
+def simplify_wkb_ring(ring, epsilon):
+    """Simplifies a ring on its own, through a Polygon."""
+    (blob,) = simplify_wkb([wkb(3, [ring])], epsilon)
+    return read_points(blob, 9, 2)[0]
+
+
+def test_batches(monkeypatch, line):
+    """Test that geometries are simplified in batches of about GEOMETRY_BATCH_POINTS
+    points, with the same results."""
+    monkeypatch.setattr(geometry, "GEOMETRY_BATCH_POINTS", 700)
+    lines = [line[n:] for n in range(0, 500, 50)]
+    simplified = simplify_wkb([wkb(2, p) for p in lines], 0.05)
+    assert [read_points(b, 5, 2)[0] for b in simplified] == [
+        simplify_curve(p, 0.05) for p in lines
+    ]
+
+
+def test_one_batch(line):
+    """Test that the lines of a batch are simplified in a single pass of the
+    vectorized engine, whose depth is that of the deepest line."""
+    with record_stats() as single:
+        simplify_curve(line, 0.05)
+    with record_stats() as batch:
+        simplify_wkb([wkb(2, line)] * 10, 0.05)
+    assert batch.ranges == 10 * single.ranges
+    assert batch.max_depth == single.max_depth
+
+
+@mark.parametrize(
+    "blob, message",
+    [
+        (b"\x01\x02\x00", "The WKB geometry is cut short."),
+        (b"\x02" + bytes(8), "Unknown WKB byte order: 2."),
+        (struct.pack("<BII", 1, 2, 3) + bytes(40), "cut short"),
+        (struct.pack("<BII", 1, 2, 1) + bytes(20), "bytes after its end"),
+        (struct.pack("<BI", 1, 8) + bytes(4), "Unsupported geometry type: 8."),
+    ],
+)
+def test_invalid(blob, message):
+    """Test simplify_wkb() with invalid WKB."""
+    with raises(ValueError, match=message):
+        simplify_wkb([blob], 1)
+
+
+def test_geojson(backend, line, ring):
+    """Test simplify_geojson() with every geometry type and null geometries,
+    keeping the other members and the positions of the input."""
+    # pylint: disable=unused-argument
+    positions = [[x, y] for x, y in line]
+    ring_positions = [[x, y, 7.0] for x, y in ring]
+    geometries = [
+        {"type": "Point", "coordinates": [1, 2]},
+        None,
+        {"type": "LineString", "coordinates": positions, "bbox": [0, 0, 1, 1]},
+        {"type": "MultiLineString", "coordinates": [positions, positions[:3]]},
+        {"type": "Polygon", "coordinates": [ring_positions]},
+        {
+            "type": "GeometryCollection",
+            "geometries": [
+                {"type": "MultiPolygon", "coordinates": [[ring_positions]]},
+                None,
+            ],
+        },
+    ]
+
+    simplified = simplify_geojson(geometries, 0.1)
+
+    kept_line = [list(p) for p in simplify_curve(line, 0.1)]
+    kept_start = [list(p) for p in simplify_curve(line[:3], 0.1)]
+    kept_ring = [[x, y, 7.0] for x, y in simplify_wkb_ring(ring, 0.1)]
+    assert simplified == [
+        {"type": "Point", "coordinates": [1, 2]},
+        None,
+        {"type": "LineString", "coordinates": kept_line, "bbox": [0, 0, 1, 1]},
+        {"type": "MultiLineString", "coordinates": [kept_line, kept_start]},
+        {"type": "Polygon", "coordinates": [kept_ring]},
+        {
+            "type": "GeometryCollection",
+            "geometries": [
+                {"type": "MultiPolygon", "coordinates": [[kept_ring]]},
+                None,
+            ],
+        },
+    ]
+    assert simplified[2]["coordinates"][-1] is positions[-1]
+    assert geometries[2]["coordinates"] is positions
+
+
+def test_geojson_unknown_type():
+    """Test simplify_geojson() with something that isn't a geometry."""
+    with raises(ValueError, match="Unsupported geometry type: Feature."):
+        simplify_geojson([{"type": "Feature", "geometry": None}], 1)
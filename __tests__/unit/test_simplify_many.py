@@ -0,0 +1,119 @@
+"""Test cases for the simplify_many() and simplify_many_as_completed()
+functions."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+from math import sin
+
+from pytest import fixture, mark, raises
+
+from curvereduce import (
+    perpendicular_distance,
+    simplify_curve,
+    simplify_curve_indices,
+    simplify_curve_to,
+    simplify_many,
+    simplify_many_as_completed,
+    simplify_many_indices,
+)
+
+
+@fixture
+def curves():
+    """Fixture for curves of different lengths."""
+    return [
+        [(x / 10, sin(x / (5 + c)) + ((x * 7919) % 13) / 100) for x in range(c * 40)]
+        for c in range(1, 12)
+    ]
+
+
+def test_no_target():
+    """Test simplify_many() without epsilon or point_count."""
+    with raises(ValueError, match="Exactly one of epsilon and point_count"):
+        simplify_many([])
+
+
+def test_both_targets():
+    """Test simplify_many() with both epsilon and point_count."""
+    with raises(ValueError, match="Exactly one of epsilon and point_count"):
+        simplify_many([], epsilon=1, point_count=10)
+
+
+def test_epsilon_subzero():
+    """Test simplify_many() with epsilon < 0."""
+    with raises(ValueError, match="Epsilon must not be a negative number."):
+        simplify_many_as_completed([], epsilon=-1)
+
+
+def test_no_curves():
+    """Test simplify_many() with no curves."""
+    assert simplify_many([], epsilon=1, workers=2) == []
+
+
+@mark.parametrize("workers", [1, 2])
+def test_epsilon(curves, workers):
+    """Test simplify_many() with an epsilon value."""
+    expected = [simplify_curve(c, 0.05, perpendicular_distance) for c in curves]
+    simplified = simplify_many(
+        curves,
+        epsilon=0.05,
+        distance_function=perpendicular_distance,
+        workers=workers,
+        chunk_points=300,
+    )
+    assert simplified == expected
+
+
+@mark.parametrize("workers", [1, 2])
+def test_point_count(curves, workers):
+    """Test simplify_many() with a point count."""
+    expected = [simplify_curve_to(c, 20) for c in curves]
+    simplified = simplify_many(
+        iter(curves), point_count=20, workers=workers, chunk_points=300
+    )
+    assert simplified == expected
+
+
+def test_as_completed(curves):
+    """Test simplify_many_as_completed() yields every curve with its
+    position."""
+    expected = [simplify_curve(c, 0.05) for c in curves]
+    simplified = dict(
+        simplify_many_as_completed(curves, epsilon=0.05, workers=2, chunk_points=1)
+    )
+    assert [simplified[i] for i in range(len(curves))] == expected
+
+
+def test_indices_no_target():
+    """Test simplify_many_indices() checks its target before reading any
+    curve."""
+    with raises(ValueError, match="Exactly one of epsilon and point_count"):
+        simplify_many_indices(iter([]))
+
+
+@mark.parametrize("workers", [1, 2])
+def test_indices(curves, workers):
+    """Test simplify_many_indices() yields the kept indices of every curve, in
+    order, while still reading the curves."""
+    read = []
+
+    def generate():
+        for curve in curves:
+            read.append(curve)
+            yield curve
+
+    kept = simplify_many_indices(generate(), 0.05, workers=workers, chunk_points=1)
+
+    assert list(next(kept)) == list(simplify_curve_indices(curves[0], 0.05))
+    assert len(read) < len(curves)
+    assert [list(k) for k in kept] == [
+        list(simplify_curve_indices(c, 0.05)) for c in curves[1:]
+    ]
+
+
+@mark.parametrize("workers", [1, 2])
+def test_3d(curves, workers):
+    """Test simplify_many() with 3D curves."""
+    curves = [[(x, y, x * y) for x, y in c] for c in curves]
+    expected = [simplify_curve(c, 0.05) for c in curves]
+    simplified = simplify_many(curves, epsilon=0.05, workers=workers, chunk_points=300)
+    assert simplified == expected
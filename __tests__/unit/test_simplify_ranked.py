@@ -0,0 +1,67 @@
+"""Test cases for the simplify_ranked() and simplify_ranked_to() functions."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+
+from pytest import fixture, mark, raises
+
+from curvereduce import (
+    perpendicular_distance,
+    rank_points,
+    shortest_distance,
+    simplify_curve,
+    simplify_ranked,
+    simplify_ranked_to,
+)
+
+
+@fixture
+def wavy_point_count():
+    """Fixture for the number of points of the noisy curve."""
+    return 500
+
+
+def test_epsilon_subzero():
+    """Test simplify_ranked() with epsilon < 0."""
+    with raises(ValueError, match="Epsilon must not be a negative number."):
+        simplify_ranked([], [], -1)
+
+
+def test_epsilon_zero(wavy_points):
+    """Test simplify_ranked() with epsilon = 0 keeps every point."""
+    ranking = rank_points(wavy_points)
+    assert simplify_ranked(wavy_points, ranking, 0) == wavy_points
+
+
+@mark.parametrize("distance_function", [shortest_distance, perpendicular_distance])
+@mark.parametrize("epsilon", [0.01, 0.05, 0.1, 0.5, 1, 10])
+def test_matches_simplify_curve(wavy_points, distance_function, epsilon):
+    """Test simplify_ranked() gives the same result as simplify_curve()."""
+    ranking = rank_points(wavy_points, distance_function)
+    expected = simplify_curve(wavy_points, epsilon, distance_function)
+    assert simplify_ranked(wavy_points, ranking, epsilon) == expected
+
+
+@mark.parametrize("point_count", [0, 1, 2, 3, 20, 499])
+def test_exact_point_count(wavy_points, point_count):
+    """Test simplify_ranked_to() returns exactly the desired number of points,
+    always including the endpoints."""
+    ranking = rank_points(wavy_points)
+    simplified = simplify_ranked_to(wavy_points, ranking, point_count)
+    assert len(simplified) == max(point_count, 2)
+    assert simplified[0] == wavy_points[0]
+    assert simplified[-1] == wavy_points[-1]
+
+
+def test_point_count_too_large(wavy_points):
+    """Test simplify_ranked_to() with more points than the curve has."""
+    ranking = rank_points(wavy_points)
+    assert simplify_ranked_to(wavy_points, ranking, 1000) == wavy_points
+
+
+def test_point_count_is_epsilon_prefix(wavy_points):
+    """Test simplify_ranked_to() gives the same result as simplify_curve() when
+    the point count matches."""
+    ranking = rank_points(wavy_points)
+    expected = simplify_curve(wavy_points, 0.1)
+    simplified = simplify_ranked_to(wavy_points, ranking, len(expected))
+    assert simplified == expected
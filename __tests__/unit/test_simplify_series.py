@@ -0,0 +1,151 @@
+"""Test cases for the simplify_series() and simplify_series_indices()
+functions."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+from array import array
+from math import cos, sin
+
+from pytest import fixture, importorskip, mark, raises
+
+from curvereduce import (
+    perpendicular_distance,
+    shortest_distance,
+    simplify_curve_indices,
+    simplify_series,
+    simplify_series_indices,
+)
+
+EPSILONS = [0.1, 0.05, 2.0]
+
+
+@fixture
+def x():
+    """Fixture for a shared x axis."""
+    return [i / 10 for i in range(1000)]
+
+
+@fixture
+def values(x):
+    """Fixture for three noisy series of different scales, as rows."""
+    return [
+        (sin(t / 2.5) + ((i * 7919) % 13) / 100, cos(t) / 4, t * t + (i % 7))
+        for i, t in enumerate(x)
+    ]
+
+
+def column(x, values, j):
+    """Gets the points of one series."""
+    return [(px, row[j]) for px, row in zip(x, values)]
+
+
+def within(x, values, kept, j, epsilon, distance_function):
+    """Checks every dropped value of a series is within epsilon of the line
+    between the kept points around it."""
+    points = column(x, values, j)
+    return all(
+        distance_function(points[i], points[a], points[b]) <= epsilon
+        for a, b in zip(kept, kept[1:])
+        for i in range(a + 1, b)
+    )
+
+
+def test_epsilon_subzero(x, values):
+    """Test simplify_series_indices() with epsilon < 0."""
+    with raises(ValueError, match="Epsilon must not be a negative number."):
+        simplify_series_indices(x, values, [0.1, -1, 0.1])
+
+
+def test_epsilon_count(x, values):
+    """Test simplify_series_indices() with the wrong number of epsilon values."""
+    with raises(ValueError, match="There must be one epsilon value per series."):
+        simplify_series_indices(x, values, [0.1, 0.1])
+
+
+def test_length_mismatch(x, values):
+    """Test simplify_series_indices() with x and values of different lengths."""
+    with raises(ValueError, match="x and values must have the same number"):
+        simplify_series_indices(x[1:], values, 0.1)
+
+
+@mark.parametrize("distance_function", [shortest_distance, perpendicular_distance])
+def test_separate(x, values, backend, distance_function):
+    """Test every series is simplified like simplify_curve_indices() would."""
+    kept = simplify_series_indices(x, values, EPSILONS, distance_function, joint=False)
+    assert len(kept) == len(EPSILONS)
+    for j, epsilon in enumerate(EPSILONS):
+        expected = simplify_curve_indices(
+            column(x, values, j), epsilon, distance_function
+        )
+        assert kept[j] == expected
+
+
+@mark.parametrize("distance_function", [shortest_distance, perpendicular_distance])
+def test_joint(x, values, backend, distance_function):
+    """Test the same points keep every series within its epsilon value."""
+    kept = simplify_series_indices(x, values, EPSILONS, distance_function)
+    assert isinstance(kept, array)
+    assert kept[0] == 0 and kept[-1] == len(x) - 1
+    for j, epsilon in enumerate(EPSILONS):
+        assert within(x, values, list(kept), j, epsilon, distance_function)
+        alone = simplify_curve_indices(column(x, values, j), epsilon)
+        assert len(alone) <= len(kept)
+    assert len(kept) < len(x) / 2
+
+
+def test_joint_one_series(x, values, backend):
+    """Test a single series is simplified like simplify_curve_indices() would."""
+    rows = [(row[0],) for row in values]
+    kept = simplify_series_indices(x, rows, 0.1)
+    assert kept == simplify_curve_indices(column(x, rows, 0), 0.1)
+
+
+def test_joint_same_engines(x, values, disable_numpy):
+    """Test the vectorized and pure-Python engines keep the same points."""
+    vectorized = simplify_series_indices(x, values, [0.1, 0, 2.0])
+    disable_numpy()
+    assert simplify_series_indices(x, values, [0.1, 0, 2.0]) == vectorized
+
+
+def test_zero_epsilon(x, values, backend):
+    """Test a zero epsilon value keeps every point."""
+    assert list(simplify_series_indices(x, values, 0)) == list(range(len(x)))
+    kept = simplify_series_indices(x, values, [0.1, 0, 2.0], joint=False)
+    assert list(kept[1]) == list(range(len(x)))
+
+
+def test_short(backend):
+    """Test series of fewer than three points are kept as is."""
+    assert list(simplify_series_indices([0, 1], [(0, 1), (2, 3)], 0.1)) == [0, 1]
+    assert simplify_series_indices([], [], 0.1, joint=False) == []
+
+
+def test_simplify_series(x, values):
+    """Test simplify_series() slices x and the rows at the kept points."""
+    kept = simplify_series_indices(x, values, EPSILONS)
+    simplified_x, simplified_values = simplify_series(x, values, EPSILONS)
+    assert simplified_x == [x[i] for i in kept]
+    assert simplified_values == [values[i] for i in kept]
+
+
+def test_numpy(x, values):
+    """Test NumPy arrays come back as NumPy arrays."""
+    np = importorskip("numpy")
+    xs, ys = np.array(x), np.array(values)
+    kept = simplify_series_indices(xs, ys, EPSILONS)
+    assert kept.dtype == np.int64
+    assert list(kept) == list(simplify_series_indices(x, values, EPSILONS))
+    separate = simplify_series_indices(xs, ys, EPSILONS, joint=False)
+    assert all(k.dtype == np.int64 for k in separate)
+    simplified_x, simplified_values = simplify_series(xs, ys, EPSILONS)
+    assert simplified_values.shape == (len(kept), 3)
+    assert (simplified_x == xs[kept]).all()
+
+
+@mark.parametrize("scalar", ["float32", "float64", "int64"])
+def test_numpy_scalar_epsilon(x, values, scalar):
+    """Test a NumPy scalar counts as one epsilon value for every series."""
+    np = importorskip("numpy")
+    epsilon = getattr(np, scalar)(1)
+    assert list(simplify_series_indices(x, values, epsilon)) == list(
+        simplify_series_indices(x, values, 1.0)
+    )
@@ -0,0 +1,88 @@
+"""Test cases for the StreamingSimplifier class and the simplify_stream()
+function."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+
+from pytest import fixture, mark, raises
+
+from curvereduce import (
+    StreamingSimplifier,
+    shortest_distance,
+    simplify_curve,
+    simplify_stream,
+)
+
+
+@fixture
+def wavy_point_count():
+    """Fixture for the number of points of the noisy curve."""
+    return 2000
+
+
+def test_epsilon_subzero():
+    """Test StreamingSimplifier with epsilon < 0."""
+    with raises(ValueError, match="Epsilon must not be a negative number."):
+        StreamingSimplifier(-1)
+
+
+def test_window_too_small():
+    """Test StreamingSimplifier with a window of less than 3 points."""
+    with raises(ValueError, match="Window must hold at least 3 points."):
+        StreamingSimplifier(1, window=2)
+
+
+def test_no_points():
+    """Test simplify_stream() with no points."""
+    assert list(simplify_stream([], 1)) == []
+
+
+def test_one_point():
+    """Test simplify_stream() with a single point."""
+    assert list(simplify_stream([(0, 0)], 1)) == [(0, 0)]
+
+
+def test_within_window(wavy_points):
+    """Test simplify_stream() gives the same result as simplify_curve() when
+    the curve fits in the window."""
+    expected = simplify_curve(wavy_points, 0.05)
+    simplified = list(simplify_stream(iter(wavy_points), 0.05, window=2000))
+    assert simplified == expected
+
+
+@mark.parametrize("window", [3, 10, 100, 1000])
+def test_within_epsilon(wavy_points, window):
+    """Test simplify_stream() keeps every dropped point within epsilon of the
+    simplified curve when the curve doesn't fit in the window."""
+    simplified = list(simplify_stream(wavy_points, 0.05, window=window))
+    kept = [wavy_points.index(p) for p in simplified]
+    assert kept == sorted(set(kept))
+    assert kept[0] == 0 and kept[-1] == len(wavy_points) - 1
+    for a, b in zip(kept, kept[1:]):
+        for p in wavy_points[a + 1 : b]:
+            assert shortest_distance(p, wavy_points[a], wavy_points[b]) <= 0.05
+
+
+def test_bounded_buffer(wavy_points):
+    """Test StreamingSimplifier never holds more than the window."""
+    simplifier = StreamingSimplifier(0.05, window=100)
+    emitted = []
+    for p in wavy_points:
+        emitted.extend(simplifier.push(p))
+        assert len(simplifier._buffer) < 100  # pylint: disable=protected-access
+    emitted.extend(simplifier.flush())
+    assert emitted == list(simplify_stream(wavy_points, 0.05, window=100))
+
+
+def test_reuse_after_flush(wavy_points):
+    """Test StreamingSimplifier can simplify another curve after a flush."""
+    simplifier = StreamingSimplifier(0.05, window=500)
+    first = simplifier.extend(wavy_points) + simplifier.flush()
+    second = simplifier.extend(wavy_points) + simplifier.flush()
+    assert first == second
+
+
+def test_emits_when_window_fills(wavy_points):
+    """Test StreamingSimplifier only emits points when its window fills up."""
+    simplifier = StreamingSimplifier(0.05, window=100)
+    assert simplifier.extend(wavy_points[:99]) == []
+    assert simplifier.push(wavy_points[99])
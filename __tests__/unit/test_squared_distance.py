@@ -0,0 +1,75 @@
+"""Test cases for the squared distance functions and how max_distance() and
+simplify_curve() use them."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+from math import sqrt
+
+from pytest import approx, fixture, mark
+
+from curvereduce import (
+    SQUARED_DISTANCE_FUNCS,
+    max_distance,
+    perpendicular_distance,
+    perpendicular_distance_squared,
+    shortest_distance,
+    shortest_distance_squared,
+    simplify_curve,
+)
+
+
+@fixture
+def wavy_point_count():
+    """Fixture for the number of points of the noisy curve."""
+    return 200
+
+
+@mark.parametrize(
+    "distance_function, squared",
+    [
+        (perpendicular_distance, perpendicular_distance_squared),
+        (shortest_distance, shortest_distance_squared),
+    ],
+)
+@mark.parametrize("a, b", [((0, 0), (0, 4)), ((0, 0), (4, 0)), ((-1, 2), (3, -5))])
+@mark.parametrize("p", [(0, 0), (1, 1), (-3, 2), (5, -7)])
+def test_squared(distance_function, squared, a, b, p):
+    """Test the squared distance functions give the square of the distance, up
+    to rounding."""
+    assert sqrt(squared(p, a, b)) == approx(distance_function(p, a, b))
+
+
+def test_registered():
+    """Test the built-in distance functions have squared versions."""
+    assert SQUARED_DISTANCE_FUNCS[perpendicular_distance] is (
+        perpendicular_distance_squared
+    )
+    assert SQUARED_DISTANCE_FUNCS[shortest_distance] is shortest_distance_squared
+
+
+def test_grid_ties(pure_python):
+    """Test max_distance() picks the first of several points at the same
+    distance, even if their squared distances differ in the last bit."""
+    points = [(0, -3), (4, -1), (2, -1), (6, 1)]
+    assert shortest_distance_squared(points[1], points[0], points[-1]) < (
+        shortest_distance_squared(points[2], points[0], points[-1])
+    )
+    expected = (shortest_distance(points[1], points[0], points[-1]), 1)
+    assert max_distance(points) == expected
+
+
+def test_custom_opt_in(wavy_points, pure_python, monkeypatch):
+    """Test a custom distance function with a squared version gives the same
+    result, while being called for only a few points."""
+    calls = []
+
+    def custom(p, a, b):
+        calls.append(p)
+        return shortest_distance(p, a, b)
+
+    expected = simplify_curve(wavy_points, 0.05, custom)
+    all_calls = len(calls)
+
+    monkeypatch.setitem(SQUARED_DISTANCE_FUNCS, custom, shortest_distance_squared)
+    calls.clear()
+    assert simplify_curve(wavy_points, 0.05, custom) == expected
+    assert len(calls) < all_calls / 2
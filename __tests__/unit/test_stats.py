@@ -0,0 +1,117 @@
+"""Test cases for recording simplification stats."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+
+from pytest import fixture, mark
+
+from curvereduce import (
+    SimplificationStats,
+    max_distance,
+    perpendicular_distance,
+    rank_points,
+    record_stats,
+    simplify_curve,
+    simplify_curve_to,
+)
+from curvereduce.rdp import SEARCH_ITERATIONS
+from curvereduce.stats import current_stats
+
+
+@fixture
+def zigzag_points():
+    """Fixture for a growing zigzag, where every split only peels off a single
+    point."""
+    return [(i, (-1) ** i * i * i) for i in range(300)]
+
+
+def counters(stats):
+    """Gets the counters of some stats, without the timings."""
+    return {k: v for k, v in stats.as_dict().items() if not k.endswith("_seconds")}
+
+
+def test_disabled():
+    """Test nothing is recorded outside of record_stats()."""
+    assert current_stats() is None
+    with record_stats() as stats:
+        assert current_stats() is stats
+    assert current_stats() is None
+
+
+@mark.parametrize(
+    "epsilon, splits, depth", [(0.5, 1, 1), (2, 0, 1)], ids=["split", "kept"]
+)
+def test_simplify_curve(epsilon, splits, depth):
+    """Test the counters of a simplification by hand."""
+    with record_stats() as stats:
+        simplify_curve([(0, 0), (1, 1), (2, 0), (3, 0)], epsilon)
+    assert counters(stats) == {
+        "distance_evaluations": 2 + splits,
+        "ranges": 1 + splits,
+        "splits": splits,
+        "max_depth": depth + splits,
+        "search_iterations": 0,
+    }
+    assert set(stats.phases) == {"simplify", "select"}
+
+
+@mark.parametrize(
+    "simplify",
+    [
+        lambda points: simplify_curve(points, 0.1),
+        lambda points: simplify_curve_to(points, 50),
+        rank_points,
+        max_distance,
+    ],
+    ids=["simplify_curve", "simplify_curve_to", "rank_points", "max_distance"],
+)
+def test_same_counts(wavy_points, disable_numpy, simplify):
+    """Test the vectorized and pure-Python engines count the same work."""
+    with record_stats() as vectorized:
+        simplify(wavy_points)
+    disable_numpy()
+    with record_stats() as python:
+        simplify(wavy_points)
+    assert counters(vectorized) == counters(python)
+    assert vectorized.distance_evaluations > 0
+    assert set(vectorized.phases) == set(python.phases)
+
+
+def test_simplify_curve_to(wavy_points):
+    """Test the search of simplify_curve_to() is recorded."""
+    with record_stats() as stats:
+        simplify_curve_to(wavy_points, 50)
+    assert 0 < stats.search_iterations <= SEARCH_ITERATIONS
+    assert set(stats.phases) == {"search", "rank"}
+
+
+def test_hull(zigzag_points):
+    """Test the hull algorithm measures fewer points on its worst case."""
+    with record_stats() as scan:
+        simplify_curve(zigzag_points, 0.5, perpendicular_distance)
+    with record_stats() as hull:
+        simplify_curve(zigzag_points, 0.5, perpendicular_distance, algorithm="hull")
+    assert hull.splits == scan.splits == len(zigzag_points) - 2
+    assert hull.max_depth == scan.max_depth
+    assert hull.distance_evaluations < scan.distance_evaluations / 3
+
+
+def test_accumulate(wavy_points):
+    """Test recording into existing stats adds to them."""
+    with record_stats() as stats:
+        simplify_curve(wavy_points, 0.1)
+    once = counters(stats)
+    with record_stats(stats):
+        simplify_curve(wavy_points, 0.1)
+    assert counters(stats) == {
+        k: v if k == "max_depth" else 2 * v for k, v in once.items()
+    }
+
+
+def test_nested(wavy_points):
+    """Test nested blocks record into their own stats only."""
+    with record_stats() as outer:
+        with record_stats() as inner:
+            simplify_curve(wavy_points, 0.1)
+        assert current_stats() is outer
+    assert inner.ranges > 0
+    assert counters(outer) == counters(SimplificationStats())
@@ -0,0 +1,111 @@
+"""Test cases for the vectorized NumPy kernels behind max_distance() and
+simplify_curve()."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+from math import cos, sin
+
+from pytest import fixture, importorskip, mark
+
+from curvereduce import (
+    max_distance,
+    perpendicular_distance,
+    rank_points,
+    shortest_distance,
+    simplify_curve,
+)
+
+np = importorskip("numpy")
+
+
+@fixture
+def track_points():
+    """Fixture for a noisy 3D track long enough to use the vectorized kernels."""
+    return [
+        (cos(t / 30) * 5, sin(t / 30) * 5, t / 20 + ((t * 7919) % 13) / 100)
+        for t in range(1000)
+    ]
+
+
+@mark.parametrize("distance_function", [shortest_distance, perpendicular_distance])
+def test_max_distance_matches_pure_python(
+    wavy_points, distance_function, disable_numpy
+):
+    """Test max_distance() gives identical results with and without NumPy."""
+    vectorized = max_distance(wavy_points, distance_function)
+    disable_numpy()
+    assert vectorized == max_distance(wavy_points, distance_function)
+
+
+@mark.parametrize("distance_function", [shortest_distance, perpendicular_distance])
+@mark.parametrize("epsilon", [0.01, 0.1, 1])
+def test_simplify_curve_matches_pure_python(
+    wavy_points, distance_function, epsilon, disable_numpy
+):
+    """Test simplify_curve() gives identical results with and without NumPy."""
+    vectorized = simplify_curve(wavy_points, epsilon, distance_function)
+    disable_numpy()
+    assert vectorized == simplify_curve(wavy_points, epsilon, distance_function)
+
+
+def test_simplify_curve_array(wavy_points):
+    """Test simplify_curve() with an (N, 2) array returns an array."""
+    expected = simplify_curve(wavy_points, 0.1)
+    simplified = simplify_curve(np.array(wavy_points), 0.1)
+    assert isinstance(simplified, np.ndarray)
+    assert simplified.tolist() == [list(p) for p in expected]
+
+
+def test_shortest_distance_clamped():
+    """Test the vectorized shortest distance clamps to the segment ends."""
+    points = np.array([(0, 0), (-3, 4), (1, 1), (5, 3), (2, 0)], dtype=float)
+    distance = max_distance(points, shortest_distance)
+    assert distance == (5.0, 1)
+
+
+def test_custom_function_array():
+    """Test max_distance() with an array and a custom function."""
+    points = np.array([(-2, 4), (0, 2), (0, 0), (2, 0)], dtype=float)
+    distance = max_distance(points, lambda p, a, b: 42)
+    assert distance == (42, 1)
+
+
+def test_pure_python_fallback(wavy_points, pure_python):
+    """Test simplify_curve() works with NumPy disabled."""
+    simplified = simplify_curve(wavy_points, 10)
+    assert simplified == [wavy_points[0], wavy_points[-1]]
+
+
+@mark.parametrize("distance_function", [shortest_distance, perpendicular_distance])
+def test_rank_points_matches_pure_python(wavy_points, distance_function, disable_numpy):
+    """Test rank_points() gives identical results with and without NumPy."""
+    vectorized = rank_points(wavy_points, distance_function)
+    disable_numpy()
+    assert vectorized == rank_points(wavy_points, distance_function)
+
+
+@mark.parametrize("distance_function", [shortest_distance, perpendicular_distance])
+def test_3d_matches_pure_python(track_points, distance_function, disable_numpy):
+    """Test the kernels give identical results with and without NumPy for 3D
+    points."""
+    vectorized = (
+        max_distance(track_points, distance_function),
+        simplify_curve(track_points, 0.1, distance_function),
+        rank_points(track_points, distance_function),
+    )
+    disable_numpy()
+    assert vectorized == (
+        max_distance(track_points, distance_function),
+        simplify_curve(track_points, 0.1, distance_function),
+        rank_points(track_points, distance_function),
+    )
+    assert 2 < len(vectorized[1]) < len(track_points) / 2
+
+
+def test_4d_array(track_points):
+    """Test simplify_curve() with an (N, 4) array returns an array."""
+    points = [(x, y, z, i / 100) for i, (x, y, z) in enumerate(track_points)]
+    expected = simplify_curve(points, 0.1)
+    simplified = simplify_curve(np.array(points), 0.1)
+    assert isinstance(simplified, np.ndarray)
+    assert simplified.shape[1] == 4
+    assert simplified.tolist() == [list(p) for p in expected]
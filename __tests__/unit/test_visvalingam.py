@@ -0,0 +1,157 @@
+"""Test cases for the Visvalingam-Whyatt functions."""
+# pylint: disable=invalid-name,redefined-outer-name
+
+from array import array
+from random import Random
+
+from pytest import importorskip, mark, raises
+
+from curvereduce import (
+    PointArray,
+    rank_points_vw,
+    record_stats,
+    simplify_ranked,
+    simplify_ranked_to,
+    simplify_vw,
+    simplify_vw_indices,
+    simplify_vw_to,
+    simplify_vw_to_indices,
+    triangle_area,
+)
+
+
+def naive_ranking(points):
+    """Ranks the points by removing the smallest effective area one at a time,
+    measuring every point left each time. Effective areas never go below the
+    last one removed, and ties go to the first point."""
+    left = list(range(len(points)))
+    removed = []
+    floor = float("-inf")
+    while len(left) > 2:
+        area, _, k = min(
+            (
+                max(
+                    triangle_area(
+                        points[left[k - 1]], points[left[k]], points[left[k + 1]]
+                    ),
+                    floor,
+                ),
+                left[k],
+                k,
+            )
+            for k in range(1, len(left) - 1)
+        )
+        floor = area
+        removed.append((area, left.pop(k)))
+    return [(float("inf"), i) for i in left] + removed[::-1]
+
+
+def test_area_subzero():
+    """Test simplify_vw() with area < 0."""
+    with raises(ValueError, match="Area must not be a negative number."):
+        simplify_vw([], -1)
+    with raises(ValueError, match="Area must not be a negative number."):
+        simplify_vw_indices([], -1)
+
+
+def test_triangle_area():
+    """Test triangle_area() in two and three dimensions."""
+    assert triangle_area((0, 0), (4, 0), (0, 3)) == 6
+    assert triangle_area((0, 0, 1), (4, 0, 1), (0, 3, 1)) == 6
+    assert triangle_area((0, 0), (1, 1), (2, 2)) == 0
+
+
+def test_rank_by_hand():
+    """Test rank_points_vw() on a small curve."""
+    points = [(0, 0), (1, 1), (2, 0), (3, 0)]
+    assert rank_points_vw(points) == [
+        (float("inf"), 0),
+        (float("inf"), 3),
+        (1.5, 1),
+        (0.5, 2),
+    ]
+
+
+@mark.parametrize("seed", range(5))
+def test_rank_naive(seed):
+    """Test rank_points_vw() against removing points one at a time."""
+    rng = Random(seed)
+    points = [(i, rng.randint(0, 5)) for i in range(60)]
+    assert rank_points_vw(points) == naive_ranking(points)
+
+
+def test_rank_order(wavy_points):
+    """Test the effective areas never increase down the ranking."""
+    ranking = rank_points_vw(wavy_points)
+    assert sorted(i for _, i in ranking) == list(range(len(wavy_points)))
+    assert all(a >= b for (a, _), (b, _) in zip(ranking, ranking[1:]))
+
+
+@mark.parametrize("area", [0.0001, 0.01, 0.5, 100])
+def test_area(wavy_points, area):
+    """Test simplify_vw() keeps the points ranked above the area."""
+    expected = simplify_ranked(wavy_points, rank_points_vw(wavy_points), area)
+    assert simplify_vw(wavy_points, area) == expected
+
+
+@mark.parametrize("point_count", [1, 2, 3, 20, 999, 1000, 2000])
+def test_point_count(wavy_points, point_count):
+    """Test simplify_vw_to() keeps exactly the top of the ranking."""
+    expected = simplify_ranked_to(wavy_points, rank_points_vw(wavy_points), point_count)
+    simplified = simplify_vw_to(wavy_points, point_count)
+    assert len(simplified) == min(max(point_count, 2), len(wavy_points))
+    assert simplified == expected
+
+
+def test_zero_area(wavy_points):
+    """Test simplify_vw() with a zero area keeps every point."""
+    assert simplify_vw(wavy_points, 0) == wavy_points
+
+
+@mark.parametrize("points", [[], [(0, 0)], [(0, 0), (1, 1)]])
+def test_short(points):
+    """Test curves of fewer than three points are kept as is."""
+    assert simplify_vw(points, 1) == points
+    assert simplify_vw_to(points, 1) == points
+    assert [i for _, i in rank_points_vw(points)] == list(range(len(points)))
+
+
+def test_indices(wavy_points):
+    """Test the indices functions pick the points the others keep."""
+    kept = simplify_vw_indices(wavy_points, 0.01)
+    assert isinstance(kept, array)
+    assert [wavy_points[i] for i in kept] == simplify_vw(wavy_points, 0.01)
+    kept = simplify_vw_to_indices(wavy_points, 20)
+    assert [wavy_points[i] for i in kept] == simplify_vw_to(wavy_points, 20)
+
+
+def test_point_array(wavy_points):
+    """Test a PointArray comes back as a PointArray."""
+    simplified = simplify_vw(PointArray(wavy_points), 0.01)
+    assert isinstance(simplified, PointArray)
+    assert simplified.tolist() == simplify_vw(wavy_points, 0.01)
+
+
+def test_numpy(wavy_points):
+    """Test NumPy arrays come back as NumPy arrays."""
+    np = importorskip("numpy")
+    points = np.array(wavy_points)
+    simplified = simplify_vw_to(points, 20)
+    assert isinstance(simplified, np.ndarray)
+    assert simplified.tolist() == [list(p) for p in simplify_vw_to(wavy_points, 20)]
+    assert simplify_vw_indices(points, 0.01).dtype == np.int64
+
+
+def test_3d(wavy_points):
+    """Test points in a plane give the same ranking in three dimensions."""
+    points = [(x, y, 0) for x, y in wavy_points[:200]]
+    ranking = [i for _, i in rank_points_vw(points)]
+    assert ranking == [i for _, i in rank_points_vw(wavy_points[:200])]
+
+
+def test_stats(wavy_points):
+    """Test the areas measured are recorded."""
+    with record_stats() as stats:
+        simplify_vw(wavy_points, 0.01)
+    assert stats.distance_evaluations >= len(wavy_points) - 2
+    assert set(stats.phases) == {"simplify"}
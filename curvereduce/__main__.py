@@ -0,0 +1,8 @@
+"""Runs the command-line tool with `python -m curvereduce`."""
+
+import sys
+
+from .cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
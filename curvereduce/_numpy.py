@@ -0,0 +1,810 @@
+"""Vectorized NumPy implementations of the built-in distance functions and the
+Ramer-Douglas-Peucker loop. Importing this module raises `ImportError` when
+NumPy is not installed, in which case the pure-Python implementations are used.
+
+Each kernel takes the coordinates of some points and of the line points they
+are measured against, as arrays or scalars that broadcast together, and returns
+the distances. This lets the engine measure every range of one level of the
+RDP hierarchy in a single pass. The arithmetic is done in the same order as the
+scalar functions so both implementations produce identical results.
+
+Points with other than two coordinates are handled as an (N, D) array instead
+of x and y columns, which is passed to the engine as both columns, with kernels
+that only read the first one."""
+# pylint: disable=invalid-name
+
+from typing import Any, Callable, List, Optional, Tuple
+
+import numpy as np
+
+from .distance import EARTH_RADIUS
+from .points import PointArray
+from .stats import SimplificationStats
+
+Kernel = Callable[[Any, Any, Any, Any, Any, Any], Any]
+"""Type representing a vectorized distance kernel."""
+
+BATCH_POINTS = 1 << 16
+"""Maximum number of points measured in a single vectorized pass, which bounds
+the size of the temporary arrays and keeps them in the CPU cache."""
+
+LARGE_RANGE = 512
+"""Ranges with at least this many points are measured on their own, over views
+of the columns, instead of being gathered into a batch with other ranges."""
+
+
+def is_array(points: Any) -> bool:
+    """Checks whether `points` is a NumPy array.
+
+    Args:
+        points (Any): points describing the curve
+
+    Returns:
+        bool: True if `points` is a NumPy array
+    """
+    return isinstance(points, np.ndarray)
+
+
+def dimensions(points: Any) -> int:
+    """Counts the coordinates of each point.
+
+    Args:
+        points (Any): (N, D) array or sequence of points
+
+    Returns:
+        int: number of coordinates of each point, 2 if there are no points
+    """
+
+    if isinstance(points, PointArray):
+        result = 2
+    elif isinstance(points, np.ndarray):
+        result = points.shape[-1] if points.ndim == 2 else 2
+    else:
+        result = len(points[0]) if len(points) else 2
+
+    return result
+
+
+def columns(points: Any) -> Tuple[Any, Any]:
+    """Converts points to contiguous float64 x and y columns, or points with
+    other than two coordinates to a contiguous (N, D) array, returned twice.
+
+    Args:
+        points (Any): (N, D) array or sequence of points
+
+    Returns:
+        Tuple[Any, Any]: x and y columns, or the (N, D) array twice
+    """
+
+    # read a `PointArray` straight from its buffer
+    if isinstance(points, PointArray):
+        array = np.frombuffer(points.coordinates, dtype=np.float64).reshape(-1, 2)
+    else:
+        array = np.asarray(points, dtype=np.float64)
+
+    if array.ndim == 2 and array.shape[1] != 2:
+        coordinates = np.ascontiguousarray(array)
+        result = coordinates, coordinates
+    else:
+        array = array.reshape(-1, 2)
+        result = np.ascontiguousarray(array[:, 0]), np.ascontiguousarray(array[:, 1])
+
+    return result
+
+
+def perpendicular_distances(x: Any, y: Any, ax: Any, ay: Any, bx: Any, by: Any) -> Any:
+    """Vectorized `perpendicular_distance()`.
+
+    Args:
+        x (Any): point x coordinates
+        y (Any): point y coordinates
+        ax (Any): line point x coordinates
+        ay (Any): line point y coordinates
+        bx (Any): line point x coordinates
+        by (Any): line point y coordinates
+
+    Returns:
+        Any: array of distances
+    """
+
+    # sloped line (the other cases are patched in below)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (by - ay) / (bx - ax)
+        intercept = ay - (slope * ax)
+        distances = np.abs(slope * x - y + intercept) / np.sqrt(slope * slope + 1)
+
+    # vertical line
+    distances = np.where(ay == by, np.abs(y - ay), distances)
+
+    # horizontal line
+    return np.where(ax == bx, np.abs(x - ax), distances)
+
+
+def shortest_distances(x: Any, y: Any, ax: Any, ay: Any, bx: Any, by: Any) -> Any:
+    """Vectorized `shortest_distance()`.
+
+    Args:
+        x (Any): point x coordinates
+        y (Any): point y coordinates
+        ax (Any): line point x coordinates
+        ay (Any): line point y coordinates
+        bx (Any): line point x coordinates
+        by (Any): line point y coordinates
+
+    Returns:
+        Any: array of distances
+    """
+
+    dx = bx - ax
+    dy = by - ay
+    line_length_squared = np.square(ax - bx) + np.square(ay - by)
+
+    # which endpoint is each point closer to?
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = ((x - ax) * dx + (y - ay) * dy) / line_length_squared
+
+    # project every point onto the line, then clamp the projection to the
+    # endpoints; the endpoints are selected outright rather than computed, to
+    # match the scalar function (which also uses point A for zero-length lines)
+    before = (t < 0) | (line_length_squared == 0)
+    after = t > 1
+    cx = np.where(before, ax, np.where(after, bx, ax + t * dx))
+    cy = np.where(before, ay, np.where(after, by, ay + t * dy))
+
+    return np.sqrt(np.square(x - cx) + np.square(y - cy))
+
+
+def _dot(u: Any, v: Any) -> Any:
+    """Calculates the dot products of vectors along the last axis, adding the
+    products up in the same order as the scalar functions.
+
+    Args:
+        u (Any): vectors
+        v (Any): vectors
+
+    Returns:
+        Any: dot products
+    """
+
+    result = u[..., 0] * v[..., 0]
+    for k in range(1, u.shape[-1]):
+        result = result + u[..., k] * v[..., k]
+
+    return result
+
+
+def perpendicular_distances_nd(p: Any, a: Any, b: Any) -> Any:
+    """Vectorized `perpendicular_distance()` of points with other than two
+    coordinates.
+
+    Args:
+        p (Any): (N, D) point coordinates
+        a (Any): (N, D) or (D,) line point coordinates
+        b (Any): (N, D) or (D,) line point coordinates
+
+    Returns:
+        Any: array of distances
+    """
+
+    direction = b - a
+    offset = p - a
+    line_length_squared = _dot(direction, direction)
+
+    # remove the part of the offset along the line
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = _dot(offset, direction) / line_length_squared
+    t = np.where(line_length_squared == 0, 0.0, t)
+    offset = offset - np.expand_dims(t, -1) * direction
+
+    return np.sqrt(_dot(offset, offset))
+
+
+def shortest_distances_nd(p: Any, a: Any, b: Any) -> Any:
+    """Vectorized `shortest_distance()` of points with other than two
+    coordinates.
+
+    Args:
+        p (Any): (N, D) point coordinates
+        a (Any): (N, D) or (D,) line point coordinates
+        b (Any): (N, D) or (D,) line point coordinates
+
+    Returns:
+        Any: array of distances
+    """
+
+    direction = b - a
+    line_length_squared = _dot(direction, direction)
+
+    # which endpoint is each point closer to?
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = _dot(p - a, direction) / line_length_squared
+
+    # the closest point of the line, selecting the endpoints outright like the
+    # scalar function
+    before = np.expand_dims((t < 0) | (line_length_squared == 0), -1)
+    after = np.expand_dims(t > 1, -1)
+    closest = np.where(
+        before, a, np.where(after, b, a + np.expand_dims(t, -1) * direction)
+    )
+    offset = p - closest
+
+    return np.sqrt(_dot(offset, offset))
+
+
+def _unit_vectors(longitude: Any, latitude: Any) -> List[Any]:
+    """Vectorized `distance._unit_vector()`.
+
+    Args:
+        longitude (Any): longitudes in degrees
+        latitude (Any): latitudes in degrees
+
+    Returns:
+        List[Any]: x, y and z coordinates on the unit sphere
+    """
+
+    longitude = np.radians(longitude)
+    latitude = np.radians(latitude)
+    cos_latitude = np.cos(latitude)
+
+    return [
+        cos_latitude * np.cos(longitude),
+        cos_latitude * np.sin(longitude),
+        np.sin(latitude),
+    ]
+
+
+def _cross(u: List[Any], v: List[Any]) -> List[Any]:
+    """Vectorized `distance._cross()`.
+
+    Args:
+        u (List[Any]): x, y and z coordinates of vectors
+        v (List[Any]): x, y and z coordinates of vectors
+
+    Returns:
+        List[Any]: coordinates of the cross products
+    """
+    return [
+        u[1] * v[2] - u[2] * v[1],
+        u[2] * v[0] - u[0] * v[2],
+        u[0] * v[1] - u[1] * v[0],
+    ]
+
+
+def _dot3(u: List[Any], v: List[Any]) -> Any:
+    """Calculates the dot products of 3-dimensional vectors given as lists of
+    coordinates, in the same order as the scalar functions.
+
+    Args:
+        u (List[Any]): x, y and z coordinates of vectors
+        v (List[Any]): x, y and z coordinates of vectors
+
+    Returns:
+        Any: dot products
+    """
+    return u[0] * v[0] + u[1] * v[1] + u[2] * v[2]
+
+
+def _angles(u: List[Any], v: List[Any]) -> Any:
+    """Vectorized `distance._angle()`.
+
+    Args:
+        u (List[Any]): x, y and z coordinates of unit vectors
+        v (List[Any]): x, y and z coordinates of unit vectors
+
+    Returns:
+        Any: angles in radians
+    """
+
+    normal = _cross(u, v)
+    return np.arctan2(np.sqrt(_dot3(normal, normal)), _dot3(u, v))
+
+
+def _subset(values: Any, mask: Any) -> Any:
+    """Selects values with a boolean mask, unless they are a scalar that
+    applies to every element.
+
+    Args:
+        values (Any): array or scalar
+        mask (Any): boolean array
+
+    Returns:
+        Any: selected values, or the scalar
+    """
+    return np.broadcast_to(values, mask.shape)[mask] if np.ndim(values) else values
+
+
+def geodesic_distances(x: Any, y: Any, ax: Any, ay: Any, bx: Any, by: Any) -> Any:
+    """Vectorized `geodesic_distance()`, for longitudes in x and latitudes in
+    y. The results may differ from those of the scalar function in the last
+    bit, as NumPy has its own trigonometric functions.
+
+    Args:
+        x (Any): point longitudes
+        y (Any): point latitudes
+        ax (Any): line point longitudes
+        ay (Any): line point latitudes
+        bx (Any): line point longitudes
+        by (Any): line point latitudes
+
+    Returns:
+        Any: array of distances in meters
+    """
+
+    w = _unit_vectors(x, y)
+    u = _unit_vectors(ax, ay)
+    v = _unit_vectors(bx, by)
+    normal = _cross(u, v)
+    length = np.sqrt(_dot3(normal, normal))
+
+    # the cross-track distance of the points abreast of their arc
+    with np.errstate(divide="ignore", invalid="ignore"):
+        n = [c / length for c in normal]
+        abreast = (
+            (length != 0)
+            & (_dot3(_cross(n, u), w) >= 0)
+            & (_dot3(_cross(v, n), w) >= 0)
+        )
+        angles = np.arcsin(np.minimum(np.abs(_dot3(n, w)), 1.0))
+
+    # and the distance to the closer endpoint of the others, which are few
+    rest = ~abreast
+    if rest.any():
+        w, u, v = ([_subset(c, rest) for c in vector] for vector in (w, u, v))
+        to_a = _angles(w, u)
+        angles[rest] = np.where(
+            _subset(length, rest) == 0, to_a, np.minimum(to_a, _angles(w, v))
+        )
+
+    return EARTH_RADIUS * angles
+
+
+def geodesic_distances_nd(p: Any, a: Any, b: Any) -> Any:
+    """Vectorized `geodesic_distance()` of points with other than two
+    coordinates, whose further coordinates are ignored.
+
+    Args:
+        p (Any): (N, D) point coordinates
+        a (Any): (N, D) or (D,) line point coordinates
+        b (Any): (N, D) or (D,) line point coordinates
+
+    Returns:
+        Any: array of distances in meters
+    """
+    return geodesic_distances(
+        p[..., 0], p[..., 1], a[..., 0], a[..., 1], b[..., 0], b[..., 1]
+    )
+
+
+_ND_KERNELS = {
+    geodesic_distances: geodesic_distances_nd,
+    perpendicular_distances: perpendicular_distances_nd,
+    shortest_distances: shortest_distances_nd,
+}
+
+
+def coordinate_kernel(kernel: Kernel) -> Kernel:
+    """Gets the kernel measuring points with other than two coordinates that
+    matches a kernel measuring (x, y) pairs, taking the (N, D) arrays from
+    `columns()` in place of both columns.
+
+    Args:
+        kernel (Kernel): vectorized distance kernel
+
+    Returns:
+        Kernel: kernel reading the coordinates from its x arguments
+    """
+
+    measure = _ND_KERNELS[kernel]
+
+    def result(x: Any, y: Any, ax: Any, ay: Any, bx: Any, by: Any) -> Any:
+        # pylint: disable=unused-argument
+        return measure(x, ax, bx)
+
+    return result
+
+
+def joint_kernel(kernel: Kernel, epsilons: Any) -> Kernel:
+    """Wraps a kernel to measure points with one y coordinate per series,
+    sharing their x coordinate, against lines with as many. Each point gets
+    its largest distance from the line in any series, in units of that
+    series' epsilon value, so a range is broken down if any series needs it.
+
+    Args:
+        kernel (Kernel): vectorized distance kernel
+        epsilons (Any): minimum distance from the curve of each series
+
+    Returns:
+        Kernel: kernel taking y coordinates with a trailing series axis
+    """
+
+    def measure(x: Any, y: Any, ax: Any, ay: Any, bx: Any, by: Any) -> Any:
+        distances = kernel(
+            np.expand_dims(x, -1),
+            y,
+            np.expand_dims(ax, -1),
+            ay,
+            np.expand_dims(bx, -1),
+            by,
+        )
+
+        # a zero epsilon value makes any distance at all too far
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.fmax.reduce(distances / epsilons, axis=-1)
+
+    return measure
+
+
+def split_ranges(
+    xs: Any, ys: Any, starts: Any, ends: Any, kernel: Kernel
+) -> Tuple[Any, Any]:
+    """Finds the furthest point of every range in a single vectorized pass.
+    Every range must have at least one point between its endpoints.
+
+    Args:
+        xs (Any): x column
+        ys (Any): y column
+        starts (Any): index of the first point of each range
+        ends (Any): index of the last point of each range
+        kernel (Kernel): vectorized distance kernel
+
+    Returns:
+        Tuple[Any, Any]: distance and (absolute) index of the furthest point of
+            each range; the index is -1 if no distance could be compared
+    """
+
+    # lay the points between the endpoints of each range end to end
+    lengths = ends - starts - 1
+    offsets = np.zeros(len(lengths), dtype=np.int64)
+    np.cumsum(lengths[:-1], out=offsets[1:])
+    total = int(offsets[-1] + lengths[-1])
+    positions = np.arange(total, dtype=np.int64)
+    indices = positions + np.repeat(starts + 1 - offsets, lengths)
+
+    distances = kernel(
+        xs[indices],
+        ys[indices],
+        np.repeat(xs[starts], lengths, axis=0),
+        np.repeat(ys[starts], lengths, axis=0),
+        np.repeat(xs[ends], lengths, axis=0),
+        np.repeat(ys[ends], lengths, axis=0),
+    )
+
+    # the largest distance of each range (ignoring NaN, like the scalar loop),
+    # and the first point at that distance
+    furthest = np.fmax.reduceat(distances, offsets)
+    hits = distances == np.repeat(furthest, lengths)
+    first = np.minimum.reduceat(np.where(hits, positions, total), offsets)
+    found = first < total
+
+    return (
+        np.where(found, furthest, -1.0),
+        np.where(found, indices[np.minimum(first, total - 1)], -1),
+    )
+
+
+def split_piece(
+    xs: Any, ys: Any, start: int, end: int, first: int, last: int, kernel: Kernel
+) -> Tuple[float, int]:
+    """Finds the point between indices `first` and `last` (inclusive) that is
+    furthest from the line between the points at `start` and `end`, measuring
+    views of the columns against scalar line points.
+
+    Args:
+        xs (Any): x column
+        ys (Any): y column
+        start (int): index of the first point of the range
+        end (int): index of the last point of the range
+        first (int): index of the first point to measure
+        last (int): index of the last point to measure
+        kernel (Kernel): vectorized distance kernel
+
+    Returns:
+        Tuple[float, int]: distance and (absolute) index of the furthest point;
+            the index is -1 if no distance could be compared
+    """
+
+    distances = kernel(
+        xs[first : last + 1],
+        ys[first : last + 1],
+        xs[start],
+        ys[start],
+        xs[end],
+        ys[end],
+    )
+
+    # the first of the largest distances, ignoring NaN like the scalar loop
+    furthest = np.fmax.reduce(distances)
+    if furthest == furthest:
+        result = float(furthest), first + int(np.argmax(distances == furthest))
+    else:
+        result = -1.0, -1
+
+    return result
+
+
+def _split_range(
+    xs: Any, ys: Any, start: int, end: int, kernel: Kernel
+) -> Tuple[float, int]:
+    """Finds the furthest point of a single range, in pieces of at most
+    `BATCH_POINTS` points so that the temporary arrays never grow with the
+    range. The range must have at least one point between its endpoints.
+
+    Args:
+        xs (Any): x column
+        ys (Any): y column
+        start (int): index of the first point of the range
+        end (int): index of the last point of the range
+        kernel (Kernel): vectorized distance kernel
+
+    Returns:
+        Tuple[float, int]: distance and (absolute) index of the furthest point;
+            the index is -1 if no distance could be compared
+    """
+
+    distance, index = -1.0, -1
+
+    # the first of the furthest points of the pieces is the furthest point
+    for first in range(start + 1, end, BATCH_POINTS):
+        d, i = split_piece(
+            xs, ys, start, end, first, min(first + BATCH_POINTS, end) - 1, kernel
+        )
+        if i >= 0 and d > distance:
+            distance, index = d, i
+
+    return distance, index
+
+
+def _batches(starts: Any, ends: Any) -> List[slice]:
+    """Groups consecutive ranges so that each group holds about `BATCH_POINTS`
+    points.
+
+    Args:
+        starts (Any): index of the first point of each range
+        ends (Any): index of the last point of each range
+
+    Returns:
+        List[slice]: slices of the range arrays
+    """
+
+    cumulative = np.cumsum(ends - starts - 1)
+    bounds = np.searchsorted(
+        cumulative, np.arange(BATCH_POINTS, int(cumulative[-1]), BATCH_POINTS)
+    )
+    bounds = np.unique(np.concatenate(([0], bounds + 1, [len(starts)])))
+    return [slice(a, b) for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+def split_level(
+    xs: Any, ys: Any, starts: Any, ends: Any, kernel: Kernel
+) -> Tuple[Any, Any]:
+    """Finds the furthest point of every range, running `split_ranges()` over
+    small ranges in bounded batches and splitting large ones on their own.
+    Every range must have at least one point between its endpoints.
+
+    Args:
+        xs (Any): x column
+        ys (Any): y column
+        starts (Any): index of the first point of each range
+        ends (Any): index of the last point of each range
+        kernel (Kernel): vectorized distance kernel
+
+    Returns:
+        Tuple[Any, Any]: distance and index of the furthest point of each range
+    """
+
+    distances = np.empty(len(starts), dtype=np.float64)
+    indices = np.empty(len(starts), dtype=np.int64)
+
+    # large ranges on their own
+    large = ends - starts > LARGE_RANGE
+    for r in np.flatnonzero(large).tolist():
+        distances[r], indices[r] = _split_range(
+            xs, ys, int(starts[r]), int(ends[r]), kernel
+        )
+
+    # small ranges in batches
+    small = np.flatnonzero(~large)
+    if len(small):
+        for batch in _batches(starts[small], ends[small]):
+            distances[small[batch]], indices[small[batch]] = split_ranges(
+                xs, ys, starts[small[batch]], ends[small[batch]], kernel
+            )
+
+    return distances, indices
+
+
+def max_distance_between(
+    xs: Any,
+    ys: Any,
+    start: int,
+    end: int,
+    kernel: Kernel,
+    stats: Optional[SimplificationStats] = None,
+) -> Tuple[float, int]:
+    """Vectorized equivalent of the pure-Python range search: finds the point
+    between `start` and `end` that is furthest from the line between them.
+
+    Args:
+        xs (Any): x column
+        ys (Any): y column
+        start (int): index of the first point of the range
+        end (int): index of the last point of the range
+        kernel (Kernel): vectorized distance kernel
+        stats (Optional[SimplificationStats], optional): stats to count the
+            measured points in. Defaults to None.
+
+    Returns:
+        Tuple[float, int]: distance and (absolute) index of furthest point
+    """
+
+    # if we have a short range, then we have a shortcut
+    if end - start < 2:
+        result = 0.0, start
+
+    else:
+        if stats is not None:
+            stats.distance_evaluations += end - start - 1
+        distance, index = _split_range(xs, ys, start, end, kernel)
+        result = distance, start if index < 0 else index
+
+    return result
+
+
+def _count_level(
+    stats: SimplificationStats, starts: Any, ends: Any, split: Any, level: int
+) -> None:
+    """Counts the work done on one level of ranges.
+
+    Args:
+        stats (SimplificationStats): stats to count in
+        starts (Any): index of the first point of each range
+        ends (Any): index of the last point of each range
+        split (Any): boolean array, True for the ranges that are broken down
+        level (int): depth of the ranges in the hierarchy
+    """
+
+    stats.distance_evaluations += int((ends - starts - 1).sum())
+    stats.ranges += len(starts)
+    stats.splits += int(np.count_nonzero(split))
+    stats.max_depth = max(stats.max_depth, level)
+
+
+def simplify_mask(
+    xs: Any,
+    ys: Any,
+    epsilon: Any,
+    kernel: Kernel,
+    stats: Optional[SimplificationStats] = None,
+    starts: Any = None,
+    ends: Any = None,
+) -> Any:
+    """Vectorized equivalent of the pure-Python explicit-stack engine, which
+    breaks down every range of a level of the hierarchy at once.
+
+    Args:
+        xs (Any): x column
+        ys (Any): y column
+        epsilon (Any): minimum distance from the curve, or an array of the
+            minimum distance at each point
+        kernel (Kernel): vectorized distance kernel
+        stats (Optional[SimplificationStats], optional): stats to count the
+            measured points, ranges and splits in. Defaults to None.
+        starts (Any, optional): index of the first point of each curve, when
+            several curves are laid end to end in the columns. Defaults to a
+            single curve.
+        ends (Any, optional): index of the last point of each curve. Defaults
+            to a single curve.
+
+    Returns:
+        Any: boolean array, True for points that are kept
+    """
+
+    keep = np.zeros(len(xs), dtype=bool)
+
+    # ranges (by first and last index) that still need to be broken down
+    if starts is None:
+        starts = np.array([0], dtype=np.int64)
+        ends = np.array([len(xs) - 1], dtype=np.int64)
+    level = 0
+
+    # the endpoints are always kept
+    keep[starts] = keep[ends] = True
+
+    while True:
+
+        # nothing between the endpoints, so nothing to remove
+        wide = ends - starts >= 2
+        starts, ends = starts[wide], ends[wide]
+        if len(starts) == 0:
+            break
+        level += 1
+
+        distances, indices = split_level(xs, ys, starts, ends, kernel)
+
+        # keep the furthest points and break down both sides of them
+        if isinstance(epsilon, np.ndarray):
+            split = (distances > epsilon[indices]) & (indices >= 0)
+        else:
+            split = (distances > epsilon) & (indices >= 0)
+        if stats is not None:
+            _count_level(stats, starts, ends, split, level)
+        indices = indices[split]
+        keep[indices] = True
+        starts, ends = (
+            np.concatenate((starts[split], indices)),
+            np.concatenate((indices, ends[split])),
+        )
+
+    return keep
+
+
+def rank_points(
+    xs: Any,
+    ys: Any,
+    kernel: Kernel,
+    stats: Optional[SimplificationStats] = None,
+    epsilon: float = -np.inf,
+    unsplit: Optional[List[float]] = None,
+) -> Tuple[Any, Any]:
+    """Vectorized equivalent of the pure-Python ranking, which builds the
+    hierarchy one level at a time.
+
+    Args:
+        xs (Any): x column
+        ys (Any): y column
+        kernel (Kernel): vectorized distance kernel
+        stats (Optional[SimplificationStats], optional): stats to count the
+            measured points, ranges and splits in. Defaults to None.
+        epsilon (float, optional): only rank the points kept at this epsilon
+            value. Defaults to ranking every point.
+        unsplit (Optional[List[float]], optional): list to add the furthest
+            distance of every range that isn't broken down to. Defaults to
+            None.
+
+    Returns:
+        Tuple[Any, Any]: significance of each point in ranked order, and the
+            indices of the points in ranked order
+    """
+
+    significance = np.full(len(xs), -np.inf)
+    depth = np.zeros(len(xs), dtype=np.int64)
+
+    # the endpoints are always kept
+    significance[0] = significance[-1] = np.inf
+
+    starts = np.array([0], dtype=np.int64)
+    ends = np.array([len(xs) - 1], dtype=np.int64)
+    parents = np.array([np.inf])
+    level = 0
+
+    while True:
+        wide = ends - starts >= 2
+        starts, ends, parents = starts[wide], ends[wide], parents[wide]
+        if len(starts) == 0:
+            break
+        level += 1
+
+        distances, indices = split_level(xs, ys, starts, ends, kernel)
+
+        # a point is only kept while every split above it is kept too
+        found = indices >= 0
+        split = found & (distances > epsilon)
+        if unsplit is not None:
+            unsplit.extend(distances[found & ~split].tolist())
+        if stats is not None:
+            _count_level(stats, starts, ends, split, level)
+        indices = indices[split]
+        significance[indices] = np.minimum(distances[split], parents[split])
+        depth[indices] = level
+        starts, ends, parents = (
+            np.concatenate((starts[split], indices)),
+            np.concatenate((indices, ends[split])),
+            np.concatenate((significance[indices], significance[indices])),
+        )
+
+    ranked = np.arange(len(xs))
+    if epsilon > -np.inf:
+        ranked = ranked[significance > epsilon]
+
+    order = ranked[np.lexsort((ranked, depth[ranked], -significance[ranked]))]
+    return significance[order], order
@@ -0,0 +1,448 @@
+"""Simplification of many independent curves across a pool of processes."""
+# pylint: disable=invalid-name
+
+import os
+from array import array
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import partial
+from itertools import chain
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from .distance import DEFAULT_DISTANCE_FUNC, DistanceFunc, Point
+from .points import PointArray
+from .rdp import (
+    VECTORIZE_MIN_POINTS,
+    _simplify_indices,
+    _simplify_to_indices,
+    _take,
+)
+
+try:
+    from . import _numpy
+except ImportError:  # pragma: no cover
+    _numpy = None  # type: ignore
+
+BATCH_CHUNK_POINTS = 1 << 16
+"""Curves are sent to the workers in chunks of about this many points."""
+
+Chunk = Tuple[int, List[Any]]
+"""Type representing a chunk of curves and the position of its first curve."""
+
+
+def _check_target(epsilon: Optional[float], point_count: Optional[int]) -> None:
+    """Makes sure exactly one simplification target is given.
+
+    Args:
+        epsilon (Optional[float]): minimum distance from the curve
+        point_count (Optional[int]): desired number of points in the
+            simplified curve
+    """
+
+    if (epsilon is None) == (point_count is None):
+        raise ValueError("Exactly one of epsilon and point_count must be given.")
+
+    # make sure our epsilon value is not negative
+    if epsilon is not None and epsilon < 0:
+        raise ValueError("Epsilon must not be a negative number.")
+
+
+def _chunks(curves: Iterable[Any], chunk_points: int) -> Iterator[Chunk]:
+    """Groups curves into chunks of about `chunk_points` points.
+
+    Args:
+        curves (Iterable[Any]): curves to group
+        chunk_points (int): number of points per chunk
+
+    Yields:
+        Chunk: position of the first curve of the chunk, and its curves
+    """
+
+    first = 0
+    chunk: List[Any] = []
+    size = 0
+
+    for curve in curves:
+        chunk.append(curve)
+        size += len(curve)
+
+        if size >= chunk_points:
+            yield first, chunk
+            first += len(chunk)
+            chunk = []
+            size = 0
+
+    if chunk:
+        yield first, chunk
+
+
+def _pack(chunk: List[Any]) -> Tuple[array, array, array]:
+    """Packs the coordinates of a chunk of curves into a single buffer, so the
+    chunk is cheap to send to a worker.
+
+    Args:
+        chunk (List[Any]): curves to pack
+
+    Returns:
+        Tuple[array, array, array]: interleaved float64 coordinates of every
+            curve, the number of points in each curve, and the number of
+            coordinates of each of their points
+    """
+
+    coordinates = array("d")
+    lengths = array("q")
+    dimensions = array("q")
+
+    for curve in chunk:
+        if _numpy is not None and _numpy.is_array(curve):
+            coordinates.frombytes(
+                _numpy.np.ascontiguousarray(curve, dtype=float).tobytes()
+            )
+        elif isinstance(curve, PointArray):
+            coordinates.extend(curve.coordinates)
+        else:
+            coordinates.extend(chain.from_iterable(curve))
+        lengths.append(len(curve))
+        dimensions.append(len(curve[0]) if len(curve) else 2)
+
+    return coordinates, lengths, dimensions
+
+
+def _simplify_chunk(
+    coordinates: array,
+    lengths: array,
+    dimensions: array,
+    epsilon: Optional[float],
+    point_count: Optional[int],
+    distance_function: DistanceFunc,
+) -> Tuple[array, array]:
+    """Simplifies a packed chunk of curves. This runs in the worker processes.
+
+    Args:
+        coordinates (array): interleaved float64 coordinates of every curve
+        lengths (array): number of points in each curve
+        dimensions (array): number of coordinates of the points of each curve
+        epsilon (Optional[float]): minimum distance from the curve
+        point_count (Optional[int]): desired number of points in the
+            simplified curve
+        distance_function (DistanceFunc): function used for determining
+            distance
+
+    Returns:
+        Tuple[array, array]: indices of the kept points of every curve, and the
+            number of kept points of each curve
+    """
+
+    kept = array("q")
+    counts = array("q")
+
+    # a zero-copy view of the coordinates, for the vectorized kernels
+    view = _numpy.np.frombuffer(coordinates) if _numpy is not None else None
+
+    offset = 0
+    for length, d in zip(lengths, dimensions):
+        if view is not None and length >= VECTORIZE_MIN_POINTS:
+            points: Any = view[offset : offset + d * length].reshape(-1, d)
+        else:
+            flat = coordinates[offset : offset + d * length]
+            points = list(zip(*(flat[k::d] for k in range(d))))
+
+        if epsilon is not None:
+            indices = _simplify_indices(points, epsilon, distance_function)
+        else:
+            indices = _simplify_to_indices(points, point_count, distance_function)
+
+        kept.extend(indices)
+        counts.append(len(indices))
+        offset += d * length
+
+    return kept, counts
+
+
+def _run(
+    chunks: Iterator[Chunk],
+    work: Callable[..., Tuple[array, array]],
+    workers: int,
+    ordered: bool,
+) -> Iterator[Tuple[Chunk, Tuple[array, array]]]:
+    """Runs `work` on every chunk, in a pool of `workers` processes. At most
+    two chunks per worker are in flight, so `chunks` is consumed lazily.
+
+    Args:
+        chunks (Iterator[Chunk]): chunks of curves
+        work (Callable[..., Tuple[array, array]]): function to run on the
+            packed chunks
+        workers (int): number of worker processes
+        ordered (bool): yield the results in the order of the chunks, rather
+            than as they complete
+
+    Yields:
+        Tuple[Chunk, Tuple[array, array]]: chunk and its result
+    """
+
+    # no need for a pool
+    if workers == 1:
+        for chunk in chunks:
+            yield chunk, work(*_pack(chunk[1]))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque = deque()
+        submitted = {}
+
+        for chunk in chunks:
+            future = executor.submit(work, *_pack(chunk[1]))
+            pending.append(future)
+            submitted[future] = chunk
+
+            # keep the workers busy, but don't read too far ahead
+            while len(pending) >= 2 * workers:
+                yield from _collect(pending, submitted, ordered)
+
+        while pending:
+            yield from _collect(pending, submitted, ordered)
+
+
+def _collect(
+    pending: deque, submitted: dict, ordered: bool
+) -> Iterator[Tuple[Chunk, Tuple[array, array]]]:
+    """Waits for the oldest pending chunk, or for any pending chunk.
+
+    Args:
+        pending (deque): futures of the pending chunks, oldest first
+        submitted (dict): chunk of each pending future
+        ordered (bool): wait for the oldest chunk
+
+    Yields:
+        Tuple[Chunk, Tuple[array, array]]: chunk and its result
+    """
+
+    if ordered:
+        done = [pending[0]]
+    else:
+        done = list(wait(pending, return_when=FIRST_COMPLETED).done)
+
+    for future in done:
+        pending.remove(future)
+        yield submitted.pop(future), future.result()
+
+
+def _simplify_many_indices(
+    curves: Iterable[Any],
+    epsilon: Optional[float],
+    point_count: Optional[int],
+    distance_function: DistanceFunc,
+    workers: Optional[int],
+    chunk_points: int,
+    ordered: bool,
+) -> Iterator[Tuple[int, Any, array]]:
+    """Finds the kept points of many curves across a pool of worker processes.
+
+    Args:
+        curves (Iterable[Any]): curves to simplify
+        epsilon (Optional[float]): minimum distance from the curve
+        point_count (Optional[int]): desired number of points in the
+            simplified curve
+        distance_function (DistanceFunc): function used for determining
+            distance
+        workers (Optional[int]): number of worker processes
+        chunk_points (int): number of points per chunk
+        ordered (bool): yield the curves in the order of `curves`
+
+    Yields:
+        Tuple[int, Any, array]: position, curve and indices of its kept points
+    """
+
+    work = partial(
+        _simplify_chunk,
+        epsilon=epsilon,
+        point_count=point_count,
+        distance_function=distance_function,
+    )
+
+    for (first, chunk), (kept, counts) in _run(
+        _chunks(curves, chunk_points),
+        work,
+        workers or os.cpu_count() or 1,
+        ordered,
+    ):
+        offset = 0
+        for i, (curve, count) in enumerate(zip(chunk, counts)):
+            yield first + i, curve, kept[offset : offset + count]
+            offset += count
+
+
+def _simplify_many(
+    curves: Iterable[List[Point]],
+    epsilon: Optional[float],
+    point_count: Optional[int],
+    distance_function: DistanceFunc,
+    workers: Optional[int],
+    chunk_points: int,
+    ordered: bool,
+) -> Iterator[Tuple[int, List[Point]]]:
+    """Shared implementation of `simplify_many()` and
+    `simplify_many_as_completed()`.
+
+    Args:
+        curves (Iterable[List[Point]]): curves to simplify
+        epsilon (Optional[float]): minimum distance from the curve
+        point_count (Optional[int]): desired number of points in the
+            simplified curve
+        distance_function (DistanceFunc): function used for determining
+            distance
+        workers (Optional[int]): number of worker processes
+        chunk_points (int): number of points per chunk
+        ordered (bool): yield the curves in the order of `curves`
+
+    Yields:
+        Tuple[int, List[Point]]: position and simplified curve
+    """
+
+    # copy the kept points out of the original curves
+    for position, curve, kept in _simplify_many_indices(
+        curves, epsilon, point_count, distance_function, workers, chunk_points, ordered
+    ):
+        yield position, _take(curve, kept.tolist())
+
+
+def simplify_many(
+    curves: Iterable[List[Point]],
+    epsilon: Optional[float] = None,
+    point_count: Optional[int] = None,
+    distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+    workers: Optional[int] = None,
+    chunk_points: int = BATCH_CHUNK_POINTS,
+) -> List[List[Point]]:
+    """Simplifies many curves, either with an explicit epsilon value like
+    `simplify_curve()` or to a number of points like `simplify_curve_to()`,
+    across a pool of worker processes.
+
+    Curves are sent to the workers in chunks, as packed float64 coordinates,
+    and the workers only send back the indices of the kept points. The results
+    are the same as simplifying each curve on its own.
+
+    Args:
+        curves (Iterable[List[Point]]): curves to simplify
+        epsilon (Optional[float], optional): minimum distance from the curve.
+            Defaults to None.
+        point_count (Optional[int], optional): desired number of points in the
+            simplified curve. Defaults to None.
+        distance_function (DistanceFunc, optional): Function used for
+            determining distance, which must be picklable. Defaults to
+            DEFAULT_DISTANCE_FUNC.
+        workers (Optional[int], optional): number of worker processes, or 1 to
+            simplify in this process. Defaults to the number of CPUs.
+        chunk_points (int, optional): number of points per chunk. Defaults to
+            BATCH_CHUNK_POINTS.
+
+    Returns:
+        List[List[Point]]: simplified curves, in the same order as `curves`
+    """
+
+    _check_target(epsilon, point_count)
+
+    return [
+        simplified
+        for _, simplified in _simplify_many(
+            curves,
+            epsilon,
+            point_count,
+            distance_function,
+            workers,
+            chunk_points,
+            True,
+        )
+    ]
+
+
+def simplify_many_as_completed(
+    curves: Iterable[List[Point]],
+    epsilon: Optional[float] = None,
+    point_count: Optional[int] = None,
+    distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+    workers: Optional[int] = None,
+    chunk_points: int = BATCH_CHUNK_POINTS,
+) -> Iterator[Tuple[int, List[Point]]]:
+    """Same as `simplify_many()`, but yields the simplified curves as soon as
+    their chunk completes, along with their position in `curves`. Only a few
+    chunks per worker are in flight at a time, so `curves` can be a generator
+    of any length.
+
+    Args:
+        curves (Iterable[List[Point]]): curves to simplify
+        epsilon (Optional[float], optional): minimum distance from the curve.
+            Defaults to None.
+        point_count (Optional[int], optional): desired number of points in the
+            simplified curve. Defaults to None.
+        distance_function (DistanceFunc, optional): Function used for
+            determining distance, which must be picklable. Defaults to
+            DEFAULT_DISTANCE_FUNC.
+        workers (Optional[int], optional): number of worker processes, or 1 to
+            simplify in this process. Defaults to the number of CPUs.
+        chunk_points (int, optional): number of points per chunk. Defaults to
+            BATCH_CHUNK_POINTS.
+
+    Yields:
+        Tuple[int, List[Point]]: position and simplified curve
+    """
+
+    _check_target(epsilon, point_count)
+
+    return _simplify_many(
+        curves,
+        epsilon,
+        point_count,
+        distance_function,
+        workers,
+        chunk_points,
+        False,
+    )
+
+
+def simplify_many_indices(
+    curves: Iterable[List[Point]],
+    epsilon: Optional[float] = None,
+    point_count: Optional[int] = None,
+    distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+    workers: Optional[int] = None,
+    chunk_points: int = BATCH_CHUNK_POINTS,
+) -> Iterator[array]:
+    """Same as `simplify_many()`, but yields the indices of the kept points of
+    each curve, in the same order as `curves`. Only a few chunks per worker are
+    in flight at a time, so `curves` can be a generator of any length, and the
+    first results are yielded while it is still being read.
+
+    Args:
+        curves (Iterable[List[Point]]): curves to simplify
+        epsilon (Optional[float], optional): minimum distance from the curve.
+            Defaults to None.
+        point_count (Optional[int], optional): desired number of points in the
+            simplified curve. Defaults to None.
+        distance_function (DistanceFunc, optional): Function used for
+            determining distance, which must be picklable. Defaults to
+            DEFAULT_DISTANCE_FUNC.
+        workers (Optional[int], optional): number of worker processes, or 1 to
+            simplify in this process. Defaults to the number of CPUs.
+        chunk_points (int, optional): number of points per chunk. Defaults to
+            BATCH_CHUNK_POINTS.
+
+    Yields:
+        array: indices of the kept points of each curve in ascending order, as
+            an `array('q')`
+    """
+
+    _check_target(epsilon, point_count)
+
+    return (
+        kept
+        for _, _, kept in _simplify_many_indices(
+            curves,
+            epsilon,
+            point_count,
+            distance_function,
+            workers,
+            chunk_points,
+            True,
+        )
+    )
@@ -0,0 +1,512 @@
+"""Cache of simplification results, keyed by the contents of the curves."""
+# pylint: disable=invalid-name
+
+import hashlib
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .distance import DEFAULT_DISTANCE_FUNC, DistanceFunc, Point
+from .points import PointArray
+from .rdp import (
+    _as_index_array,
+    _check_arguments,
+    _simplify_indices,
+    _simplify_to_indices,
+    _take,
+)
+
+try:
+    from . import _numpy
+except ImportError:  # pragma: no cover
+    _numpy = None  # type: ignore
+
+try:
+    from importlib.metadata import version
+except ImportError:  # pragma: no cover
+    version = None  # type: ignore
+
+DEFAULT_MAX_BYTES = 64 << 20
+"""Default size of the kept indices held in memory by a `SimplificationCache`."""
+
+DISK_SUFFIX = ".idx"
+"""Suffix of the files of the on-disk tier."""
+
+FORMAT_VERSION = 1
+"""Version of the cache keys and of the files of the on-disk tier."""
+
+
+def _package_version() -> Optional[str]:
+    """Finds the installed version of the package, so results computed by
+    another version are never reused.
+
+    Returns:
+        Optional[str]: version, or None if the package isn't installed, e.g.
+            when running from a source checkout
+    """
+
+    result = None
+    if version is not None:
+        try:
+            result = version("curvereduce")
+
+        # `PackageNotFoundError` is an `ImportError`
+        except ImportError:
+            pass
+
+    return result
+
+
+PACKAGE_VERSION = _package_version()
+"""Installed version of the package, part of every cache key."""
+
+
+def _function_name(distance_function: DistanceFunc) -> Optional[str]:
+    """Names a distance function in a way that survives process restarts.
+
+    Args:
+        distance_function (DistanceFunc): function used for determining
+            distance
+
+    Returns:
+        Optional[str]: module and qualified name of the function, or None for
+            lambdas, local functions, functions of the `__main__` module and
+            other callables without a stable name
+    """
+
+    module = getattr(distance_function, "__module__", None)
+    name = getattr(distance_function, "__qualname__", None)
+
+    # `__main__` is a different module in every script that runs
+    result = None
+    if module not in (None, "__main__") and name is not None and "<" not in name:
+        result = f"{module}.{name}"
+
+    return result
+
+
+def _digest(points: Any, query: Tuple[Any, ...], function: Optional[str]) -> str:
+    """Hashes the coordinates of a curve together with the query, the version
+    of the package and the version of the cache format.
+
+    Args:
+        points (Any): points describing the curve
+        query (Tuple[Any, ...]): kind and parameters of the simplification
+        function (Optional[str]): name of the distance function, if it has one
+
+    Returns:
+        str: hex digest
+    """
+
+    if _numpy is not None and _numpy.is_array(points):
+        coordinates: Any = _numpy.np.ascontiguousarray(points, dtype=_numpy.np.float64)
+        shape = coordinates.shape
+        coordinates = coordinates.reshape(-1)
+    elif isinstance(points, PointArray):
+        coordinates = points.coordinates
+        shape = (len(points), 2)
+    else:
+        coordinates = array("d", chain.from_iterable(points))
+        shape = (len(points), len(points[0]) if len(points) else 0)
+
+    h = hashlib.blake2b(digest_size=20)
+    h.update(repr((FORMAT_VERSION, PACKAGE_VERSION, shape, query, function)).encode())
+    h.update(memoryview(coordinates).cast("B"))
+
+    return h.hexdigest()
+
+
+class SimplificationCache:
+    """Least-recently-used cache of simplification results, for servers that
+    simplify the same curves with the same parameters over and over.
+
+    Results are keyed by a hash of the coordinates of the curve, the
+    parameters and the distance function, so equal curves hit the cache
+    whatever object holds them. Only the indices of the kept points are
+    stored, at 8 bytes per kept point, and the least recently used results
+    are evicted once they take more than `max_bytes`. With a `directory`,
+    results are also written to files there, so they survive restarts, but not
+    upgrades of the package. Results of lambdas, local distance functions and
+    functions defined in `__main__`, which have no stable name, are only cached
+    in memory.
+
+    The cache can be shared between threads.
+
+    Attributes:
+        hits (int): results found in memory
+        disk_hits (int): results found on disk
+        misses (int): results computed
+        evictions (int): results evicted from memory
+        current_bytes (int): size of the results held in memory
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        directory: Optional[str] = None,
+        max_disk_bytes: Optional[int] = None,
+    ):
+        """Creates an empty cache.
+
+        Args:
+            max_bytes (int, optional): size of the results to hold in memory.
+                Defaults to DEFAULT_MAX_BYTES.
+            directory (Optional[str], optional): directory of the on-disk tier.
+                Defaults to no on-disk tier.
+            max_disk_bytes (Optional[int], optional): size of the results to
+                keep on disk, removing the least recently used files. Defaults
+                to no limit.
+        """
+
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+
+        self._entries: "OrderedDict[Tuple[str, Any], array]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # size of the on-disk tier, as far as we know
+        self._disk_bytes = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._disk_files())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def as_dict(self) -> Dict[str, int]:
+        """Exports the counters as a flat dict.
+
+        Returns:
+            Dict[str, int]: counters
+        """
+
+        with self._lock:
+            result = {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "current_bytes": self.current_bytes,
+            }
+
+        return result
+
+    def clear(self) -> None:
+        """Drops every result held in memory. The on-disk tier is left as is."""
+
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def _disk_files(self) -> List[Tuple[float, int, str]]:
+        """Lists the files of the on-disk tier.
+
+        Returns:
+            List[Tuple[float, int, str]]: time of last use, size and path of
+                each file
+        """
+
+        result = []
+
+        for entry in os.scandir(self.directory):  # type: ignore
+            if entry.name.endswith(DISK_SUFFIX):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                result.append((stat.st_mtime, stat.st_size, entry.path))
+
+        return result
+
+    def _load(self, digest: str) -> Optional[array]:
+        """Reads a result from the on-disk tier.
+
+        Args:
+            digest (str): hex digest of the curve and query
+
+        Returns:
+            Optional[array]: kept indices, or None if there is no such result
+        """
+
+        path = os.path.join(self.directory, digest + DISK_SUFFIX)  # type: ignore
+
+        data: Optional[bytes]
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+
+            # mark the file as recently used
+            os.utime(path)
+        except OSError:
+            data = None
+
+        # files are replaced whole, so an empty one holds an empty result, but
+        # files cut short don't count
+        result = None
+        if data is not None and len(data) % 8 == 0:
+            result = array("q")
+            result.frombytes(data)
+
+        return result
+
+    def _save(self, digest: str, indices: array) -> None:
+        """Writes a result to the on-disk tier, then makes room if needed.
+
+        Args:
+            digest (str): hex digest of the curve and query
+            indices (array): kept indices
+        """
+
+        path = os.path.join(self.directory, digest + DISK_SUFFIX)  # type: ignore
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        # write it under another name first, so no one reads half a file
+        try:
+            with open(temporary, "wb") as file:
+                indices.tofile(file)
+
+            # a file being replaced no longer counts
+            try:
+                replaced = os.path.getsize(path)
+            except OSError:
+                replaced = 0
+
+            os.replace(temporary, path)
+            written = len(indices) * indices.itemsize - replaced
+        except OSError:
+            written = 0
+
+        with self._lock:
+            self._disk_bytes += written
+            trim = (
+                self.max_disk_bytes is not None
+                and self._disk_bytes > self.max_disk_bytes
+            )
+
+        if trim:
+            self._trim_disk()
+
+    def _trim_disk(self) -> None:
+        """Removes the least recently used files of the on-disk tier until it
+        fits in `max_disk_bytes`."""
+
+        files = sorted(self._disk_files())
+        size = sum(size for _, size, _ in files)
+
+        for _, file_size, path in files:
+            if size <= self.max_disk_bytes:  # type: ignore
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            size -= file_size
+
+        with self._lock:
+            self._disk_bytes = size
+
+    def _store(self, key: Tuple[str, Any], indices: array) -> None:
+        """Holds a result in memory, evicting the least recently used results
+        until they all fit in `max_bytes`.
+
+        Args:
+            key (Tuple[str, Any]): hex digest and distance function
+            indices (array): kept indices
+        """
+
+        size = len(indices) * indices.itemsize
+
+        with self._lock:
+            if size <= self.max_bytes and key not in self._entries:
+                self._entries[key] = indices
+                self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted) * evicted.itemsize
+                self.evictions += 1
+
+    def _indices(
+        self,
+        points: Any,
+        query: Tuple[Any, ...],
+        distance_function: DistanceFunc,
+        compute: Callable[[], array],
+    ) -> array:
+        """Looks up a result in memory, then on disk, and computes it if it
+        isn't in either.
+
+        Args:
+            points (Any): points describing the curve
+            query (Tuple[Any, ...]): kind and parameters of the simplification
+            distance_function (DistanceFunc): function used for determining
+                distance
+            compute (Callable[[], array]): function computing the kept indices
+
+        Returns:
+            array: indices of the kept points, as an `array('q')`
+        """
+
+        name = _function_name(distance_function)
+        digest = _digest(points, query, name)
+        key = (digest, distance_function)
+        on_disk = self.directory is not None and name is not None
+
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+
+        if result is None:
+            result = self._load(digest) if on_disk else None
+
+            if result is not None:
+                with self._lock:
+                    self.disk_hits += 1
+            else:
+                result = compute()
+                with self._lock:
+                    self.misses += 1
+                if on_disk:
+                    self._save(digest, result)
+
+            self._store(key, result)
+
+        # hand out a copy, so the cached result can't be changed
+        return result[:]
+
+    def simplify_curve_indices(
+        self,
+        points: List[Point],
+        epsilon: float,
+        distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+        algorithm: str = "scan",
+    ) -> Any:
+        """Cached `simplify_curve_indices()`.
+
+        Args:
+            points (List[Point]): points describing the curve
+            epsilon (float): minimum distance from the curve
+            distance_function (DistanceFunc, optional): Function used for
+                determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+            algorithm (str, optional): "scan" or "hull". Defaults to "scan".
+
+        Returns:
+            Any: indices of the kept points in ascending order, as a NumPy
+                int64 array if `points` is a NumPy array, else as an
+                `array('q')`
+        """
+
+        _check_arguments(epsilon, distance_function, algorithm)
+
+        indices = self._indices(
+            points,
+            ("epsilon", float(epsilon), algorithm),
+            distance_function,
+            lambda: _simplify_indices(points, epsilon, distance_function, algorithm),
+        )
+
+        return _as_index_array(points, indices)
+
+    def simplify_curve_to_indices(
+        self,
+        points: List[Point],
+        point_count: int,
+        distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+        exact: bool = False,
+    ) -> Any:
+        """Cached `simplify_curve_to_indices()`.
+
+        Args:
+            points (List[Point]): points describing the curve
+            point_count (int): desired number of points in the simplified
+                curve
+            distance_function (DistanceFunc, optional): Function used for
+                determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+            exact (bool, optional): keep exactly `point_count` points. Defaults
+                to False.
+
+        Returns:
+            Any: indices of the kept points in ascending order, as a NumPy
+                int64 array if `points` is a NumPy array, else as an
+                `array('q')`
+        """
+
+        indices = self._indices(
+            points,
+            ("point_count", int(point_count), bool(exact)),
+            distance_function,
+            lambda: _simplify_to_indices(points, point_count, distance_function, exact),
+        )
+
+        return _as_index_array(points, indices)
+
+    def simplify_curve(
+        self,
+        points: List[Point],
+        epsilon: float,
+        distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+        algorithm: str = "scan",
+    ) -> List[Point]:
+        """Cached `simplify_curve()`.
+
+        Args:
+            points (List[Point]): points describing the curve
+            epsilon (float): minimum distance from the curve
+            distance_function (DistanceFunc, optional): Function used for
+                determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+            algorithm (str, optional): "scan" or "hull". Defaults to "scan".
+
+        Returns:
+            List[Point]: points describing the simplified curve
+        """
+
+        indices = self.simplify_curve_indices(
+            points, epsilon, distance_function, algorithm
+        )
+        return _take(points, indices.tolist())
+
+    def simplify_curve_to(
+        self,
+        points: List[Point],
+        point_count: int,
+        distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+        exact: bool = False,
+    ) -> List[Point]:
+        """Cached `simplify_curve_to()`.
+
+        Args:
+            points (List[Point]): points describing the curve
+            point_count (int): desired number of points in the simplified
+                curve
+            distance_function (DistanceFunc, optional): Function used for
+                determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+            exact (bool, optional): keep exactly `point_count` points. Defaults
+                to False.
+
+        Returns:
+            List[Point]: points describing the simplified curve
+        """
+
+        # like `simplify_curve_to()`, keep the endpoints even of short curves
+        if point_count < 3:
+            result = _take(points, [0, -1])
+        else:
+            indices = self.simplify_curve_to_indices(
+                points, point_count, distance_function, exact
+            )
+            result = _take(points, indices.tolist())
+
+        return result
@@ -0,0 +1,327 @@
+"""Command-line tool simplifying the curves in CSV, NDJSON and raw binary
+files."""
+# pylint: disable=invalid-name
+
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import deque
+from contextlib import contextmanager
+from itertools import groupby
+from typing import IO, Any, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .batch import simplify_many_indices
+from .distance import (
+    DistanceFunc,
+    geodesic_distance,
+    perpendicular_distance,
+    shortest_distance,
+)
+from .mapped import simplify_file, simplify_file_to
+
+DISTANCE_FUNCS: Dict[str, DistanceFunc] = {
+    "shortest": shortest_distance,
+    "perpendicular": perpendicular_distance,
+    "geodesic": geodesic_distance,
+}
+"""Distance functions by their command-line name."""
+
+FORMATS = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".bin": "binary",
+    ".npy": "binary",
+}
+"""Input formats by file suffix; other files are read as CSV."""
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Describes the command-line arguments.
+
+    Returns:
+        argparse.ArgumentParser: argument parser
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="curvereduce",
+        description="Simplifies the curves in a file with the "
+        "Ramer-Douglas-Peucker algorithm, streaming them from the input to the "
+        "output in the same format.",
+    )
+    parser.add_argument("input", help='input file, or "-" for standard input')
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help='output file, or "-" for standard output (the default)',
+    )
+
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument(
+        "-e", "--epsilon", type=float, help="minimum distance from the curve"
+    )
+    target.add_argument(
+        "-n",
+        "--point-count",
+        type=int,
+        help="desired number of points in each simplified curve",
+    )
+
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=["csv", "ndjson", "binary"],
+        help="input and output format (default: from the input file suffix, "
+        "else csv)",
+    )
+    parser.add_argument(
+        "-d",
+        "--distance",
+        choices=sorted(DISTANCE_FUNCS),
+        default="shortest",
+        help="distance function; geodesic measures longitude, latitude points in "
+        "meters (default: shortest)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="number of worker processes (default: the number of CPUs)",
+    )
+
+    text = parser.add_argument_group("CSV and NDJSON")
+    text.add_argument(
+        "--columns",
+        default="x,y",
+        help="comma-separated names of the CSV coordinate columns (default: x,y)",
+    )
+    text.add_argument(
+        "--id-column",
+        help="CSV column identifying the curve of each row; the rows of each "
+        "curve must be consecutive (default: a single curve)",
+    )
+    text.add_argument(
+        "--points-field",
+        default="points",
+        help="NDJSON field holding the points of the curve (default: points)",
+    )
+
+    binary = parser.add_argument_group("binary")
+    binary.add_argument(
+        "--dtype",
+        choices=["d", "f"],
+        default="d",
+        help="d for float64 or f for float32 coordinates (default: d)",
+    )
+    binary.add_argument(
+        "--dimensions",
+        type=int,
+        default=2,
+        help="number of coordinates of each point (default: 2)",
+    )
+
+    return parser
+
+
+@contextmanager
+def _open(path: str, mode: str, stream: Any) -> Iterator[Any]:
+    """Opens a file, or hands out a standard stream for "-".
+
+    Args:
+        path (str): path of the file, or "-"
+        mode (str): mode to open the file in
+        stream (Any): standard stream to use for "-"
+
+    Yields:
+        Any: file object
+    """
+
+    if path == "-":
+        yield stream
+    else:
+        with open(path, mode, newline=None if "b" in mode else "") as file:
+            yield file
+
+
+def _column(header: List[str], name: str) -> int:
+    """Finds a column of a CSV file.
+
+    Args:
+        header (List[str]): names of the columns
+        name (str): name of the column to find
+
+    Returns:
+        int: position of the column
+    """
+
+    if name not in header:
+        raise ValueError(f"No such column: {name}.")
+
+    return header.index(name)
+
+
+def _simplify_csv(args: argparse.Namespace, source: IO[str], output: IO[str]) -> None:
+    """Simplifies the curves of a CSV file, writing the kept rows as they are.
+
+    Args:
+        args (argparse.Namespace): command-line arguments
+        source (IO[str]): input file
+        output (IO[str]): output file
+    """
+
+    reader = csv.reader(source)
+    writer = csv.writer(output, lineterminator="\n")
+
+    # an empty file has no curves
+    header = next(reader, None)
+    if header is None:
+        return
+
+    writer.writerow(header)
+    columns = [_column(header, name) for name in args.columns.split(",")]
+    key = _column(header, args.id_column) if args.id_column else None
+    width = max(columns if key is None else columns + [key]) + 1
+
+    # rows of the curves being simplified, oldest first
+    pending: Deque[List[List[str]]] = deque()
+
+    def complete_rows() -> Iterator[List[str]]:
+        for row in filter(None, reader):
+            if len(row) < width:
+                raise ValueError(f"Line {reader.line_num} is missing columns.")
+            yield row
+
+    def curves() -> Iterator[List[Any]]:
+        for _, group in groupby(
+            complete_rows(), lambda row: None if key is None else row[key]
+        ):
+            rows = list(group)
+            pending.append(rows)
+            yield [tuple(float(row[c]) for c in columns) for row in rows]
+
+    for kept in simplify_many_indices(
+        curves(),
+        args.epsilon,
+        args.point_count,
+        DISTANCE_FUNCS[args.distance],
+        args.workers,
+    ):
+        rows = pending.popleft()
+        writer.writerows([rows[i] for i in kept])
+
+
+def _simplify_ndjson(
+    args: argparse.Namespace, source: IO[str], output: IO[str]
+) -> None:
+    """Simplifies the curves of an NDJSON file, one JSON object per line,
+    writing each object back with its points simplified.
+
+    Args:
+        args (argparse.Namespace): command-line arguments
+        source (IO[str]): input file
+        output (IO[str]): output file
+    """
+
+    field = args.points_field
+
+    # objects and points of the curves being simplified, oldest first
+    pending: Deque[Tuple[Dict[str, Any], List[Any]]] = deque()
+
+    def curves() -> Iterator[List[Any]]:
+        for number, line in enumerate(source, 1):
+            if line.strip():
+                record = json.loads(line)
+                if not isinstance(record, dict) or field not in record:
+                    raise ValueError(f"Every line must be an object with {field}.")
+
+                # check the points as they are read, so bad ones fail cleanly
+                points = record[field]
+                try:
+                    curve = [tuple(float(c) for c in p) for p in points]
+                except (TypeError, ValueError):
+                    curve = None
+                if (
+                    curve is None
+                    or not isinstance(points, list)
+                    or not all(isinstance(p, list) for p in points)
+                ):
+                    raise ValueError(f"Line {number} has an invalid point.")
+
+                pending.append((record, points))
+                yield curve
+
+    for kept in simplify_many_indices(
+        curves(),
+        args.epsilon,
+        args.point_count,
+        DISTANCE_FUNCS[args.distance],
+        args.workers,
+    ):
+        record, points = pending.popleft()
+        record[field] = [points[i] for i in kept]
+        output.write(json.dumps(record) + "\n")
+
+
+def _simplify_binary(args: argparse.Namespace, output: IO[bytes]) -> None:
+    """Simplifies the single curve of a raw binary or `.npy` file, mapped into
+    memory, writing the kept points as raw binary.
+
+    Args:
+        args (argparse.Namespace): command-line arguments
+        output (IO[bytes]): output file
+    """
+
+    if args.input == "-":
+        raise ValueError("Binary input must be a file.")
+
+    if args.epsilon is not None:
+        simplify = simplify_file
+        target: Any = args.epsilon
+    else:
+        simplify = simplify_file_to
+        target = args.point_count
+
+    simplify(
+        args.input,
+        target,
+        output,
+        DISTANCE_FUNCS[args.distance],
+        args.dtype,
+        args.dimensions,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs the command-line tool.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): command-line arguments.
+            Defaults to those of the process.
+
+    Returns:
+        int: exit status
+    """
+
+    parser = _parser()
+    args = parser.parse_args(argv)
+    suffix = os.path.splitext(args.input)[1].lower()
+    input_format = args.format or FORMATS.get(suffix, "csv")
+
+    try:
+        if input_format == "binary":
+            with _open(args.output, "wb", sys.stdout.buffer) as output:
+                _simplify_binary(args, output)
+        else:
+            simplify = _simplify_csv if input_format == "csv" else _simplify_ndjson
+            with _open(args.input, "r", sys.stdin) as source, _open(
+                args.output, "w", sys.stdout
+            ) as output:
+                simplify(args, source, output)
+
+    except (OSError, ValueError) as error:
+        parser.exit(1, f"{parser.prog}: error: {error}\n")
+
+    return 0
@@ -0,0 +1,584 @@
+"""Types and distance functions used to simplify a curve.
+
+The distance functions work with points of any number of dimensions: points
+with two coordinates, by far the most common, are measured by dedicated code,
+and other points by generic vector code. `geodesic_distance()` measures
+(longitude, latitude) points in degrees on a sphere, in meters."""
+# pylint: disable=invalid-name
+
+from math import asin, atan2, cos, radians, sin, sqrt
+from typing import Callable, Dict, List, Tuple
+
+Point = Tuple[float, ...]
+"""Type representing a generic coordinate tuple: an (x, y) pair, or more
+coordinates such as (x, y, z)."""
+
+DistanceFunc = Callable[[Point, Point, Point], float]
+"""Type representing a distance function."""
+
+DistanceIndex = Tuple[float, int]
+"""Type representing the combination of distance and index."""
+
+SegmentFunc = Callable[[Point, Point], Callable[[Point], float]]
+"""Type representing a function that takes the line points once and returns a
+function measuring points against that line."""
+
+EARTH_RADIUS = 6371008.8
+"""Mean radius of the Earth in meters, used by `geodesic_distance()`."""
+
+
+def _difference(p: Point, a: Point) -> List[float]:
+    """Calculates the vector from point `a` to point `p`.
+
+    Args:
+        p (Point): point
+        a (Point): point
+
+    Returns:
+        List[float]: coordinates of `p - a`
+    """
+    return [pi - ai for pi, ai in zip(p, a)]
+
+
+def _dot(u: List[float], v: List[float]) -> float:
+    """Calculates the dot product of two vectors.
+
+    Args:
+        u (List[float]): vector
+        v (List[float]): vector
+
+    Returns:
+        float: dot product
+    """
+    return sum(ui * vi for ui, vi in zip(u, v))
+
+
+def _perpendicular_segment_nd(a: Point, b: Point) -> Callable[[Point], float]:
+    """`perpendicular_segment()` for points with other than two coordinates:
+    measures the distance from the line through `a` and `b`, or from `a` if
+    they are the same point.
+
+    Args:
+        a (Point): line point
+        b (Point): line point
+
+    Returns:
+        Callable[[Point], float]: function taking a point and returning its
+            perpendicular distance squared
+    """
+
+    direction = _difference(b, a)
+    line_length_squared = _dot(direction, direction)
+
+    def measure(p: Point) -> float:
+        offset = _difference(p, a)
+
+        # remove the part of the offset along the line
+        if line_length_squared != 0:
+            t = _dot(offset, direction) / line_length_squared
+            offset = [oi - t * di for oi, di in zip(offset, direction)]
+
+        return _dot(offset, offset)
+
+    return measure
+
+
+def _shortest_segment_nd(a: Point, b: Point) -> Callable[[Point], float]:
+    """`shortest_segment()` for points with other than two coordinates.
+
+    Args:
+        a (Point): line point
+        b (Point): line point
+
+    Returns:
+        Callable[[Point], float]: function taking a point and returning its
+            shortest distance squared
+    """
+
+    direction = _difference(b, a)
+    line_length_squared = _dot(direction, direction)
+
+    def measure(p: Point) -> float:
+
+        # line is actually just a point
+        if line_length_squared == 0:
+            closest: Point = a
+
+        # line is really a line
+        else:
+
+            # which endpoint is the point closer to?
+            t = _dot(_difference(p, a), direction) / line_length_squared
+
+            # point P is closer to point A
+            if t < 0:
+                closest = a
+
+            # point P is closer to point B
+            elif t > 1:
+                closest = b
+
+            # somewhere in the middle
+            else:
+                closest = tuple(ai + t * di for ai, di in zip(a, direction))
+
+        offset = _difference(p, closest)
+        return _dot(offset, offset)
+
+    return measure
+
+
+def perpendicular_distance(p: Point, a: Point, b: Point) -> float:
+    """Calculates the perpendicular distance between point `p` and the line
+    intersecting points `a` and `b`.
+
+    Args:
+        p (Point): point
+        a (Point): line point
+        b (Point): line point
+
+    Returns:
+        float: perpendicular distance
+    """
+
+    # points that aren't (x, y) pairs
+    if len(a) != 2:
+        distance = sqrt(_perpendicular_segment_nd(a, b)(p))
+
+    # horizontal line
+    elif a[0] == b[0]:
+        distance = abs(p[0] - a[0])
+
+    # vertical line
+    elif a[1] == b[1]:
+        distance = abs(p[1] - a[1])
+
+    # sloped line
+    else:
+        slope = (b[1] - a[1]) / (b[0] - a[0])
+        intercept = a[1] - (slope * a[0])
+        distance = abs(slope * p[0] - p[1] + intercept) / sqrt(slope * slope + 1)
+
+    return distance
+
+
+def perpendicular_distance_squared(p: Point, a: Point, b: Point) -> float:
+    """Calculates the square of `perpendicular_distance()`, without taking any
+    square roots.
+
+    Args:
+        p (Point): point
+        a (Point): line point
+        b (Point): line point
+
+    Returns:
+        float: perpendicular distance squared
+    """
+
+    # points that aren't (x, y) pairs
+    if len(a) != 2:
+        distance_squared = _perpendicular_segment_nd(a, b)(p)
+
+    # horizontal line
+    elif a[0] == b[0]:
+        distance_squared = (p[0] - a[0]) * (p[0] - a[0])
+
+    # vertical line
+    elif a[1] == b[1]:
+        distance_squared = (p[1] - a[1]) * (p[1] - a[1])
+
+    # sloped line
+    else:
+        slope = (b[1] - a[1]) / (b[0] - a[0])
+        intercept = a[1] - (slope * a[0])
+        offset = slope * p[0] - p[1] + intercept
+        distance_squared = offset * offset / (slope * slope + 1)
+
+    return distance_squared
+
+
+def perpendicular_segment(a: Point, b: Point) -> Callable[[Point], float]:
+    """Prepares to measure points against the line intersecting points `a` and
+    `b`, computing the slope and intercept of the line only once.
+
+    Args:
+        a (Point): line point
+        b (Point): line point
+
+    Returns:
+        Callable[[Point], float]: function taking a point and returning its
+            perpendicular distance squared, times `slope ** 2 + 1` for sloped
+            lines
+    """
+
+    # points that aren't (x, y) pairs
+    if len(a) != 2:
+        return _perpendicular_segment_nd(a, b)
+
+    ax, ay = a
+
+    # horizontal line
+    if a[0] == b[0]:
+
+        def measure(p: Point) -> float:
+            return (p[0] - ax) * (p[0] - ax)
+
+    # vertical line
+    elif a[1] == b[1]:
+
+        def measure(p: Point) -> float:
+            return (p[1] - ay) * (p[1] - ay)
+
+    # sloped line
+    else:
+        slope = (b[1] - a[1]) / (b[0] - a[0])
+        intercept = a[1] - (slope * a[0])
+
+        def measure(p: Point) -> float:
+            offset = slope * p[0] - p[1] + intercept
+            return offset * offset
+
+    return measure
+
+
+def point_distance_squared(i: Point, j: Point) -> float:
+    """Calculates the square of the distance between two points
+
+    Args:
+        i (Point): point
+        j (Point): point
+
+    Returns:
+        float: distance squared
+    """
+
+    # points that aren't (x, y) pairs
+    if len(i) != 2:
+        offset = _difference(i, j)
+        return _dot(offset, offset)
+
+    dx = i[0] - j[0]
+    dy = i[1] - j[1]
+    return dx * dx + dy * dy
+
+
+def triangle_area(a: Point, b: Point, c: Point) -> float:
+    """Calculates the area of the triangle with corners `a`, `b` and `c`.
+
+    Args:
+        a (Point): corner
+        b (Point): corner
+        c (Point): corner
+
+    Returns:
+        float: area
+    """
+
+    # points that aren't (x, y) pairs, from the lengths of two sides and the
+    # angle between them
+    if len(a) != 2:
+        u = _difference(b, a)
+        v = _difference(c, a)
+        uv = _dot(u, v)
+        area = sqrt(max(_dot(u, u) * _dot(v, v) - uv * uv, 0.0)) / 2
+
+    # half the cross product of two sides
+    else:
+        area = abs((b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1])) / 2
+
+    return area
+
+
+def shortest_distance_squared(p: Point, a: Point, b: Point) -> float:
+    """Calculates the square of `shortest_distance()`, without taking any
+    square roots.
+
+    Args:
+        p (Point): point
+        a (Point): line point
+        b (Point): line point
+
+    Returns:
+        float: shortest distance squared
+    """
+
+    line_length_squared = point_distance_squared(a, b)
+
+    # points that aren't (x, y) pairs
+    if len(a) != 2:
+        distance_squared = _shortest_segment_nd(a, b)(p)
+
+    # line is actually just a point
+    elif line_length_squared == 0:
+        distance_squared = point_distance_squared(p, a)
+
+    # line is really a line
+    else:
+
+        # which endpoint is the point closer to?
+        t = (
+            (p[0] - a[0]) * (b[0] - a[0]) + (p[1] - a[1]) * (b[1] - a[1])
+        ) / line_length_squared
+
+        # point P is closer to point A
+        if t < 0:
+            distance_squared = point_distance_squared(p, a)
+
+        # point P is closer to point B
+        elif t > 1:
+            distance_squared = point_distance_squared(p, b)
+
+        # somewhere in the middle
+        else:
+            distance_squared = point_distance_squared(
+                p, (a[0] + t * (b[0] - a[0]), a[1] + t * (b[1] - a[1]))
+            )
+
+    return distance_squared
+
+
+def shortest_segment(a: Point, b: Point) -> Callable[[Point], float]:
+    """Prepares to measure points against the line segment between points `a`
+    and `b`, computing the direction and length of the segment only once.
+
+    Args:
+        a (Point): line point
+        b (Point): line point
+
+    Returns:
+        Callable[[Point], float]: function taking a point and returning its
+            shortest distance squared
+    """
+
+    # points that aren't (x, y) pairs
+    if len(a) != 2:
+        return _shortest_segment_nd(a, b)
+
+    ax, ay = a
+    bx, by = b
+    dx = b[0] - a[0]
+    dy = b[1] - a[1]
+    line_length_squared = point_distance_squared(a, b)
+
+    # line is actually just a point
+    if line_length_squared == 0:
+
+        def measure(p: Point) -> float:
+            return point_distance_squared(p, a)
+
+    # line is really a line
+    else:
+
+        def measure(p: Point) -> float:
+            px, py = p
+
+            # which endpoint is the point closer to?
+            t = ((px - ax) * dx + (py - ay) * dy) / line_length_squared
+
+            # point P is closer to point A
+            if t < 0:
+                ex, ey = px - ax, py - ay
+
+            # point P is closer to point B
+            elif t > 1:
+                ex, ey = px - bx, py - by
+
+            # somewhere in the middle
+            else:
+                ex, ey = px - (ax + t * dx), py - (ay + t * dy)
+
+            return ex * ex + ey * ey
+
+    return measure
+
+
+def shortest_distance(p: Point, a: Point, b: Point) -> float:
+    """Calculates the shortest distance between point `p` and the line segment
+    between points `a` and `b`.
+
+    Args:
+        p (Point): point
+        a (Point): line point
+        b (Point): line point
+
+    Returns:
+        float: shortest distance
+    """
+    return sqrt(shortest_distance_squared(p, a, b))
+
+
+def _unit_vector(p: Point) -> List[float]:
+    """Converts a (longitude, latitude) point in degrees to a unit vector.
+
+    Args:
+        p (Point): point
+
+    Returns:
+        List[float]: x, y and z coordinates on the unit sphere
+    """
+
+    longitude = radians(p[0])
+    latitude = radians(p[1])
+    cos_latitude = cos(latitude)
+
+    return [cos_latitude * cos(longitude), cos_latitude * sin(longitude), sin(latitude)]
+
+
+def _cross(u: List[float], v: List[float]) -> List[float]:
+    """Calculates the cross product of two 3-dimensional vectors.
+
+    Args:
+        u (List[float]): vector
+        v (List[float]): vector
+
+    Returns:
+        List[float]: cross product
+    """
+    return [
+        u[1] * v[2] - u[2] * v[1],
+        u[2] * v[0] - u[0] * v[2],
+        u[0] * v[1] - u[1] * v[0],
+    ]
+
+
+def _angle(u: List[float], v: List[float]) -> float:
+    """Calculates the angle between two unit vectors, which unlike the arc
+    cosine of their dot product is accurate for small angles.
+
+    Args:
+        u (List[float]): unit vector
+        v (List[float]): unit vector
+
+    Returns:
+        float: angle in radians
+    """
+
+    normal = _cross(u, v)
+    return atan2(sqrt(_dot(normal, normal)), _dot(u, v))
+
+
+def _geodesic_angle(a: Point, b: Point) -> Callable[[Point], float]:
+    """Prepares to measure points against the great-circle arc between points
+    `a` and `b`, converting them to unit vectors and finding the normal of the
+    arc only once.
+
+    Args:
+        a (Point): line point
+        b (Point): line point
+
+    Returns:
+        Callable[[Point], float]: function taking a point and returning its
+            angular distance from the arc, in radians
+    """
+
+    u = _unit_vector(a)
+    v = _unit_vector(b)
+    normal = _cross(u, v)
+    length = sqrt(_dot(normal, normal))
+
+    # arc is actually just a point (or the endpoints are antipodes, which
+    # don't define an arc)
+    if length == 0:
+
+        def measure(p: Point) -> float:
+            return _angle(_unit_vector(p), u)
+
+    # arc is really an arc
+    else:
+        n = [c / length for c in normal]
+
+        # the points whose projection falls between the endpoints are in front
+        # of both of these planes
+        before = _cross(n, u)
+        after = _cross(v, n)
+
+        def measure(p: Point) -> float:
+            w = _unit_vector(p)
+
+            # somewhere in the middle, at the cross-track distance
+            if _dot(before, w) >= 0 and _dot(after, w) >= 0:
+                angle = asin(min(abs(_dot(n, w)), 1.0))
+
+            # closer to one of the endpoints
+            else:
+                angle = min(_angle(w, u), _angle(w, v))
+
+            return angle
+
+    return measure
+
+
+def geodesic_segment(a: Point, b: Point) -> Callable[[Point], float]:
+    """Prepares to measure points against the great-circle arc between
+    (longitude, latitude) points `a` and `b`, computing their trigonometric
+    terms and the normal of the arc only once.
+
+    Args:
+        a (Point): line point
+        b (Point): line point
+
+    Returns:
+        Callable[[Point], float]: function taking a point and returning its
+            geodesic distance squared, divided by `EARTH_RADIUS ** 2`
+    """
+
+    angle = _geodesic_angle(a, b)
+
+    def measure(p: Point) -> float:
+        d = angle(p)
+        return d * d
+
+    return measure
+
+
+def geodesic_distance(p: Point, a: Point, b: Point) -> float:
+    """Calculates the shortest distance in meters between point `p` and the
+    great-circle arc between points `a` and `b` on a spherical Earth, for
+    (longitude, latitude) points in degrees: the cross-track distance if `p` is
+    abreast of the arc, else the distance to the closer endpoint. Further
+    coordinates, such as altitudes, are ignored.
+
+    Args:
+        p (Point): point
+        a (Point): line point
+        b (Point): line point
+
+    Returns:
+        float: geodesic distance in meters
+    """
+    return EARTH_RADIUS * _geodesic_angle(a, b)(p)
+
+
+# default to the shortest distance function
+DEFAULT_DISTANCE_FUNC: DistanceFunc = shortest_distance
+"""Default distance calculation function is `shortest_distance()`."""
+
+SQUARED_DISTANCE_FUNCS: Dict[DistanceFunc, DistanceFunc] = {
+    perpendicular_distance: perpendicular_distance_squared,
+    shortest_distance: shortest_distance_squared,
+}
+"""Squared versions of distance functions. When looking for the point furthest
+from a line, the squared version of the distance function is used to compare
+the points, and the distance function itself is only called for the few points
+whose squared distance is within `SQUARED_TOLERANCE` of the largest one, so the
+result is exactly the same. A custom distance function can opt in by adding an
+entry; the squared version must take the same arguments and return the square
+of the distance, up to rounding."""
+
+SEGMENT_DISTANCE_FUNCS: Dict[DistanceFunc, SegmentFunc] = {
+    geodesic_distance: geodesic_segment,
+    perpendicular_distance: perpendicular_segment,
+    shortest_distance: shortest_segment,
+}
+"""Segment versions of distance functions, which take the line points once and
+return a function measuring points against that line, so that whatever only
+depends on the line is computed once per range rather than once per point. They
+are preferred over `SQUARED_DISTANCE_FUNCS` and follow the same rules: the
+returned function must give the square of the distance up to rounding, or a
+constant multiple of it, and only the points that may be the furthest are
+measured again with the distance function itself. A custom distance function
+can opt in by adding an entry."""
+
+SQUARED_TOLERANCE = 1e-12
+"""Relative difference between two squared distances below which the
+distances themselves may be equal once rounded."""
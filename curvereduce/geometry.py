@@ -0,0 +1,755 @@
+"""Simplification of the LineStrings and Polygons of many geometries at once,
+read from WKB or GeoJSON without turning them into lists of points.
+
+Geometries are read in batches: the coordinates of every line and ring of a
+batch are laid end to end in flat buffers, every line and ring is simplified in
+a single call of the vectorized engine, and the kept coordinates are copied out
+in a single pass. Distances are measured in x and y only, like most GIS tools
+do; z and m values are carried along with their points.
+
+Closed lines and rings are split at their point furthest from their first
+point before they are simplified, since the line from a point to itself
+doesn't make a useful baseline, and polygon rings keep at least
+`RING_MIN_POINTS` points, so they stay valid rings."""
+# pylint: disable=invalid-name
+
+import struct
+import sys
+from array import array
+from functools import partial
+from itertools import compress
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .distance import DEFAULT_DISTANCE_FUNC, DistanceFunc, Point, point_distance_squared
+from .rdp import (
+    _check_arguments,
+    _max_distance_between,
+    _simplify_mask,
+    _vectorized_kernel,
+)
+from .stats import SimplificationStats, current_stats, phase
+
+try:
+    from . import _numpy
+except ImportError:  # pragma: no cover
+    _numpy = None  # type: ignore
+
+GeoJSON = Dict[str, Any]
+"""Type representing a GeoJSON geometry object."""
+
+GEOMETRY_BATCH_POINTS = 1 << 16
+"""Geometries are simplified in batches of about this many points."""
+
+RING_MIN_POINTS = 4
+"""Number of points polygon rings keep at least: three corners and the point
+closing the ring."""
+
+# geometry types, and the flags of the extended WKB of PostGIS
+_POINT = 1
+_LINE_STRING = 2
+_POLYGON = 3
+_COLLECTIONS = (4, 5, 6, 7)
+_EWKB_Z = 0x80000000
+_EWKB_M = 0x40000000
+_EWKB_SRID = 0x20000000
+
+Part = Tuple[Any, ...]
+"""Type representing a line or ring of a batch: where its coordinates are, its
+number of points, whether it's a polygon ring, then anything else needed to
+read its coordinates."""
+
+
+def _point_distances_squared(x: Any, y: Any, ax: Any, ay: Any, bx: Any, by: Any) -> Any:
+    """Vectorized `point_distance_squared()` from the first line point, in the
+    shape of a distance kernel.
+
+    Args:
+        x (Any): x coordinates of the points
+        y (Any): y coordinates of the points
+        ax (Any): x coordinates of the first line points
+        ay (Any): y coordinates of the first line points
+        bx (Any): x coordinates of the second line points (ignored)
+        by (Any): y coordinates of the second line points (ignored)
+
+    Returns:
+        Any: squared distances from the first line points
+    """
+    # pylint: disable=unused-argument
+    dx = x - ax
+    dy = y - ay
+    return dx * dx + dy * dy
+
+
+def _fill_ring(points: List[Point], keep: Any, distance_function: DistanceFunc) -> None:
+    """Keeps more points of a ring simplified to fewer than `RING_MIN_POINTS`
+    points: those furthest from the line between its first point and the kept
+    point furthest from that.
+
+    Args:
+        points (List[Point]): points of the ring, at least `RING_MIN_POINTS`
+        keep (Any): one flag per point, truthy for points that are kept, which
+            is updated
+        distance_function (DistanceFunc): function used for determining
+            distance
+    """
+
+    first = points[0]
+    kept = [i for i, k in enumerate(keep) if k]
+    far = points[max(kept, key=lambda i: point_distance_squared(points[i], first))]
+
+    # furthest points first, and the first of them on a tie
+    candidates = sorted(
+        (i for i, k in enumerate(keep) if not k),
+        key=lambda i: -distance_function(points[i], first, far),
+    )
+    for i in candidates[: RING_MIN_POINTS - len(kept)]:
+        keep[i] = 1
+
+
+def _part_mask(
+    points: List[Point],
+    ring: bool,
+    epsilon: float,
+    distance_function: DistanceFunc,
+    stats: Optional[SimplificationStats],
+) -> bytearray:
+    """Marks the points of a line or ring to keep with the pure-Python engine.
+
+    Args:
+        points (List[Point]): (x, y) points of the line or ring
+        ring (bool): whether it's a polygon ring
+        epsilon (float): minimum distance from the curve
+        distance_function (DistanceFunc): function used for determining
+            distance
+        stats (Optional[SimplificationStats]): stats to count the work in, if
+            recording
+
+    Returns:
+        bytearray: one byte per point, non-zero for points that are kept
+    """
+
+    count = len(points)
+    measure = partial(_max_distance_between, distance_function=distance_function)
+
+    # find the point of a closed line furthest from its first point
+    far = -1
+    if count >= RING_MIN_POINTS and points[0] == points[-1]:
+        distance = -1.0
+        for i in range(1, count - 1):
+            d = point_distance_squared(points[i], points[0])
+            if d > distance:
+                far, distance = i, d
+
+    # know when to stop
+    if epsilon == 0 or count < 3:
+        keep = bytearray(b"\x01") * count
+
+    # simplify both halves of a closed line
+    elif far >= 0:
+        before, after = points[: far + 1], points[far:]
+        keep = _simplify_mask(
+            len(before), epsilon, partial(measure, before, stats=stats), stats
+        )
+        keep += _simplify_mask(
+            len(after), epsilon, partial(measure, after, stats=stats), stats
+        )[1:]
+
+    else:
+        keep = _simplify_mask(
+            count, epsilon, partial(measure, points, stats=stats), stats
+        )
+
+    if ring and count >= RING_MIN_POINTS and sum(keep) < RING_MIN_POINTS:
+        _fill_ring(points, keep, distance_function)
+
+    return keep
+
+
+def _column_points(xs: Any, ys: Any, start: int, count: int) -> List[Point]:
+    """Turns a line or ring laid out in x and y columns into points.
+
+    Args:
+        xs (Any): x column
+        ys (Any): y column
+        start (int): index of the first point
+        count (int): number of points
+
+    Returns:
+        List[Point]: (x, y) points
+    """
+    return list(
+        zip(xs[start : start + count].tolist(), ys[start : start + count].tolist())
+    )
+
+
+def _batch_mask(
+    xs: Any,
+    ys: Any,
+    starts: Any,
+    counts: Any,
+    rings: Any,
+    epsilon: float,
+    distance_function: DistanceFunc,
+    stats: Optional[SimplificationStats],
+) -> Any:
+    """Marks the points to keep of every line and ring of a batch, laid end to
+    end in x and y columns, in a single call of the vectorized engine.
+
+    Args:
+        xs (Any): x column
+        ys (Any): y column
+        starts (Any): index of the first point of each line or ring
+        counts (Any): number of points of each line or ring
+        rings (Any): boolean array, True for polygon rings
+        epsilon (float): minimum distance from the curve
+        distance_function (DistanceFunc): function used for determining
+            distance
+        stats (Optional[SimplificationStats]): stats to count the work in, if
+            recording
+
+    Returns:
+        Any: boolean array, True for points that are kept
+    """
+
+    np = _numpy.np
+    kernel = _vectorized_kernel(xs, distance_function, 2)
+    ends = starts + counts - 1
+
+    # know when to stop
+    if epsilon == 0:
+        keep = np.ones(len(xs), dtype=bool)
+
+    # custom distance functions measure each line or ring on its own
+    elif kernel is None:
+        keep = np.zeros(len(xs), dtype=bool)
+        for start, count, ring in zip(starts.tolist(), counts.tolist(), rings.tolist()):
+            mask = _part_mask(
+                _column_points(xs, ys, start, count),
+                ring,
+                epsilon,
+                distance_function,
+                stats,
+            )
+            keep[start : start + count] = np.frombuffer(mask, dtype=bool)
+
+    else:
+
+        # split closed lines at their point furthest from their first point
+        lines = counts > 0
+        closed = np.flatnonzero(counts >= RING_MIN_POINTS)
+        closed = closed[
+            (xs[starts[closed]] == xs[ends[closed]])
+            & (ys[starts[closed]] == ys[ends[closed]])
+        ]
+        if len(closed):
+            _, far = _numpy.split_level(
+                xs, ys, starts[closed], ends[closed], _point_distances_squared
+            )
+            split = closed[far >= 0]
+            far = far[far >= 0]
+            lines[split] = False
+            first = np.concatenate((starts[lines], starts[split], far))
+            last = np.concatenate((ends[lines], far, ends[split]))
+        else:
+            first, last = starts[lines], ends[lines]
+
+        keep = _numpy.simplify_mask(xs, ys, epsilon, kernel, stats, first, last)
+
+        # give rings that collapsed a few of their points back
+        kept = np.concatenate(([0], np.cumsum(keep)))
+        collapsed = (
+            rings
+            & (counts >= RING_MIN_POINTS)
+            & (kept[starts + counts] - kept[starts] < RING_MIN_POINTS)
+        )
+        for start, count in zip(starts[collapsed].tolist(), counts[collapsed].tolist()):
+            _fill_ring(
+                _column_points(xs, ys, start, count),
+                keep[start : start + count],
+                distance_function,
+            )
+
+    return keep
+
+
+def _read_count(blob: Any, offset: int, order: str) -> int:
+    """Reads a count of points, rings or geometries out of a WKB geometry.
+
+    Args:
+        blob (Any): WKB geometry
+        offset (int): offset of the count
+        order (str): byte order, "<" or ">"
+
+    Returns:
+        int: count
+    """
+
+    if offset + 4 > len(blob):
+        raise ValueError("The WKB geometry is cut short.")
+
+    return struct.unpack_from(order + "I", blob, offset)[0]
+
+
+def _read_wkb(
+    blob: Any, offset: int, base: int, parts: List[Part], template: List[Any]
+) -> int:
+    """Reads a WKB geometry, noting where the coordinates of its lines and
+    rings are without reading them.
+
+    Args:
+        blob (Any): WKB geometry
+        offset (int): offset of the geometry in `blob`
+        base (int): offset of `blob` in the buffer of the batch
+        parts (List[Part]): lines and rings of the batch, which are added to
+            as (offset, count, ring, dimensions, big-endian) tuples
+        template (List[Any]): pieces of the simplified geometry, which are
+            added to: little-endian bytes, or the position of a line or ring in
+            `parts`, whose count and kept coordinates go there
+
+    Returns:
+        int: offset of the end of the geometry
+    """
+
+    if offset + 5 > len(blob):
+        raise ValueError("The WKB geometry is cut short.")
+    if blob[offset] not in (0, 1):
+        raise ValueError(f"Unknown WKB byte order: {blob[offset]}.")
+    order = ">" if blob[offset] == 0 else "<"
+
+    # the type, with flags for z and m values and an SRID in extended WKB
+    code = _read_count(blob, offset + 1, order)
+    template.append(struct.pack("<BI", 1, code))
+    offset += 5
+    if code & _EWKB_SRID:
+        template.append(struct.pack("<I", _read_count(blob, offset, order)))
+        offset += 4
+    kind = code & 0xFFFFFFF
+    dimensions = (
+        2
+        + bool(code & _EWKB_Z or kind // 1000 in (1, 3))
+        + bool(code & _EWKB_M or kind // 1000 in (2, 3))
+    )
+    kind %= 1000
+    size = 8 * dimensions
+
+    if kind == _POINT:
+        if offset + size > len(blob):
+            raise ValueError("The WKB geometry is cut short.")
+        coordinates = struct.unpack_from(f"{order}{dimensions}d", blob, offset)
+        template.append(struct.pack(f"<{dimensions}d", *coordinates))
+        offset += size
+
+    elif kind in (_LINE_STRING, _POLYGON):
+        rings = 1
+        if kind == _POLYGON:
+            rings = _read_count(blob, offset, order)
+            template.append(struct.pack("<I", rings))
+            offset += 4
+
+        for _ in range(rings):
+            count = _read_count(blob, offset, order)
+            offset += 4
+            if offset + count * size > len(blob):
+                raise ValueError("The WKB geometry is cut short.")
+            template.append(len(parts))
+            parts.append(
+                (base + offset, count, kind == _POLYGON, dimensions, order == ">")
+            )
+            offset += count * size
+
+    elif kind in _COLLECTIONS:
+        count = _read_count(blob, offset, order)
+        template.append(struct.pack("<I", count))
+        offset += 4
+        for _ in range(count):
+            offset = _read_wkb(blob, offset, base, parts, template)
+
+    else:
+        raise ValueError(f"Unsupported geometry type: {kind}.")
+
+    return offset
+
+
+def _doubles(data: bytes, offsets: Any, big: Any) -> Any:
+    """Reads float64 values at any byte offsets of a buffer, whatever their
+    alignment and byte order, through a few views of the buffer.
+
+    Args:
+        data (bytes): buffer
+        offsets (Any): byte offset of each value
+        big (Any): boolean array, True for big-endian values
+
+    Returns:
+        Any: float64 array of the values
+    """
+
+    np = _numpy.np
+    result = np.empty(len(offsets), dtype=np.float64)
+    shifts = offsets % 8
+
+    for dtype in ("<f8", ">f8") if big.any() else ("<f8",):
+        order = big if dtype == ">f8" else ~big
+        for shift in range(8):
+            wanted = order & (shifts == shift)
+            if wanted.any():
+                view = np.frombuffer(
+                    data, dtype=dtype, count=(len(data) - shift) // 8, offset=shift
+                )
+                result[wanted] = view[offsets[wanted] // 8]
+
+    return result
+
+
+def _simplify_wkb_batch(
+    data: bytes,
+    parts: List[Part],
+    templates: List[List[Any]],
+    epsilon: float,
+    distance_function: DistanceFunc,
+) -> List[bytes]:
+    """Simplifies the lines and rings of a batch of WKB geometries.
+
+    Args:
+        data (bytes): WKB geometries of the batch, end to end
+        parts (List[Part]): lines and rings of the batch, see `_read_wkb()`
+        templates (List[List[Any]]): pieces of each simplified geometry, see
+            `_read_wkb()`
+        epsilon (float): minimum distance from the curve
+        distance_function (DistanceFunc): function used for determining
+            distance
+
+    Returns:
+        List[bytes]: simplified geometries, as little-endian WKB
+    """
+
+    stats = current_stats()
+    pieces: List[bytes] = []
+
+    # gather the x and y columns of every line and ring, and copy the kept
+    # coordinates back out of the batch in one go
+    if _numpy is not None:
+        np = _numpy.np
+        offsets, counts, rings, dimensions, big = (
+            np.array(parts, dtype=np.int64).reshape(-1, 5).T
+        )
+        starts = np.cumsum(counts) - counts
+        total = int(counts.sum())
+        points = np.repeat(offsets - 8 * starts * dimensions, counts) + np.arange(
+            total
+        ) * np.repeat(8 * dimensions, counts)
+        point_big = np.repeat(big.astype(bool), counts)
+
+        with phase(stats, "simplify"):
+            keep = _batch_mask(
+                _doubles(data, points, point_big),
+                _doubles(data, points + 8, point_big),
+                starts,
+                counts,
+                rings.astype(bool),
+                epsilon,
+                distance_function,
+                stats,
+            )
+
+        with phase(stats, "select"):
+            kept = np.flatnonzero(keep)
+            width = np.repeat(dimensions, counts)[kept]
+            copied = np.cumsum(width) - width
+            values = _doubles(
+                data,
+                np.repeat(points[kept] - 8 * copied, width)
+                + 8 * np.arange(int(width.sum())),
+                np.repeat(point_big[kept], width),
+            )
+            coordinates = memoryview(values.astype("<f8", copy=False).tobytes())
+            cumulative = np.concatenate(([0], np.cumsum(keep)))
+            kept_counts = cumulative[starts + counts] - cumulative[starts]
+            bounds = np.concatenate(([0], np.cumsum(8 * kept_counts * dimensions)))
+            pieces = [
+                struct.pack("<I", k) + coordinates[a:b]
+                for k, a, b in zip(
+                    kept_counts.tolist(), bounds[:-1].tolist(), bounds[1:].tolist()
+                )
+            ]
+
+    # or read the coordinates of each line and ring on its own
+    else:
+        swap = sys.byteorder == "big"
+        for offset, count, ring, d, is_big in parts:
+            flat = array("d")
+            flat.frombytes(data[offset : offset + 8 * d * count])
+            if is_big != swap:
+                flat.byteswap()
+
+            with phase(stats, "simplify"):
+                keep = _part_mask(
+                    list(zip(flat[0::d], flat[1::d])),
+                    ring,
+                    epsilon,
+                    distance_function,
+                    stats,
+                )
+
+            with phase(stats, "select"):
+                kept = array("d")
+                for i in compress(range(count), keep):
+                    kept.extend(flat[i * d : (i + 1) * d])
+                if swap:
+                    kept.byteswap()
+                pieces.append(struct.pack("<I", len(kept) // d) + kept.tobytes())
+
+    return [
+        b"".join(piece if isinstance(piece, bytes) else pieces[piece] for piece in t)
+        for t in templates
+    ]
+
+
+def simplify_wkb(
+    geometries: Iterable[bytes],
+    epsilon: float,
+    distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+) -> List[bytes]:
+    """Simplifies the LineStrings and Polygons of many WKB geometries with an
+    explicit epsilon value. The coordinates are never turned into points: they
+    are read straight out of the WKB into flat columns, every line and ring of
+    a batch of geometries is simplified at once, and the kept coordinates are
+    copied back out as raw bytes.
+
+    Geometries of any type are supported, including multi-geometries and
+    geometry collections, in ISO WKB with z and m values or in the extended
+    WKB of PostGIS. Points are left as they are. The results are written in
+    little-endian byte order, whatever the byte order of the input.
+
+    Args:
+        geometries (Iterable[bytes]): WKB geometries
+        epsilon (float): minimum distance from the curve
+        distance_function (DistanceFunc, optional): Function used for
+            determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+
+    Returns:
+        List[bytes]: simplified geometries, in the same order as `geometries`
+    """
+
+    _check_arguments(epsilon, distance_function, "scan")
+
+    result: List[bytes] = []
+    blobs: List[bytes] = []
+    parts: List[Part] = []
+    templates: List[List[Any]] = []
+    size = 0
+
+    for blob in geometries:
+        template: List[Any] = []
+        if _read_wkb(blob, 0, size, parts, template) != len(blob):
+            raise ValueError("The WKB geometry has bytes after its end.")
+        blobs.append(blob)
+        templates.append(template)
+        size += len(blob)
+
+        # an (x, y) point takes 16 bytes
+        if size >= 16 * GEOMETRY_BATCH_POINTS:
+            result.extend(
+                _simplify_wkb_batch(
+                    b"".join(blobs), parts, templates, epsilon, distance_function
+                )
+            )
+            blobs, parts, templates = [], [], []
+            size = 0
+
+    if blobs:
+        result.extend(
+            _simplify_wkb_batch(
+                b"".join(blobs), parts, templates, epsilon, distance_function
+            )
+        )
+
+    return result
+
+
+def _read_geojson(geometry: Optional[GeoJSON], parts: List[Part]) -> None:
+    """Finds the lines and rings of a GeoJSON geometry.
+
+    Args:
+        geometry (Optional[GeoJSON]): GeoJSON geometry object, or None for the
+            null geometry of a feature
+        parts (List[Part]): lines and rings of the batch, which are added to
+            as (positions, count, ring) tuples
+    """
+
+    kind = None if geometry is None else geometry.get("type")
+
+    if kind == "LineString":
+        lines = [geometry["coordinates"]]
+    elif kind == "MultiLineString":
+        lines = geometry["coordinates"]
+    elif kind == "Polygon":
+        lines = geometry["coordinates"]
+    elif kind == "MultiPolygon":
+        lines = [ring for polygon in geometry["coordinates"] for ring in polygon]
+    elif geometry is None or kind in ("Point", "MultiPoint"):
+        lines = []
+    elif kind == "GeometryCollection":
+        lines = []
+        for member in geometry["geometries"]:
+            _read_geojson(member, parts)
+    else:
+        raise ValueError(f"Unsupported geometry type: {kind}.")
+
+    ring = kind in ("Polygon", "MultiPolygon")
+    parts.extend((line, len(line), ring) for line in lines)
+
+
+def _write_geojson(
+    geometry: Optional[GeoJSON], lines: Iterator[List[Any]]
+) -> Optional[GeoJSON]:
+    """Copies a GeoJSON geometry with its lines and rings replaced.
+
+    Args:
+        geometry (Optional[GeoJSON]): GeoJSON geometry object, or None for the
+            null geometry of a feature
+        lines (Iterator[List[Any]]): positions of the simplified lines and
+            rings, in the order `_read_geojson()` found them
+
+    Returns:
+        Optional[GeoJSON]: simplified geometry, or None for a null geometry
+    """
+
+    # null geometries stay null
+    if geometry is None:
+        return None
+
+    kind = geometry["type"]
+    result = dict(geometry)
+
+    if kind == "LineString":
+        result["coordinates"] = next(lines)
+    elif kind in ("MultiLineString", "Polygon"):
+        result["coordinates"] = [next(lines) for _ in geometry["coordinates"]]
+    elif kind == "MultiPolygon":
+        result["coordinates"] = [
+            [next(lines) for _ in polygon] for polygon in geometry["coordinates"]
+        ]
+    elif kind == "GeometryCollection":
+        result["geometries"] = [
+            _write_geojson(g, lines) for g in geometry["geometries"]
+        ]
+
+    return result
+
+
+def _simplify_geojson_batch(
+    geometries: List[Optional[GeoJSON]],
+    parts: List[Part],
+    epsilon: float,
+    distance_function: DistanceFunc,
+) -> List[Optional[GeoJSON]]:
+    """Simplifies the lines and rings of a batch of GeoJSON geometries.
+
+    Args:
+        geometries (List[Optional[GeoJSON]]): GeoJSON geometry objects, or
+            None for null geometries
+        parts (List[Part]): lines and rings of the batch, see
+            `_read_geojson()`
+        epsilon (float): minimum distance from the curve
+        distance_function (DistanceFunc): function used for determining
+            distance
+
+    Returns:
+        List[Optional[GeoJSON]]: simplified geometries
+    """
+
+    stats = current_stats()
+    flags: List[Any] = []
+
+    with phase(stats, "simplify"):
+
+        # gather the x and y columns of every line and ring
+        if _numpy is not None:
+            np = _numpy.np
+            counts = np.array([p[1] for p in parts], dtype=np.int64)
+            starts = np.cumsum(counts) - counts
+            total = int(counts.sum())
+            xs = np.fromiter((q[0] for p in parts for q in p[0]), np.float64, total)
+            ys = np.fromiter((q[1] for p in parts for q in p[0]), np.float64, total)
+            keep = _batch_mask(
+                xs,
+                ys,
+                starts,
+                counts,
+                np.array([p[2] for p in parts], dtype=bool),
+                epsilon,
+                distance_function,
+                stats,
+            ).tolist()
+            flags = [keep[s : s + c] for s, c in zip(starts.tolist(), counts.tolist())]
+
+        else:
+            flags = [
+                _part_mask(
+                    [(q[0], q[1]) for q in positions],
+                    ring,
+                    epsilon,
+                    distance_function,
+                    stats,
+                )
+                for positions, _, ring in parts
+            ]
+
+    # keep the positions of the input, rather than copies
+    with phase(stats, "select"):
+        lines = iter([list(compress(p[0], f)) for p, f in zip(parts, flags)])
+        result = [_write_geojson(g, lines) for g in geometries]
+
+    return result
+
+
+def simplify_geojson(
+    geometries: Iterable[Optional[GeoJSON]],
+    epsilon: float,
+    distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+) -> List[Optional[GeoJSON]]:
+    """Simplifies the LineStrings and Polygons of many GeoJSON geometry objects
+    with an explicit epsilon value. The coordinates of every line and ring of
+    a batch of geometries are gathered into flat columns and simplified at
+    once, and the simplified geometries reuse the positions of the input.
+
+    Geometries of any type are supported, including multi-geometries and
+    geometry collections; points and null geometries (None) are left as they
+    are. The input geometries are not changed.
+
+    Args:
+        geometries (Iterable[Optional[GeoJSON]]): GeoJSON geometry objects, or
+            None for null geometries
+        epsilon (float): minimum distance from the curve
+        distance_function (DistanceFunc, optional): Function used for
+            determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+
+    Returns:
+        List[Optional[GeoJSON]]: simplified geometries, in the same order as
+            `geometries`
+    """
+
+    _check_arguments(epsilon, distance_function, "scan")
+
+    result: List[Optional[GeoJSON]] = []
+    batch: List[Optional[GeoJSON]] = []
+    parts: List[Part] = []
+    points = 0
+
+    for geometry in geometries:
+        first = len(parts)
+        _read_geojson(geometry, parts)
+        batch.append(geometry)
+        points += sum(part[1] for part in parts[first:])
+
+        if points >= GEOMETRY_BATCH_POINTS:
+            result.extend(
+                _simplify_geojson_batch(batch, parts, epsilon, distance_function)
+            )
+            batch, parts = [], []
+            points = 0
+
+    if batch:
+        result.extend(_simplify_geojson_batch(batch, parts, epsilon, distance_function))
+
+    return result
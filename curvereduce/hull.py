@@ -0,0 +1,227 @@
+"""Convex hull tree used to find the point furthest from a line in any range of
+a curve without measuring every point of the range.
+
+The curve is cut into blocks of `LEAF_SIZE` points, and a segment tree is built
+over the blocks, holding the upper and lower convex hull of the points under
+each node. The point of a range furthest from a line is either in one of the
+(at most two) partial blocks at the ends of the range, which are measured
+directly, or is an extreme vertex of the hull of one of the O(log n) nodes that
+cover the rest of the range, which is found with a binary search. This makes
+each query O(log^2 n) whatever the shape of the curve, so the whole
+simplification is O(n log^2 n) even when every split only peels off a single
+point."""
+# pylint: disable=invalid-name
+
+from typing import List, Optional, Sequence, Tuple
+
+from .distance import DistanceIndex, Point, perpendicular_distance
+from .stats import SimplificationStats
+
+LEAF_SIZE = 32
+"""Number of points in each block of the hull tree."""
+
+Hull = Tuple[List[int], List[int]]
+"""Type representing the upper and lower hulls of some points, as indices of
+the points sorted by x."""
+
+
+def _cross(o: Point, a: Point, b: Point) -> float:
+    """Calculates the z component of the cross product of `oa` and `ob`.
+
+    Args:
+        o (Point): origin
+        a (Point): point
+        b (Point): point
+
+    Returns:
+        float: cross product, positive if `oab` turns counter-clockwise
+    """
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _hull(points: Sequence[Point], order: List[int]) -> Hull:
+    """Builds the upper and lower hulls of some points using the monotone chain
+    algorithm.
+
+    Args:
+        points (Sequence[Point]): points describing the curve
+        order (List[int]): indices of the points to use, sorted by x then y
+
+    Returns:
+        Hull: upper and lower hulls
+    """
+
+    upper: List[int] = []
+    lower: List[int] = []
+
+    for i in order:
+        p = points[i]
+        while len(upper) > 1 and _cross(points[upper[-2]], points[upper[-1]], p) >= 0:
+            upper.pop()
+        while len(lower) > 1 and _cross(points[lower[-2]], points[lower[-1]], p) <= 0:
+            lower.pop()
+        upper.append(i)
+        lower.append(i)
+
+    return upper, lower
+
+
+class HullTree:
+    """Segment tree of convex hulls over the blocks of a curve."""
+
+    def __init__(
+        self,
+        points: Sequence[Point],
+        leaf_size: int = LEAF_SIZE,
+        stats: Optional[SimplificationStats] = None,
+    ):
+        """Builds the tree in O(n log n).
+
+        Args:
+            points (Sequence[Point]): points describing the curve
+            leaf_size (int, optional): number of points in each block.
+                Defaults to LEAF_SIZE.
+            stats (Optional[SimplificationStats], optional): stats to count
+                the measured points in. Defaults to None.
+        """
+
+        self.points = points
+        self.leaf_size = leaf_size
+        self.stats = stats
+
+        # each level holds the hulls of twice as many blocks as the level
+        # below; the points under each node are kept sorted while building
+        def key(i: int) -> Point:
+            return points[i]
+
+        orders = [
+            sorted(range(b, min(b + leaf_size, len(points))), key=key)
+            for b in range(0, len(points), leaf_size)
+        ]
+        self.levels: List[List[Hull]] = []
+
+        while orders:
+            self.levels.append([_hull(points, order) for order in orders])
+            if len(orders) == 1:
+                break
+
+            # sorting two sorted runs is a linear-time merge
+            orders = [
+                sorted(orders[j] + orders[j + 1], key=key)
+                if j + 1 < len(orders)
+                else orders[j]
+                for j in range(0, len(orders), 2)
+            ]
+
+    def _extreme(self, hull: Hull, nx: float, ny: float) -> int:
+        """Finds the hull vertex furthest in the direction `(nx, ny)`.
+
+        Args:
+            hull (Hull): upper and lower hulls
+            nx (float): x component of the direction
+            ny (float): y component of the direction
+
+        Returns:
+            int: index of the furthest point
+        """
+
+        points = self.points
+
+        # the furthest point sideways is the first or last point of either hull
+        if ny == 0:
+            return hull[0][-1] if nx > 0 else hull[0][0]
+
+        # the furthest point upwards is on the upper hull, downwards on the
+        # lower hull
+        chain = hull[0] if ny > 0 else hull[1]
+
+        def f(i: int) -> float:
+            p = points[chain[i]]
+            return nx * p[0] + ny * p[1]
+
+        # the projection onto the direction is unimodal along the chain
+        lo, hi = 0, len(chain) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if f(mid + 1) > f(mid):
+                lo = mid + 1
+            else:
+                hi = mid
+
+        return chain[lo]
+
+    def farthest(self, start: int, end: int) -> DistanceIndex:
+        """Finds the data point between indices `start` and `end` (exclusive)
+        that is furthest away from the straight line between `points[start]`
+        and `points[end]`, using `perpendicular_distance()`.
+
+        Args:
+            start (int): index of the first point of the range
+            end (int): index of the last point of the range
+
+        Returns:
+            DistanceIndex: distance and (absolute) index of furthest point,
+                which may not be the first one on a tie
+        """
+
+        points = self.points
+        leaf_size = self.leaf_size
+        a = points[start]
+        b = points[end]
+
+        # the direction to measure in, matching the cases of
+        # `perpendicular_distance()`
+        if a[0] == b[0]:
+            nx, ny = 1.0, 0.0
+        elif a[1] == b[1]:
+            nx, ny = 0.0, 1.0
+        else:
+            nx, ny = a[1] - b[1], b[0] - a[0]
+
+        candidates: List[int] = []
+        lo, hi = start + 1, end - 1
+        first, last = lo // leaf_size, hi // leaf_size
+
+        # partial blocks at the ends are measured directly
+        if first == last or hi < lo:
+            candidates.extend(range(lo, hi + 1))
+        else:
+            candidates.extend(range(lo, (first + 1) * leaf_size))
+            candidates.extend(range(last * leaf_size, hi + 1))
+
+            # the blocks in between are covered by as few nodes as possible
+            left, right, level = first + 1, last - 1, 0
+            while left <= right:
+                if left & 1:
+                    hull = self.levels[level][left]
+                    candidates.append(self._extreme(hull, nx, ny))
+                    candidates.append(self._extreme(hull, -nx, -ny))
+                    left += 1
+                if not right & 1:
+                    hull = self.levels[level][right]
+                    candidates.append(self._extreme(hull, nx, ny))
+                    candidates.append(self._extreme(hull, -nx, -ny))
+                    right -= 1
+                left >>= 1
+                right >>= 1
+                level += 1
+
+        # distance and index of furthest point, the first candidate on a tie;
+        # points in the middle of a hull edge are never candidates, so this
+        # may not be the first point of the range at that distance
+        distance = -1.0
+        index = start
+
+        if hi < lo:
+            distance = 0.0
+
+        if self.stats is not None:
+            self.stats.distance_evaluations += len(candidates)
+
+        for i in sorted(candidates):
+            d = perpendicular_distance(points[i], a, b)
+            if d > distance:
+                distance = d
+                index = i
+
+        return distance, index
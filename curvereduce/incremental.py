@@ -0,0 +1,328 @@
+"""Re-simplification of a curve that is appended to and edited in place."""
+# pylint: disable=invalid-name
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, List, Optional, Tuple
+
+from .distance import DEFAULT_DISTANCE_FUNC, DistanceFunc, DistanceIndex, Point
+from .rdp import VECTORIZE_MIN_POINTS, _max_distance_between, _vectorized_kernel
+from .stats import SimplificationStats, current_stats, phase
+
+try:
+    from . import _numpy
+except ImportError:  # pragma: no cover
+    _numpy = None  # type: ignore
+
+
+class _Range:
+    """Range of the split hierarchy, with its furthest point and the ranges on
+    either side of it, if it was broken down."""
+
+    __slots__ = ("start", "end", "distance", "index", "left", "right")
+
+    def __init__(self, start: int, end: int, distance: float, index: int):
+        self.start = start
+        self.end = end
+        self.distance = distance
+        self.index = index
+        self.left: Optional[_Range] = None
+        self.right: Optional[_Range] = None
+
+
+class IncrementalSimplifier:
+    """Simplified version of a curve that keeps up with changes to the curve,
+    with the same result as calling `simplify_curve()` on the whole curve after
+    every change.
+
+    The split hierarchy of the last simplification is kept, with the furthest
+    point of every range. Appending points only changes the ranges ending at
+    the last point, and replacing a point only changes the ranges it is part
+    of, so the next simplification measures those ranges again and reuses
+    every other range as is, along with the points kept inside it.
+
+    With NumPy installed, the coordinates are also kept in a growing array, and
+    ranges of at least `VECTORIZE_MIN_POINTS` points are measured with the
+    vectorized kernels.
+    """
+
+    def __init__(
+        self,
+        epsilon: float,
+        points: Iterable[Point] = (),
+        distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+    ):
+        """Creates an incremental simplifier.
+
+        Args:
+            epsilon (float): minimum distance from the curve
+            points (Iterable[Point], optional): points describing the curve so
+                far. Defaults to no points.
+            distance_function (DistanceFunc, optional): Function used for
+                determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+        """
+
+        # make sure our epsilon value is not negative
+        if epsilon < 0:
+            raise ValueError("Epsilon must not be a negative number.")
+
+        self.epsilon = epsilon
+        self.distance_function = distance_function
+
+        self._points: List[Point] = []
+
+        # coordinates of the points, with room to grow, when using NumPy
+        self._coordinates: Any = None
+        self._kernel: Any = None
+
+        # split hierarchy and kept points of the last simplification, indices of
+        # the points replaced since, and whether the curve changed since
+        self._root: Optional[_Range] = None
+        self._kept = array("q")
+        self._changed: List[int] = []
+        self._stale = False
+
+        self.extend(points)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __getitem__(self, index: int) -> Point:
+        return self._points[index]
+
+    def __setitem__(self, index: int, point: Point) -> None:
+        """Replaces a point of the curve.
+
+        Args:
+            index (int): index of the point
+            point (Point): new point
+        """
+
+        if index < 0:
+            index += len(self._points)
+        self._points[index] = point
+        if self._coordinates is not None:
+            self._coordinates[index] = point
+
+        # every range the point is part of has to be measured again
+        self._changed.append(index)
+        self._stale = True
+
+    def append(self, point: Point) -> None:
+        """Adds a point to the end of the curve.
+
+        Args:
+            point (Point): next point of the curve
+        """
+        self.extend((point,))
+
+    def extend(self, points: Iterable[Point]) -> None:
+        """Adds several points to the end of the curve.
+
+        Args:
+            points (Iterable[Point]): next points of the curve
+        """
+
+        count = len(self._points)
+        self._points.extend(points)
+
+        if len(self._points) > count:
+            self._stale = True
+            if _numpy is not None:
+                self._store(count)
+
+    def _store(self, first: int) -> None:
+        """Copies the coordinates of the points from index `first` on into the
+        coordinate array, growing it if needed.
+
+        Args:
+            first (int): index of the first new point
+        """
+
+        np = _numpy.np
+        count = len(self._points)
+
+        if self._coordinates is None:
+            dimensions = len(self._points[0])
+            self._coordinates = np.empty((count, dimensions), dtype=np.float64)
+            self._kernel = _vectorized_kernel(
+                self._coordinates, self.distance_function, dimensions
+            )
+
+        # at least double the size, so appends take amortized constant time
+        elif count > len(self._coordinates):
+            grown = np.empty(
+                (max(count, 2 * len(self._coordinates)), self._coordinates.shape[1]),
+                dtype=np.float64,
+            )
+            grown[:first] = self._coordinates[:first]
+            self._coordinates = grown
+
+        self._coordinates[first:count] = self._points[first:count]
+
+    def _farthest(
+        self, start: int, end: int, stats: Optional[SimplificationStats]
+    ) -> DistanceIndex:
+        """Measures the furthest point of a range.
+
+        Args:
+            start (int): index of the first point of the range
+            end (int): index of the last point of the range
+            stats (Optional[SimplificationStats]): stats to count the measured
+                points in, if recording
+
+        Returns:
+            DistanceIndex: distance and (absolute) index of the furthest point
+        """
+
+        if self._kernel is not None and end - start >= VECTORIZE_MIN_POINTS:
+            if self._coordinates.shape[1] == 2:
+                xs, ys = self._coordinates[:, 0], self._coordinates[:, 1]
+            else:
+                xs = ys = self._coordinates
+            result = _numpy.max_distance_between(
+                xs, ys, start, end, self._kernel, stats
+            )
+        else:
+            result = _max_distance_between(
+                self._points, start, end, self.distance_function, stats
+            )
+
+        return result
+
+    def _find(self, start: int, end: int) -> Optional[_Range]:
+        """Looks up a range of the previous split hierarchy that can be reused,
+        because none of its points changed since.
+
+        Args:
+            start (int): index of the first point of the range
+            end (int): index of the last point of the range
+
+        Returns:
+            Optional[_Range]: the range, or None if it has to be measured
+        """
+
+        node = self._root
+
+        # follow the splits down to the range
+        while node is not None and (node.start != start or node.end != end):
+            if end <= node.index:
+                node = node.left
+            elif start >= node.index:
+                node = node.right
+            else:
+                node = None
+
+        # no point of the range (or its sub-ranges) may have been replaced
+        if node is not None:
+            changed = self._changed
+            if bisect_left(changed, start) != bisect_right(changed, end):
+                node = None
+
+        return node
+
+    def _simplify(self) -> array:
+        """Runs the Ramer-Douglas-Peucker algorithm over the curve, measuring
+        only the ranges of the split hierarchy that changed. The curve must
+        have at least three points, and epsilon must be greater than zero.
+
+        Returns:
+            array: indices of the kept points, as an `array('q')`
+        """
+
+        count = len(self._points)
+        previous = self._kept
+        stats = current_stats()
+        self._changed.sort()
+
+        # kept points by position, and the previously kept points inside the
+        # reused ranges
+        pieces: List[Tuple[int, int, Any]] = []
+
+        # ranges (by first and last index, and depth in the hierarchy) that
+        # still need to be broken down, and where to link them in
+        root = _Range(0, 0, 0.0, 0)
+        stack = [(root, "left", 0, count - 1, 1)]
+
+        while stack:
+            parent, side, start, end, depth = stack.pop()
+
+            # nothing between the endpoints, so nothing to remove
+            if end - start < 2:
+                continue
+
+            node = self._find(start, end)
+
+            # the points kept inside a reused range don't change either
+            if node is not None:
+                pieces.append(
+                    (
+                        start,
+                        1,
+                        previous[
+                            bisect_right(previous, start) : bisect_left(previous, end)
+                        ],
+                    )
+                )
+
+            # measure the range, keep the furthest point if it's too far, and
+            # break down the range on either side of it
+            else:
+                d, i = self._farthest(start, end, stats)
+                node = _Range(start, end, d, i)
+
+                if stats is not None:
+                    stats.ranges += 1
+                    stats.splits += d > self.epsilon
+                    stats.max_depth = max(stats.max_depth, depth)
+
+                if d > self.epsilon:
+                    pieces.append((i, 0, (i,)))
+                    stack.append((node, "right", i, end, depth + 1))
+                    stack.append((node, "left", start, i, depth + 1))
+
+            setattr(parent, side, node)
+
+        self._root = root.left
+        self._changed = []
+
+        # the endpoints are always kept
+        result = array("q", [0])
+        for _, _, kept in sorted(pieces, key=lambda piece: piece[:2]):
+            result.extend(kept)
+        result.append(count - 1)
+
+        return result
+
+    def indices(self) -> array:
+        """Gets the indices of the points of the simplified curve.
+
+        Returns:
+            array: indices of the kept points in ascending order, as an
+                `array('q')`
+        """
+
+        if self._stale:
+            count = len(self._points)
+
+            with phase(current_stats(), "simplify"):
+
+                # know when to stop
+                if self.epsilon == 0 or count < 3:
+                    self._kept = array("q", range(count))
+                    self._root = None
+                    self._changed = []
+                else:
+                    self._kept = self._simplify()
+
+            self._stale = False
+
+        return self._kept[:]
+
+    def simplified(self) -> List[Point]:
+        """Gets the points of the simplified curve.
+
+        Returns:
+            List[Point]: points describing the simplified curve
+        """
+        return [self._points[i] for i in self.indices()]
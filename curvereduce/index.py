@@ -0,0 +1,201 @@
+"""Reusable index of a curve's Ramer-Douglas-Peucker simplifications."""
+# pylint: disable=invalid-name
+
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Any, List
+
+from .distance import DEFAULT_DISTANCE_FUNC, DistanceFunc, Point
+from .rdp import _rank, _take
+
+
+class SimplificationIndex:
+    """Significance ranking of every point of a curve, built once with
+    `rank_points()`, that can then answer simplification queries by epsilon or
+    by point count without measuring any distances.
+
+    A query keeps a prefix of the ranking, found with a binary search when
+    querying by epsilon, and sorts the k kept indices back into curve order, so
+    it costs O(log n + k log k) for a curve of n points.
+
+    The index can be serialized with `to_bytes()` and loaded again with
+    `from_bytes()`, e.g. to build it offline and query it in request handlers.
+    """
+
+    MAGIC = b"CRSI"
+    """Leading bytes of a serialized index."""
+
+    VERSION = 1
+    """Version of the serialization format."""
+
+    _HEADER = struct.Struct("<4sBQ")
+
+    def __init__(self, points: List[Point], significance: Any, order: Any):
+        """Creates an index from a ranking. Use `build()` to rank a curve.
+
+        Args:
+            points (List[Point]): points describing the curve
+            significance (Any): significance of each point, in ranked order
+            order (Any): indices of the points, in ranked order
+        """
+        self.points = points
+        self.order = array("q", order)
+
+        # negated, so it's sorted in ascending order for `bisect`
+        self._thresholds = array("d", (-s for s in significance))
+
+    @classmethod
+    def build(
+        cls,
+        points: List[Point],
+        distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+    ) -> "SimplificationIndex":
+        """Ranks the points of a curve and indexes them.
+
+        Args:
+            points (List[Point]): points describing the curve
+            distance_function (DistanceFunc, optional): Function used for
+                determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+
+        Returns:
+            SimplificationIndex: the index
+        """
+        return cls(points, *_rank(points, distance_function))
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    @property
+    def significance(self) -> List[float]:
+        """Significance of each point, in ranked order."""
+        return [-t for t in self._thresholds]
+
+    def count_at_epsilon(self, epsilon: float) -> int:
+        """Counts the points `at_epsilon()` would return.
+
+        Args:
+            epsilon (float): minimum distance from the curve
+
+        Returns:
+            int: number of points
+        """
+
+        # make sure our epsilon value is not negative
+        if epsilon < 0:
+            raise ValueError("Epsilon must not be a negative number.")
+
+        # know when to stop
+        if epsilon == 0 or len(self) < 3:
+            count = len(self)
+
+        # count the points more significant than epsilon
+        else:
+            count = bisect_left(self._thresholds, -epsilon)
+
+        return count
+
+    def at_epsilon(self, epsilon: float) -> List[Point]:
+        """Simplifies the curve with an explicit epsilon value. The result is
+        the same as `simplify_curve()` with the distance function used to build
+        the index.
+
+        Args:
+            epsilon (float): minimum distance from the curve
+
+        Returns:
+            List[Point]: points describing the simplified curve
+        """
+        return self._top(self.count_at_epsilon(epsilon))
+
+    def at_count(self, point_count: int) -> List[Point]:
+        """Simplifies the curve to exactly the desired number of data points
+        (or all of them, if there are fewer).
+
+        Args:
+            point_count (int): desired number of points in the simplified curve
+
+        Returns:
+            List[Point]: points describing the simplified curve
+        """
+        return self._top(min(max(point_count, 2), len(self)))
+
+    def _top(self, count: int) -> List[Point]:
+        """Copies out the `count` most significant points, in curve order.
+
+        Args:
+            count (int): number of points
+
+        Returns:
+            List[Point]: points describing the simplified curve
+        """
+
+        if count >= len(self):
+            result = self.points[:]
+        else:
+            result = _take(self.points, sorted(self.order[:count]))
+
+        return result
+
+    def to_bytes(self) -> bytes:
+        """Serializes the index, including the points, as little-endian
+        float64 coordinates.
+
+        Returns:
+            bytes: serialized index
+        """
+
+        if len(self.points) and len(self.points[0]) != 2:
+            raise ValueError("Only 2-dimensional curves can be serialized.")
+
+        coordinates = array("d")
+        for p in self.points:
+            coordinates.extend((float(p[0]), float(p[1])))
+
+        arrays = [coordinates, array("d", self.significance), array("q", self.order)]
+
+        # the format is little-endian
+        if sys.byteorder == "big":  # pragma: no cover
+            for a in arrays:
+                a.byteswap()
+
+        return self._HEADER.pack(self.MAGIC, self.VERSION, len(self)) + b"".join(
+            a.tobytes() for a in arrays
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SimplificationIndex":
+        """Loads an index serialized with `to_bytes()`. The points are loaded
+        as a list of (x, y) float tuples.
+
+        Args:
+            data (bytes): serialized index
+
+        Returns:
+            SimplificationIndex: the index
+        """
+
+        if len(data) < cls._HEADER.size:
+            raise ValueError("Data is not a serialized simplification index.")
+        magic, version, count = cls._HEADER.unpack_from(data)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("Data is not a serialized simplification index.")
+        if len(data) != cls._HEADER.size + count * 32:
+            raise ValueError("Serialized simplification index is truncated.")
+
+        offset = cls._HEADER.size
+        arrays = []
+        for typecode, size in (("d", 2 * count), ("d", count), ("q", count)):
+            a = array(typecode)
+            a.frombytes(data[offset : offset + size * 8])
+            offset += size * 8
+            arrays.append(a)
+
+        # the format is little-endian
+        if sys.byteorder == "big":  # pragma: no cover
+            for a in arrays:
+                a.byteswap()
+
+        coordinates, significance, order = arrays
+        return cls(list(zip(coordinates[0::2], coordinates[1::2])), significance, order)
@@ -0,0 +1,456 @@
+"""Simplification of curves stored in binary files, which are mapped into memory
+instead of being loaded."""
+# pylint: disable=invalid-name
+
+import mmap
+import os
+from array import array
+from contextlib import contextmanager
+from functools import partial
+from typing import IO, Any, Iterator, Optional, Sequence, Tuple, Union
+
+from .distance import DEFAULT_DISTANCE_FUNC, DistanceFunc, Point
+from .rdp import (
+    _as_index_array,
+    _check_arguments,
+    _kept_indices,
+    _max_distance_between,
+    _simplify_mask,
+    _vectorized_kernel,
+    simplify_curve_to_indices,
+)
+from .stats import current_stats, phase
+
+try:
+    from . import _numpy
+except ImportError:  # pragma: no cover
+    _numpy = None  # type: ignore
+
+Source = Union[str, "os.PathLike[str]"]
+"""Type representing the path of an input file."""
+
+Output = Union[str, "os.PathLike[str]", IO[bytes]]
+"""Type representing the path of an output file, or a binary file object."""
+
+NPY_SUFFIX = ".npy"
+"""Files with this suffix are read as NumPy `.npy` files."""
+
+MAPPED_CHUNK_POINTS = 1 << 20
+"""Number of points whose keep flags are scanned at a time when writing out the
+kept points or indices."""
+
+
+class _MappedPoints(Sequence[Point]):
+    """Points of a mapped file, turned into tuples one at a time for the
+    pure-Python engine."""
+
+    def __init__(self, coordinates: Any, dimensions: int):
+        """Wraps the mapped coordinates.
+
+        Args:
+            coordinates (Any): (N, D) NumPy array, or flat memoryview of the
+                coordinates of every point
+            dimensions (int): number of coordinates of each point
+        """
+        self.coordinates = coordinates
+        self.dimensions = dimensions
+
+    def __len__(self) -> int:
+        result = len(self.coordinates)
+        if isinstance(self.coordinates, memoryview):
+            result //= self.dimensions
+        return result
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(self.coordinates, memoryview):
+            # slices past the end are empty rather than raising
+            if not 0 <= index < len(self):
+                raise IndexError("point index out of range")
+            d = self.dimensions
+            result = tuple(self.coordinates[index * d : (index + 1) * d].tolist())
+        else:
+            result = tuple(self.coordinates[index].tolist())
+        return result
+
+
+@contextmanager
+def _mapped(
+    source: Source, dtype: str, dimensions: int, offset: int
+) -> Iterator[Tuple[Any, int, int]]:
+    """Maps the points of a file into memory, read only.
+
+    Args:
+        source (Source): path of the file
+        dtype (str): "d" for float64 or "f" for float32 coordinates, in native
+            byte order (ignored for `.npy` files)
+        dimensions (int): number of coordinates of each point (ignored for
+            `.npy` files)
+        offset (int): number of bytes to skip at the start of the file
+            (ignored for `.npy` files)
+
+    Yields:
+        Tuple[Any, int, int]: coordinates, as an (N, D) NumPy array if NumPy is
+            installed, else as a flat memoryview; number of points; and number
+            of coordinates of each point
+    """
+
+    # .npy files know their own shape
+    if os.fspath(source).endswith(NPY_SUFFIX):
+        if _numpy is None:
+            raise ValueError("Reading .npy files requires NumPy.")
+        coordinates = _numpy.np.load(source, mmap_mode="r")
+        if coordinates.ndim != 2:
+            raise ValueError(".npy files must hold an (N, D) array of points.")
+        yield coordinates, len(coordinates), coordinates.shape[1]
+        return
+
+    if dtype not in ("d", "f"):
+        raise ValueError(f"Unknown coordinate type: {dtype}.")
+
+    stride = array(dtype).itemsize * dimensions
+    size = os.path.getsize(source) - offset
+    if size < 0 or size % stride:
+        raise ValueError("The file must hold a whole number of points.")
+    count = size // stride
+
+    if count == 0:
+        empty = memoryview(b"").cast(dtype)
+        if _numpy is not None:
+            empty = _numpy.np.empty((0, dimensions), dtype=_numpy.np.dtype(dtype))
+        yield empty, 0, dimensions
+
+    elif _numpy is not None:
+        coordinates = _numpy.np.memmap(
+            source,
+            dtype=_numpy.np.dtype(dtype),
+            mode="r",
+            offset=offset,
+            shape=(count, dimensions),
+        )
+        yield coordinates, count, dimensions
+
+    else:
+        with open(source, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped, memoryview(mapped) as whole:
+            view = whole[offset : offset + count * stride].cast(dtype)
+            try:
+                yield view, count, dimensions
+            finally:
+                view.release()
+
+
+def _float64_kernel(kernel: Any, *arguments: Any) -> Any:
+    """Runs a vectorized kernel over float64 copies of float32 coordinates, so
+    that the distances are the same as those of the pure-Python engine.
+
+    Args:
+        kernel (Any): vectorized distance kernel
+        *arguments (Any): coordinates of the points and line points
+
+    Returns:
+        Any: array of distances
+    """
+    return kernel(*(_numpy.np.asarray(a, dtype=_numpy.np.float64) for a in arguments))
+
+
+def _file_mask(
+    coordinates: Any,
+    count: int,
+    dimensions: int,
+    epsilon: float,
+    distance_function: DistanceFunc,
+) -> Any:
+    """Marks the points of a mapped file to keep, reading only the pages of the
+    file the algorithm gets to.
+
+    Args:
+        coordinates (Any): mapped coordinates, see `_mapped()`
+        count (int): number of points
+        dimensions (int): number of coordinates of each point
+        epsilon (float): minimum distance from the curve
+        distance_function (DistanceFunc): function used for determining
+            distance
+
+    Returns:
+        Any: one flag per point, truthy for points that are kept
+    """
+
+    kernel = None
+    if _numpy is not None:
+        kernel = _vectorized_kernel(coordinates, distance_function, dimensions)
+    stats = current_stats()
+
+    with phase(stats, "simplify"):
+
+        # know when to stop
+        if epsilon == 0 or count < 3:
+            keep: Any = bytearray(b"\x01") * count
+
+        # measure views of the mapped columns, in bounded batches
+        elif kernel is not None:
+            if coordinates.dtype != _numpy.np.float64:
+                kernel = partial(_float64_kernel, kernel)
+            if dimensions == 2:
+                xs, ys = coordinates[:, 0], coordinates[:, 1]
+            else:
+                xs = ys = coordinates
+            keep = _numpy.simplify_mask(xs, ys, epsilon, kernel, stats)
+
+        else:
+            points = _MappedPoints(coordinates, dimensions)
+            keep = _simplify_mask(
+                count,
+                epsilon,
+                lambda start, end: _max_distance_between(
+                    points, start, end, distance_function, stats
+                ),
+                stats,
+            )
+
+    return keep
+
+
+@contextmanager
+def _output_file(output: Output) -> Iterator[IO[bytes]]:
+    """Opens the output file, unless it's a file object already.
+
+    Args:
+        output (Output): path of the output file, or a binary file object
+
+    Yields:
+        IO[bytes]: binary file object
+    """
+
+    if hasattr(output, "write"):
+        yield output  # type: ignore
+    else:
+        with open(output, "wb") as file:  # type: ignore
+            yield file
+
+
+def _write_points(
+    file: IO[bytes], coordinates: Any, count: int, dimensions: int, keep: Any
+) -> int:
+    """Writes the coordinates of the kept points, a chunk at a time.
+
+    Args:
+        file (IO[bytes]): binary file object
+        coordinates (Any): mapped coordinates, see `_mapped()`
+        count (int): number of points
+        dimensions (int): number of coordinates of each point
+        keep (Any): one flag per point, truthy for points that are kept
+
+    Returns:
+        int: number of points written
+    """
+
+    result = 0
+
+    for first in range(0, count, MAPPED_CHUNK_POINTS):
+        last = min(first + MAPPED_CHUNK_POINTS, count)
+
+        if isinstance(coordinates, memoryview):
+            chunk = bytearray()
+            for i in range(first, last):
+                if keep[i]:
+                    chunk += coordinates[i * dimensions : (i + 1) * dimensions]
+                    result += 1
+            file.write(chunk)
+
+        else:
+            flags = keep[first:last]
+            if not _numpy.is_array(flags):
+                flags = _numpy.np.frombuffer(flags, dtype=bool)
+            kept = coordinates[first:last][flags]
+            file.write(kept.tobytes())
+            result += len(kept)
+
+    return result
+
+
+def _write_indices(file: IO[bytes], count: int, keep: Any) -> int:
+    """Writes the indices of the kept points as int64 values in native byte
+    order, a chunk at a time.
+
+    Args:
+        file (IO[bytes]): binary file object
+        count (int): number of points
+        keep (Any): one flag per point, truthy for points that are kept
+
+    Returns:
+        int: number of indices written
+    """
+
+    result = 0
+
+    for first in range(0, count, MAPPED_CHUNK_POINTS):
+        last = min(first + MAPPED_CHUNK_POINTS, count)
+        indices = _kept_indices(keep[first:last])
+
+        # the indices of the chunk are relative to its first point
+        if _numpy is not None:
+            absolute = _numpy.np.frombuffer(indices, dtype=_numpy.np.int64) + first
+            file.write(absolute.tobytes())
+        else:
+            file.write(array("q", [first + i for i in indices]).tobytes())
+        result += len(indices)
+
+    return result
+
+
+def simplify_file(
+    source: Source,
+    epsilon: float,
+    output: Output,
+    distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+    dtype: str = "d",
+    dimensions: int = 2,
+    offset: int = 0,
+) -> int:
+    """Simplifies a curve stored in a binary file with an explicit epsilon
+    value, and writes the kept points to another file, with the same result as
+    `simplify_curve()`.
+
+    The input is mapped into memory rather than loaded, so only the pages the
+    algorithm gets to are read, and memory use is about one byte per point
+    plus the batches being measured. It is either a raw file of interleaved
+    float64 or float32 coordinates (`x0 y0 x1 y1 ...`), or a `.npy` file
+    holding an (N, D) array. The kept points are written as raw interleaved
+    coordinates of the same type.
+
+    Args:
+        source (Source): path of the input file
+        epsilon (float): minimum distance from the curve
+        output (Output): path of the output file, or a binary file object to
+            write to
+        distance_function (DistanceFunc, optional): Function used for
+            determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+        dtype (str, optional): "d" for float64 or "f" for float32 coordinates,
+            in native byte order. Ignored for `.npy` files. Defaults to "d".
+        dimensions (int, optional): number of coordinates of each point.
+            Ignored for `.npy` files. Defaults to 2.
+        offset (int, optional): number of bytes to skip at the start of the
+            file, such as a header. Ignored for `.npy` files. Defaults to 0.
+
+    Returns:
+        int: number of points written
+    """
+
+    _check_arguments(epsilon, distance_function, "scan")
+
+    with _mapped(source, dtype, dimensions, offset) as (
+        coordinates,
+        count,
+        dimensions,
+    ):
+        keep = _file_mask(coordinates, count, dimensions, epsilon, distance_function)
+
+        with _output_file(output) as file:
+            result = _write_points(file, coordinates, count, dimensions, keep)
+
+    return result
+
+
+def simplify_file_to(
+    source: Source,
+    point_count: int,
+    output: Output,
+    distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+    dtype: str = "d",
+    dimensions: int = 2,
+    offset: int = 0,
+) -> int:
+    """Same as `simplify_file()`, but simplifies the curve to a number of
+    points, with the same result as `simplify_curve_to()`. Finding the epsilon
+    value needs every point of the curve at once: if NumPy is installed,
+    float64 coordinates are used straight from the mapped file and only float32
+    ones are copied, into an (N, D) float64 array; otherwise the points are
+    read into a list of tuples.
+
+    Args:
+        source (Source): path of the input file
+        point_count (int): desired number of points in the simplified curve
+        output (Output): path of the output file, or a binary file object to
+            write to
+        distance_function (DistanceFunc, optional): Function used for
+            determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+        dtype (str, optional): "d" for float64 or "f" for float32 coordinates,
+            in native byte order. Ignored for `.npy` files. Defaults to "d".
+        dimensions (int, optional): number of coordinates of each point.
+            Ignored for `.npy` files. Defaults to 2.
+        offset (int, optional): number of bytes to skip at the start of the
+            file, such as a header. Ignored for `.npy` files. Defaults to 0.
+
+    Returns:
+        int: number of points written
+    """
+
+    with _mapped(source, dtype, dimensions, offset) as (
+        coordinates,
+        count,
+        dimensions,
+    ):
+        if _numpy is not None:
+            points: Any = _numpy.np.asarray(coordinates, dtype=_numpy.np.float64)
+        else:
+            points = list(_MappedPoints(coordinates, dimensions))
+
+        keep = bytearray(count)
+        for i in simplify_curve_to_indices(points, point_count, distance_function):
+            keep[i] = 1
+
+        with _output_file(output) as file:
+            result = _write_points(file, coordinates, count, dimensions, keep)
+
+    return result
+
+
+def simplify_file_indices(
+    source: Source,
+    epsilon: float,
+    distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+    output: Optional[Output] = None,
+    dtype: str = "d",
+    dimensions: int = 2,
+    offset: int = 0,
+) -> Any:
+    """Same as `simplify_file()`, but returns the indices of the kept points,
+    or writes them to `output` as int64 values in native byte order.
+
+    Args:
+        source (Source): path of the input file
+        epsilon (float): minimum distance from the curve
+        distance_function (DistanceFunc, optional): Function used for
+            determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+        output (Optional[Output], optional): path of the output file, or a
+            binary file object to write to. Defaults to returning the indices.
+        dtype (str, optional): "d" for float64 or "f" for float32 coordinates,
+            in native byte order. Ignored for `.npy` files. Defaults to "d".
+        dimensions (int, optional): number of coordinates of each point.
+            Ignored for `.npy` files. Defaults to 2.
+        offset (int, optional): number of bytes to skip at the start of the
+            file, such as a header. Ignored for `.npy` files. Defaults to 0.
+
+    Returns:
+        Any: indices of the kept points in ascending order, as a NumPy int64
+            array if NumPy is installed, else as an `array('q')`; or the number
+            of indices written to `output`
+    """
+
+    _check_arguments(epsilon, distance_function, "scan")
+
+    with _mapped(source, dtype, dimensions, offset) as (
+        coordinates,
+        count,
+        dimensions,
+    ):
+        keep = _file_mask(coordinates, count, dimensions, epsilon, distance_function)
+
+        if output is None:
+            result = _as_index_array(coordinates, _kept_indices(keep))
+        else:
+            with _output_file(output) as file:
+                result = _write_indices(file, count, keep)
+
+    return result
@@ -0,0 +1,460 @@
+"""Simplification of a single huge curve across a pool of processes."""
+# pylint: disable=invalid-name
+
+import os
+from array import array
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .distance import DEFAULT_DISTANCE_FUNC, DistanceFunc, DistanceIndex, Point
+from .points import PointArray
+from .rdp import (
+    _as_index_array,
+    _check_arguments,
+    _kept_indices,
+    _max_distance_between,
+    _simplify_indices,
+    _take,
+    _vectorized_kernel,
+)
+
+try:
+    from . import _numpy
+except ImportError:  # pragma: no cover
+    _numpy = None  # type: ignore
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:  # pragma: no cover
+    SharedMemory = None  # type: ignore
+
+PARALLEL_CHUNK_POINTS = 1 << 18
+"""Ranges with more points than this are measured in pieces across the workers,
+and smaller ones are simplified whole by a single worker."""
+
+_worker: Dict[str, Any] = {}
+"""The curve, as seen by a worker process."""
+
+
+def _dimensions(points: Any) -> int:
+    """Counts the coordinates of each point.
+
+    Args:
+        points (Any): points describing the curve, at least one
+
+    Returns:
+        int: number of coordinates of each point
+    """
+
+    if _numpy is not None:
+        result = _numpy.dimensions(points)
+    elif isinstance(points, PointArray):
+        result = 2
+    else:
+        result = len(points[0])
+
+    return result
+
+
+def _column_major(points: Any, dimensions: int, buffer: Any) -> None:
+    """Copies the coordinates of every point into a buffer, one coordinate at a
+    time, so that each coordinate of the curve is contiguous.
+
+    Args:
+        points (Any): points describing the curve
+        dimensions (int): number of coordinates of each point
+        buffer (Any): writable buffer of `8 * dimensions * len(points)` bytes
+    """
+
+    count = len(points)
+
+    if _numpy is not None:
+        if isinstance(points, PointArray):
+            rows = _numpy.np.frombuffer(points.coordinates, dtype=_numpy.np.float64)
+        else:
+            rows = _numpy.np.asarray(points, dtype=_numpy.np.float64)
+        columns = _numpy.np.ndarray(
+            (dimensions, count), dtype=_numpy.np.float64, buffer=buffer
+        )
+        columns[:] = rows.reshape(count, dimensions).T
+        del columns
+
+    else:
+        view = memoryview(buffer).cast("B").cast("d")
+        for k in range(dimensions):
+            view[k * count : (k + 1) * count] = array("d", (p[k] for p in points))
+        view.release()
+
+
+@contextmanager
+def _shared(points: Any) -> Iterator[Tuple[Any, ...]]:
+    """Shares the coordinates of the curve with the worker processes, in shared
+    memory if this Python has it, else by sending a copy to each worker.
+
+    Args:
+        points (Any): points describing the curve
+
+    Yields:
+        Tuple[Any, ...]: arguments of `_attach()` in the workers
+    """
+
+    dimensions = _dimensions(points)
+    size = 8 * dimensions * len(points)
+
+    if SharedMemory is not None:
+        memory = SharedMemory(create=True, size=size)
+        try:
+            _column_major(points, dimensions, memory.buf)
+            yield memory.name, None, len(points), dimensions
+        finally:
+            memory.close()
+            memory.unlink()
+
+    else:  # pragma: no cover
+        data = bytearray(size)
+        _column_major(points, dimensions, data)
+        yield None, bytes(data), len(points), dimensions
+
+
+def _attach(name: Optional[str], data: Any, count: int, dimensions: int) -> None:
+    """Opens the shared coordinates of the curve in a worker process.
+
+    Args:
+        name (Optional[str]): name of the shared memory, if any
+        data (Any): copy of the coordinates, if there is no shared memory
+        count (int): number of points describing the curve
+        dimensions (int): number of coordinates of each point
+    """
+
+    if name is not None:
+        memory = SharedMemory(name=name)
+        _worker["memory"] = memory
+        data = memory.buf
+
+    if _numpy is not None:
+        columns: Any = _numpy.np.frombuffer(
+            data, dtype=_numpy.np.float64, count=count * dimensions
+        ).reshape(dimensions, count)
+    else:
+        columns = memoryview(data).cast("B").cast("d")
+
+    _worker.update(columns=columns, count=count, dimensions=dimensions)
+
+
+def _points(first: int, last: int) -> Any:
+    """Gets points of the shared curve in a worker process.
+
+    Args:
+        first (int): index of the first point
+        last (int): index of the last point
+
+    Returns:
+        Any: the points, as an (N, D) NumPy view if NumPy is installed, else as
+            a list of tuples
+    """
+
+    columns = _worker["columns"]
+
+    if _numpy is not None:
+        result = columns[:, first : last + 1].T
+    else:
+        count = _worker["count"]
+        result = list(
+            zip(
+                *(
+                    columns[k * count + first : k * count + last + 1]
+                    for k in range(_worker["dimensions"])
+                )
+            )
+        )
+
+    return result
+
+
+def _measure_piece(
+    start: int, end: int, first: int, last: int, distance_function: DistanceFunc
+) -> DistanceIndex:
+    """Finds the point between indices `first` and `last` (inclusive) of the
+    shared curve that is furthest from the line between the points at `start`
+    and `end`. This runs in the worker processes.
+
+    Args:
+        start (int): index of the first point of the range
+        end (int): index of the last point of the range
+        first (int): index of the first point to measure
+        last (int): index of the last point to measure
+        distance_function (DistanceFunc): function used for determining
+            distance
+
+    Returns:
+        DistanceIndex: distance and (absolute) index of the furthest point; the
+            index is -1 if no distance could be compared
+    """
+
+    columns = _worker["columns"]
+    kernel = (
+        _vectorized_kernel(columns.T, distance_function) if _numpy is not None else None
+    )
+
+    # measure views of the shared columns
+    if kernel is not None:
+        if _worker["dimensions"] == 2:
+            xs, ys = columns[0], columns[1]
+        else:
+            xs = ys = columns.T
+        result = _numpy.split_piece(xs, ys, start, end, first, last, kernel)
+
+    # or copy the piece out, between the line points
+    else:
+        if _numpy is not None:
+            points = [tuple(p) for p in _points(first, last).tolist()]
+            line = [tuple(p) for p in _points(start, start).tolist()] + [
+                tuple(p) for p in _points(end, end).tolist()
+            ]
+        else:
+            points = _points(first, last)
+            line = _points(start, start) + _points(end, end)
+        distance, index = _max_distance_between(
+            [line[0]] + points + [line[1]], 0, len(points) + 1, distance_function
+        )
+        result = (distance, first + index - 1) if index > 0 else (-1.0, -1)
+
+    return result
+
+
+def _simplify_range(
+    start: int, end: int, epsilon: float, distance_function: DistanceFunc
+) -> array:
+    """Simplifies the range of the shared curve between indices `start` and
+    `end`. This runs in the worker processes.
+
+    Args:
+        start (int): index of the first point of the range
+        end (int): index of the last point of the range
+        epsilon (float): minimum distance from the curve
+        distance_function (DistanceFunc): function used for determining
+            distance
+
+    Returns:
+        array: (absolute) indices of the kept points between the endpoints of
+            the range
+    """
+
+    kept = _simplify_indices(_points(start, end), epsilon, distance_function)
+    return array("q", [start + i for i in kept[1:-1]])
+
+
+def _pieces(start: int, end: int, count: int) -> List[Tuple[int, int]]:
+    """Splits the points between the endpoints of a range into pieces of about
+    the same size.
+
+    Args:
+        start (int): index of the first point of the range
+        end (int): index of the last point of the range
+        count (int): number of pieces
+
+    Returns:
+        List[Tuple[int, int]]: first and last index of each piece, in order
+    """
+
+    inside = end - start - 1
+    bounds = [start + 1 + inside * k // count for k in range(count + 1)]
+    return [(a, b - 1) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def _parallel_indices(
+    points: Any,
+    epsilon: float,
+    distance_function: DistanceFunc,
+    workers: int,
+    chunk_points: int,
+) -> array:
+    """Runs the Ramer-Douglas-Peucker algorithm over a pool of processes, one
+    level of the large ranges at a time.
+
+    The furthest point of every range with more than `chunk_points` points is
+    found by measuring pieces of it in all the workers, and every smaller
+    range is handed to a single worker to simplify on its own, while the
+    larger ranges are still being broken down.
+
+    Args:
+        points (Any): points describing the curve, at least three
+        epsilon (float): minimum distance from the curve, greater than zero
+        distance_function (DistanceFunc): function used for determining
+            distance, which must be picklable
+        workers (int): number of worker processes
+        chunk_points (int): largest range simplified by a single worker
+
+    Returns:
+        array: indices of the kept points, as an `array('q')`
+    """
+
+    keep = bytearray(len(points))
+
+    # the endpoints are always kept
+    keep[0] = keep[-1] = 1
+
+    with _shared(points) as shared, ProcessPoolExecutor(
+        max_workers=workers, initializer=_attach, initargs=shared
+    ) as executor:
+        simplified: List[Future] = []
+        level = [(0, len(points) - 1)]
+
+        while level:
+
+            # hand out the small ranges, and measure the large ones in pieces
+            measured = []
+            for start, end in level:
+                if end - start < 2:
+                    continue
+                if end - start + 1 <= chunk_points:
+                    simplified.append(
+                        executor.submit(
+                            _simplify_range, start, end, epsilon, distance_function
+                        )
+                    )
+                else:
+                    pieces = [
+                        executor.submit(
+                            _measure_piece, start, end, first, last, distance_function
+                        )
+                        for first, last in _pieces(start, end, workers)
+                    ]
+                    measured.append((start, end, pieces))
+
+            # the first of the furthest points of the pieces is the furthest
+            # point of the range
+            level = []
+            for start, end, pieces in measured:
+                distance, index = -1.0, start
+                for piece in pieces:
+                    d, i = piece.result()
+                    if i >= 0 and d > distance:
+                        distance, index = d, i
+
+                if distance > epsilon:
+                    keep[index] = 1
+                    level.extend(((start, index), (index, end)))
+
+        for future in simplified:
+            for i in future.result():
+                keep[i] = 1
+
+    return _kept_indices(keep)
+
+
+def _simplify_parallel_indices(
+    points: Any,
+    epsilon: float,
+    distance_function: DistanceFunc,
+    workers: Optional[int],
+    chunk_points: int,
+) -> array:
+    """Same as `simplify_curve_parallel()`, but returns the indices of the kept
+    points.
+
+    Args:
+        points (Any): points describing the curve
+        epsilon (float): minimum distance from the curve
+        distance_function (DistanceFunc): function used for determining
+            distance
+        workers (Optional[int]): number of worker processes
+        chunk_points (int): largest range simplified by a single worker
+
+    Returns:
+        array: indices of the kept points, as an `array('q')`
+    """
+
+    _check_arguments(epsilon, distance_function, "scan")
+
+    workers = workers or os.cpu_count() or 1
+
+    # no need for a pool
+    if epsilon == 0 or workers == 1 or len(points) <= chunk_points:
+        result = _simplify_indices(points, epsilon, distance_function)
+    else:
+        result = _parallel_indices(
+            points, epsilon, distance_function, workers, chunk_points
+        )
+
+    return result
+
+
+def simplify_curve_parallel(
+    points: List[Point],
+    epsilon: float,
+    distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+    workers: Optional[int] = None,
+    chunk_points: int = PARALLEL_CHUNK_POINTS,
+) -> List[Point]:
+    """Simplifies a single huge curve with an explicit epsilon value across a
+    pool of worker processes, with the same result as `simplify_curve()`.
+
+    The coordinates are shared with the workers in shared memory. The top
+    levels of the algorithm measure each large range in pieces across all the
+    workers, and once ranges have at most `chunk_points` points, each of them
+    is simplified by a single worker. Curves of at most `chunk_points` points
+    are simplified in this process.
+
+    Args:
+        points (List[Point]): points describing the curve
+        epsilon (float): minimum distance from the curve
+        distance_function (DistanceFunc, optional): Function used for
+            determining distance, which must be picklable. Defaults to
+            DEFAULT_DISTANCE_FUNC.
+        workers (Optional[int], optional): number of worker processes, or 1 to
+            simplify in this process. Defaults to the number of CPUs.
+        chunk_points (int, optional): largest range simplified by a single
+            worker. Defaults to PARALLEL_CHUNK_POINTS.
+
+    Returns:
+        List[Point]: points describing the simplified curve
+    """
+
+    result: List[Point] = []
+
+    indices = _simplify_parallel_indices(
+        points, epsilon, distance_function, workers, chunk_points
+    )
+
+    # know when to stop
+    if len(indices) == len(points):
+        result = points[:]
+    else:
+        result = _take(points, indices.tolist())
+
+    return result
+
+
+def simplify_curve_parallel_indices(
+    points: List[Point],
+    epsilon: float,
+    distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+    workers: Optional[int] = None,
+    chunk_points: int = PARALLEL_CHUNK_POINTS,
+) -> Any:
+    """Same as `simplify_curve_parallel()`, but returns the indices of the kept
+    points instead of copying them.
+
+    Args:
+        points (List[Point]): points describing the curve
+        epsilon (float): minimum distance from the curve
+        distance_function (DistanceFunc, optional): Function used for
+            determining distance, which must be picklable. Defaults to
+            DEFAULT_DISTANCE_FUNC.
+        workers (Optional[int], optional): number of worker processes, or 1 to
+            simplify in this process. Defaults to the number of CPUs.
+        chunk_points (int, optional): largest range simplified by a single
+            worker. Defaults to PARALLEL_CHUNK_POINTS.
+
+    Returns:
+        Any: indices of the kept points in ascending order, as a NumPy int64
+            array if `points` is a NumPy array, else as an `array('q')`
+    """
+    return _as_index_array(
+        points,
+        _simplify_parallel_indices(
+            points, epsilon, distance_function, workers, chunk_points
+        ),
+    )
@@ -0,0 +1,141 @@
+"""Compact storage for the points of a curve."""
+# pylint: disable=invalid-name
+
+from array import array
+from itertools import chain
+from typing import Any, Iterable, Iterator, List, Sequence, Union, overload
+
+from .distance import Point
+
+
+class PointArray(Sequence[Point]):
+    """Sequence of points stored as interleaved float64 coordinates in a single
+    `array('d')`, which takes 16 bytes per point instead of a tuple and two
+    float objects per point.
+
+    Points are only turned into `(x, y)` tuples when they are read one at a
+    time. The simplification functions accept a `PointArray` wherever they
+    accept a list of points and return a `PointArray`, and with NumPy installed
+    the vectorized kernels read the coordinates directly from the buffer.
+    """
+
+    def __init__(self, points: Iterable[Point] = ()):
+        """Creates an array from (x, y) pairs.
+
+        Args:
+            points (Iterable[Point], optional): points describing the curve.
+                Defaults to no points.
+        """
+        self.coordinates = array("d", chain.from_iterable(points))
+
+    @classmethod
+    def from_coordinates(cls, coordinates: Iterable[float]) -> "PointArray":
+        """Creates an array from interleaved x and y coordinates. An
+        `array('d')` is used as is, without copying it.
+
+        Args:
+            coordinates (Iterable[float]): x and y coordinates of each point
+
+        Returns:
+            PointArray: the array
+        """
+
+        result = cls()
+        if isinstance(coordinates, array) and coordinates.typecode == "d":
+            result.coordinates = coordinates
+        else:
+            result.coordinates = array("d", coordinates)
+
+        if len(result.coordinates) % 2:
+            raise ValueError("Coordinates must come in (x, y) pairs.")
+
+        return result
+
+    @classmethod
+    def from_xy(cls, xs: Iterable[float], ys: Iterable[float]) -> "PointArray":
+        """Creates an array from separate x and y columns.
+
+        Args:
+            xs (Iterable[float]): x coordinate of each point
+            ys (Iterable[float]): y coordinate of each point
+
+        Returns:
+            PointArray: the array
+        """
+        return cls(zip(xs, ys))
+
+    def __len__(self) -> int:
+        return len(self.coordinates) // 2
+
+    @overload
+    def __getitem__(self, index: int) -> Point:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PointArray":
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        coordinates = self.coordinates
+
+        # slices are copied, like list slices
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                result: Any = PointArray.from_coordinates(
+                    coordinates[2 * start : 2 * max(start, stop)]
+                )
+            else:
+                result = self.take(range(start, stop, step))
+
+        else:
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError("PointArray index out of range")
+            result = (coordinates[2 * index], coordinates[2 * index + 1])
+
+        return result
+
+    def __iter__(self) -> Iterator[Point]:
+        coordinates = self.coordinates
+        return zip(coordinates[0::2], coordinates[1::2])
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, PointArray):
+            return NotImplemented
+        return self.coordinates == other.coordinates
+
+    def __repr__(self) -> str:
+        return f"PointArray({self.tolist()!r})"
+
+    def take(self, indices: Iterable[int]) -> "PointArray":
+        """Copies the points at the given indices into a new array.
+
+        Args:
+            indices (Iterable[int]): indices of the points to copy, in order
+
+        Returns:
+            PointArray: the points
+        """
+
+        coordinates = self.coordinates
+        count = len(self)
+        taken = array("d")
+
+        for i in indices:
+            if i < 0:
+                i += count
+            if not 0 <= i < count:
+                raise IndexError("PointArray index out of range")
+            taken.extend(coordinates[2 * i : 2 * i + 2])
+
+        return PointArray.from_coordinates(taken)
+
+    def tolist(self) -> List[Point]:
+        """Converts the array to a list of (x, y) tuples.
+
+        Returns:
+            List[Point]: points describing the curve
+        """
+        return list(self)
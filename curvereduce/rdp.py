@@ -0,0 +1,1138 @@
+"""Implementation of the Ramer-Douglas-Peucker algorithm."""
+# pylint: disable=invalid-name
+
+import sys
+from array import array
+from functools import partial
+from heapq import heappop, heappush
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from .distance import (
+    DEFAULT_DISTANCE_FUNC,
+    SEGMENT_DISTANCE_FUNCS,
+    SQUARED_DISTANCE_FUNCS,
+    SQUARED_TOLERANCE,
+    DistanceFunc,
+    DistanceIndex,
+    Point,
+    SegmentFunc,
+    geodesic_distance,
+    perpendicular_distance,
+    shortest_distance,
+)
+from .hull import HullTree
+from .points import PointArray
+from .stats import SimplificationStats, current_stats, phase
+
+try:
+    from . import _numpy
+except ImportError:  # pragma: no cover
+    _numpy = None  # type: ignore
+
+VECTORIZE_MIN_POINTS = 256
+"""Lists with at least this many points are converted to NumPy arrays so the
+vectorized kernels can be used (NumPy arrays always use them)."""
+
+SEARCH_ITERATIONS = 8
+"""Number of times `simplify_curve_to()` tries to rank the points above an
+epsilon value that keeps enough of them before ranking every point."""
+
+
+def _vectorized_kernel(
+    points: Any, distance_function: DistanceFunc, dimensions: Optional[int] = None
+) -> Any:
+    """Picks the vectorized NumPy kernel matching `distance_function`, if NumPy
+    is installed, there is one, and `points` is worth converting.
+
+    Args:
+        points (Any): points describing the curve
+        distance_function (DistanceFunc): function used for determining
+            distance
+        dimensions (Optional[int], optional): number of coordinates of each
+            point. Defaults to that of `points`.
+
+    Returns:
+        Any: vectorized kernel, or None to use the pure-Python loop
+    """
+
+    kernel = None
+
+    if _numpy is not None and (
+        _numpy.is_array(points) or len(points) >= VECTORIZE_MIN_POINTS
+    ):
+        if distance_function is shortest_distance:
+            kernel = _numpy.shortest_distances
+        elif distance_function is perpendicular_distance:
+            kernel = _numpy.perpendicular_distances
+        elif distance_function is geodesic_distance:
+            kernel = _numpy.geodesic_distances
+
+        # points that aren't (x, y) pairs are measured as an (N, D) array
+        if dimensions is None:
+            dimensions = _numpy.dimensions(points)
+        if kernel is not None and dimensions != 2:
+            kernel = _numpy.coordinate_kernel(kernel)
+
+    return kernel
+
+
+def _max_distance_between(
+    points: Sequence[Point],
+    start: int,
+    end: int,
+    distance_function: DistanceFunc,
+    stats: Optional[SimplificationStats] = None,
+) -> DistanceIndex:
+    """Finds the data point between indices `start` and `end` (exclusive) that
+    is furthest away from the straight line between `points[start]` and
+    `points[end]`, without copying any part of `points`.
+
+    Args:
+        points (Sequence[Point]): sequence of points describing the curve
+        start (int): index of the first point of the range
+        end (int): index of the last point of the range
+        distance_function (DistanceFunc): function used for determining
+            distance
+        stats (Optional[SimplificationStats], optional): stats to count the
+            measured points in. Defaults to None.
+
+    Returns:
+        DistanceIndex: distance and (absolute) index of furthest point
+    """
+
+    # save the first and last points
+    first = points[start]
+    last = points[end]
+
+    # distance and index of furthest point
+    distance = -1.0
+    index = start
+
+    if stats is not None and end - start >= 2:
+        stats.distance_evaluations += end - start - 1
+
+    # compare squared distances if we can, which is cheaper
+    segment = _segment_function(distance_function)
+
+    # if we have a short range, then we have a shortcut
+    if end - start < 2:
+        distance = 0.0
+
+    elif segment is not None:
+        distance, index = _max_squared_distance_between(
+            points, start, end, distance_function, segment(first, last)
+        )
+
+    # loop through the points between the first and the last
+    else:
+        for i in range(start + 1, end):
+
+            # get the distance using the provided distance function
+            d = distance_function(points[i], first, last)
+
+            # save the distance and index if this is the longest so far
+            if d > distance:
+                distance = d
+                index = i
+
+    return distance, index
+
+
+def _segment_function(distance_function: DistanceFunc) -> Optional[SegmentFunc]:
+    """Looks up the segment version of `distance_function`, falling back on
+    its squared version.
+
+    Args:
+        distance_function (DistanceFunc): function used for determining
+            distance
+
+    Returns:
+        Optional[SegmentFunc]: segment version, or None if there is neither
+    """
+
+    result = SEGMENT_DISTANCE_FUNCS.get(distance_function)
+
+    if result is None:
+        squared = SQUARED_DISTANCE_FUNCS.get(distance_function)
+        if squared is not None:
+            result = partial(_squared_segment, squared)
+
+    return result
+
+
+def _squared_segment(
+    squared: DistanceFunc, a: Point, b: Point
+) -> Callable[[Point], float]:
+    """Turns a squared distance function into a segment function.
+
+    Args:
+        squared (DistanceFunc): squared distance function
+        a (Point): line point
+        b (Point): line point
+
+    Returns:
+        Callable[[Point], float]: function measuring points against the line
+    """
+    return lambda p: squared(p, a, b)
+
+
+def _max_squared_distance_between(
+    points: Sequence[Point],
+    start: int,
+    end: int,
+    distance_function: DistanceFunc,
+    measure: Callable[[Point], float],
+) -> DistanceIndex:
+    """Same as `_max_distance_between()`, but compares squared distances and
+    only measures the distance of the points that may be the furthest once the
+    distances are rounded. The range must have at least one point between its
+    endpoints.
+
+    Args:
+        points (Sequence[Point]): sequence of points describing the curve
+        start (int): index of the first point of the range
+        end (int): index of the last point of the range
+        distance_function (DistanceFunc): function used for determining
+            distance
+        measure (Callable[[Point], float]): function giving the squared
+            distance of a point from the line, see `SEGMENT_DISTANCE_FUNCS`
+
+    Returns:
+        DistanceIndex: distance and (absolute) index of furthest point
+    """
+
+    # save the first and last points
+    first = points[start]
+    last = points[end]
+
+    # largest squared distance so far, the smallest squared distance that may
+    # round to the same distance, and the points in between
+    largest = -1.0
+    cutoff = -1.0
+    near: List[Tuple[float, int]] = []
+
+    for i in range(start + 1, end):
+        s = measure(points[i])
+
+        if s >= cutoff:
+            if s > largest:
+                cutoff = s - s * SQUARED_TOLERANCE
+
+                # usually none of the previous points are near enough
+                if largest < cutoff:
+                    near = []
+                else:
+                    near = [(t, j) for t, j in near if t >= cutoff]
+
+                largest = s
+            near.append((s, i))
+
+    # distance and index of furthest point, the first one on a tie
+    distance = -1.0
+    index = start
+
+    for _, i in near:
+        d = distance_function(points[i], first, last)
+        if d > distance:
+            distance = d
+            index = i
+
+    return distance, index
+
+
+def max_distance(
+    points: List[Point], distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC
+) -> DistanceIndex:
+    """Finds the data point in the curve that is furthest away from the
+    straight line between the first and last points of the curve.
+
+    Args:
+        points (List[Point]): list of points describing the curve
+        distance_function (DistanceFunc, optional): function used for
+            determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+
+    Returns:
+        DistanceIndex: distance and index of furthest point
+    """
+
+    kernel = _vectorized_kernel(points, distance_function)
+    stats = current_stats()
+
+    # use the vectorized kernel if we can
+    if kernel is not None:
+        xs, ys = _numpy.columns(points)
+        result = _numpy.max_distance_between(xs, ys, 0, len(xs) - 1, kernel, stats)
+
+    # otherwise loop through the points in Python
+    else:
+        result = _max_distance_between(
+            points, 0, len(points) - 1, distance_function, stats
+        )
+
+    return result
+
+
+def binary_search(
+    test: Callable[[int], float], minimum: int = 1, maximum: int = sys.maxsize
+) -> int:
+    """Generic binary search algorithm.
+
+    Args:
+        test (Callable[[float], float]): Function used to indicate the distance
+            between the integer being tested and the target.
+        min (int, optional): Low end of the range to test. Defaults to 1.
+        max (int, optional): High end of the range to test. Defaults to
+            `sys.maxsize`.
+
+    Returns:
+        int: the integer closest to the target per `test()`.
+    """
+
+    # raise exception if minimum > maxmimum
+    if minimum > maximum:
+        raise ValueError("Minimum value is greater than maximum value.")
+
+    # set up our initial left, right, and middle points
+
+    left = int(minimum)
+    right = int(maximum)
+    middle = (left + right) // 2
+
+    # loop as long as we have something to test
+    while right - left >= 1:
+
+        # check the middle point
+        tested = test(middle)
+
+        # it's on target, break out of the loop
+        if tested == 0:
+            break
+
+        # it's low, use the lower half of our search range
+        if tested < 0:
+            right = middle - 1
+
+        # it's high, use the upper half of our search range
+        else:
+            left = middle + 1
+
+        # recalculate the middle point
+        middle = (left + right) // 2
+
+    # when we get here, `m` is as close to the target as possible
+    return middle
+
+
+def _simplify_mask(
+    count: int,
+    epsilon: float,
+    farthest: Callable[[int, int], DistanceIndex],
+    stats: Optional[SimplificationStats] = None,
+) -> bytearray:
+    """Runs the Ramer-Douglas-Peucker algorithm over index ranges of a curve
+    using an explicit stack instead of recursion, so that neither the points
+    nor the partial results are ever copied and deep splits cannot exceed the
+    interpreter's recursion limit.
+
+    Args:
+        count (int): number of points describing the curve
+        epsilon (float): minimum distance from the curve
+        farthest (Callable[[int, int], DistanceIndex]): function that finds
+            the distance and index of the point furthest from the line between
+            the first and last points of a range
+        stats (Optional[SimplificationStats], optional): stats to count the
+            ranges and splits in. Defaults to None.
+
+    Returns:
+        bytearray: one byte per point, non-zero for points that are kept
+    """
+
+    keep = bytearray(count)
+
+    # the endpoints are always kept
+    keep[0] = keep[-1] = 1
+
+    # ranges (by first and last index, and depth in the hierarchy) that still
+    # need to be broken down
+    stack = [(0, count - 1, 1)]
+
+    while stack:
+        start, end, depth = stack.pop()
+
+        # nothing between the endpoints, so nothing to remove
+        if end - start < 2:
+            continue
+
+        # get the max distance in this range of the curve
+        d, i = farthest(start, end)
+
+        if stats is not None:
+            stats.ranges += 1
+            stats.splits += d > epsilon
+            stats.max_depth = max(stats.max_depth, depth)
+
+        # if the max distance is greater than epsilon, keep the point and break
+        # down the range on either side of it (left side on top of the stack,
+        # so ranges are visited in the same order as the recursive version)
+        if d > epsilon:
+            keep[i] = 1
+            stack.append((i, end, depth + 1))
+            stack.append((start, i, depth + 1))
+
+    return keep
+
+
+def _keep_mask(
+    points: Sequence[Point],
+    epsilon: float,
+    distance_function: DistanceFunc,
+    algorithm: str = "scan",
+) -> Any:
+    """Marks the points to keep, using the vectorized engine if we can.
+
+    Args:
+        points (Sequence[Point]): points describing the curve, at least three
+        epsilon (float): minimum distance from the curve, greater than zero
+        distance_function (DistanceFunc): function used for determining
+            distance
+        algorithm (str, optional): "scan" or "hull". Defaults to "scan".
+
+    Returns:
+        Any: one flag per point, truthy for points that are kept
+    """
+
+    kernel = _vectorized_kernel(points, distance_function)
+    stats = current_stats()
+
+    with phase(stats, "simplify"):
+
+        # find the furthest point of each range with the convex hull tree
+        if algorithm == "hull":
+            if _numpy is not None and _numpy.is_array(points):
+                points = points.tolist()
+            if len(points[0]) != 2:
+                raise ValueError("The hull algorithm requires 2-dimensional points.")
+            tree = HullTree(points, stats=stats)
+            keep = _simplify_mask(len(points), epsilon, tree.farthest, stats)
+
+        # or by measuring every point of each range
+        elif kernel is not None:
+            xs, ys = _numpy.columns(points)
+            keep = _numpy.simplify_mask(xs, ys, epsilon, kernel, stats)
+        else:
+            keep = _simplify_mask(
+                len(points),
+                epsilon,
+                lambda start, end: _max_distance_between(
+                    points, start, end, distance_function, stats
+                ),
+                stats,
+            )
+
+    return keep
+
+
+def _select(points: Any, keep: Any) -> Any:
+    """Copies the kept points out of the curve.
+
+    Args:
+        points (Any): points describing the curve
+        keep (Any): one flag per point, truthy for points that are kept
+
+    Returns:
+        Any: kept points, as a NumPy array or `PointArray` if `points` is one,
+            else as a list
+    """
+
+    if _numpy is not None and _numpy.is_array(points):
+        result = points[_numpy.np.asarray(keep, dtype=bool)]
+    elif isinstance(points, PointArray):
+        result = points.take(i for i, k in enumerate(keep) if k)
+    else:
+        result = [p for p, k in zip(points, keep) if k]
+
+    return result
+
+
+def _check_arguments(
+    epsilon: float, distance_function: DistanceFunc, algorithm: str
+) -> None:
+    """Makes sure the arguments of `simplify_curve()` make sense.
+
+    Args:
+        epsilon (float): minimum distance from the curve
+        distance_function (DistanceFunc): function used for determining
+            distance
+        algorithm (str): "scan" or "hull"
+    """
+
+    # make sure our epsilon value is not negative
+    if epsilon < 0:
+        raise ValueError("Epsilon must not be a negative number.")
+
+    # make sure we know the algorithm, and that it can measure the distance
+    if algorithm not in ("scan", "hull"):
+        raise ValueError(f"Unknown algorithm: {algorithm}.")
+    if algorithm == "hull" and distance_function is not perpendicular_distance:
+        raise ValueError("The hull algorithm requires perpendicular_distance.")
+
+
+def simplify_curve(
+    points: List[Point],
+    epsilon: float,
+    distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+    algorithm: str = "scan",
+) -> List[Point]:
+    """Simplifies a curve with an explicit epsilon value using the
+    Ramer-Douglas-Peucker algorithm.
+
+    The default "scan" algorithm measures every point of each range, which is
+    O(n^2) in the worst case, where every split only peels off one point. The
+    "hull" algorithm finds the furthest point of each range with a tree of
+    convex hulls instead, which is O(n log^2 n) whatever the shape of the curve
+    but only works with `perpendicular_distance()`. Both give the same result,
+    except that points at exactly the same distance may be picked differently.
+
+    Args:
+        points (List[Point]): points describing the curve
+        epsilon (float): minimum distance from the curve
+        distance_function (DistanceFunc, optional): Function used for
+            determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+        algorithm (str, optional): "scan" or "hull". Defaults to "scan".
+
+    Returns:
+        List[Point]: points describing the simplified curve
+    """
+
+    _check_arguments(epsilon, distance_function, algorithm)
+
+    result: List[Point] = []
+
+    # know when to stop
+    if epsilon == 0 or len(points) < 3:
+        result = points[:]
+
+    # mark the points to keep, then copy them out in a single pass
+    else:
+        keep = _keep_mask(points, epsilon, distance_function, algorithm)
+        with phase(current_stats(), "select"):
+            result = _select(points, keep)
+
+    return result
+
+
+def simplify_curve_to(
+    points: List[Point],
+    point_count: int,
+    distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+    exact: bool = False,
+) -> List[Point]:
+    """Simplifies a curve to approximately the desired number of data points
+    using the Ramer-Douglas-Peucker algorithm. Note that the output may not
+    have exactly the desired number of points: it has the number of points
+    closest to it that any epsilon value gives (the larger one, on a tie).
+
+    With `exact`, the output has exactly the desired number of points (or all
+    of them, if there are fewer, and at least the endpoints): the most
+    significant ones, in the order `rank_points()` ranks them, which may not
+    be what any single epsilon value gives.
+
+    Args:
+        points (List[Point]): points describing the curve
+        point_count (int): desired number of points in the simplified curve
+        distance_function (DistanceFunc, optional): Function used for
+            determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+        exact (bool, optional): keep exactly `point_count` points. Defaults to
+            False.
+
+    Returns:
+        List[Point]: points describing the simplified curve
+    """
+
+    result: List[Point] = []
+
+    # avoid doing unnecessary work
+    if point_count < 3:
+        result = _take(points, [0, -1])
+    elif point_count >= len(points):
+        result = points[:]
+
+    # keep the most significant points
+    elif exact:
+        result = _take(points, _top_indices(points, point_count, distance_function))
+
+    # search for the best epsilon value
+    else:
+        result = _take(
+            points, _indices_for_count(points, point_count, distance_function)
+        )
+
+    return result
+
+
+def _top_indices(
+    points: List[Point], point_count: int, distance_function: DistanceFunc
+) -> List[int]:
+    """Finds the most significant points of the curve, the same ones as the
+    top of `rank_points()`, without ranking all of them.
+
+    Ranges are broken down best first, from a heap ordered like the ranking.
+    The significance of a split is never more than that of the split above it,
+    and it is deeper in the hierarchy, so splits come off the heap in ranked
+    order, and only the ranges on either side of the kept points are ever
+    measured.
+
+    Args:
+        points (List[Point]): points describing the curve, more than
+            `point_count`
+        point_count (int): desired number of points in the simplified curve,
+            at least three
+        distance_function (DistanceFunc): function used for determining
+            distance
+
+    Returns:
+        List[int]: indices of the kept points, in ascending order
+    """
+
+    kernel = _vectorized_kernel(points, distance_function)
+    stats = current_stats()
+
+    # measure ranges with the vectorized kernel if we can
+    if kernel is not None:
+        xs, ys = _numpy.columns(points)
+        farthest: Callable[[int, int], DistanceIndex] = partial(
+            _numpy.max_distance_between, xs, ys, kernel=kernel, stats=stats
+        )
+    else:
+        farthest = partial(
+            _max_distance_between,
+            points,
+            distance_function=distance_function,
+            stats=stats,
+        )
+
+    # splits still to make, by negated significance, depth and index, with the
+    # range they split
+    heap: List[Tuple[float, int, int, int, int]] = []
+
+    def push(start: int, end: int, depth: int, parent: float) -> None:
+        if end - start < 2:
+            return
+
+        d, i = farthest(start, end)
+        if stats is not None:
+            stats.ranges += 1
+
+        # no distance could be compared, so there is nothing to split on
+        if i != start:
+            heappush(heap, (-min(d, parent), depth, i, start, end))
+
+    with phase(stats, "rank"):
+
+        # the endpoints are always kept
+        kept = [0, len(points) - 1]
+        push(0, len(points) - 1, 1, float("inf"))
+
+        while heap and len(kept) < point_count:
+            significance, depth, i, start, end = heappop(heap)
+            kept.append(i)
+            if stats is not None:
+                stats.splits += 1
+                stats.max_depth = max(stats.max_depth, depth)
+
+            push(start, i, depth + 1, -significance)
+            push(i, end, depth + 1, -significance)
+
+        # points that were never reached come last in the ranking, in order
+        if len(kept) < point_count:
+            reached = set(kept)
+            kept.extend(
+                [i for i in range(len(points)) if i not in reached][
+                    : point_count - len(kept)
+                ]
+            )
+
+    return sorted(kept)
+
+
+def _indices_for_count(
+    points: List[Point], point_count: int, distance_function: DistanceFunc
+) -> List[int]:
+    """Searches for the epsilon value that simplifies the curve to as close to
+    the desired number of data points as possible, and lists the points it
+    keeps.
+
+    The points kept at any epsilon value are the most significant ones (see
+    `rank_points()`), so it's enough to rank the points kept at some epsilon
+    value that keeps at least the desired number, which only breaks down the
+    ranges `simplify_curve()` does at that value, and to pick the epsilon
+    value from their significance. The first guess assumes that the number of
+    points doubles whenever epsilon is halved, which errs on the side of too
+    few points; the furthest distances of the ranges it didn't break down are
+    then the significance of the next points, which tells how far to go.
+
+    Args:
+        points (List[Point]): points describing the curve, more than
+            `point_count`
+        point_count (int): desired number of points in the simplified curve,
+            at least three
+        distance_function (DistanceFunc): function used for determining
+            distance
+
+    Returns:
+        List[int]: indices of the kept points, in ascending order
+    """
+
+    stats = current_stats()
+
+    with phase(stats, "search"):
+        epsilon = max_distance(points, distance_function)[0] * 2 / point_count
+        iterations = 0
+
+        while True:
+            iterations += 1
+            if stats is not None:
+                stats.search_iterations += 1
+
+            unsplit: List[float] = []
+            significance, order = _rank(points, distance_function, epsilon, unsplit)
+            if len(order) >= point_count or epsilon == float("-inf"):
+                break
+
+            # go below enough of the ranges that weren't broken down, or below
+            # all of them (by the same guess) if there aren't enough, and rank
+            # every point if that doesn't get us anywhere
+            unsplit.sort(reverse=True)
+            threshold = 0.0
+            if unsplit:
+                threshold = unsplit[min(point_count - len(order), len(unsplit)) - 1]
+            epsilon = max(
+                (d for d in unsplit if d < threshold),
+                default=threshold * len(order) / point_count,
+            )
+            if not epsilon < threshold or iterations == SEARCH_ITERATIONS:
+                epsilon = float("-inf")
+
+        # epsilon values between two different significances keep the points
+        # above them, so these are the numbers of points we can get
+        def possible(count: int) -> bool:
+            return count == len(order) or significance[count - 1] > significance[count]
+
+        more = fewer = point_count
+        while not possible(more):
+            more += 1
+        while fewer > 2 and not possible(fewer):
+            fewer -= 1
+
+        count = more if more - point_count <= point_count - fewer else fewer
+
+    return sorted(order[:count])
+
+
+def _kept_indices(keep: Any) -> array:
+    """Lists the indices of the kept points.
+
+    Args:
+        keep (Any): one flag per point, truthy for points that are kept
+
+    Returns:
+        array: indices of the kept points, as an `array('q')`
+    """
+
+    result = array("q")
+
+    if _numpy is not None and _numpy.is_array(keep):
+        result.frombytes(_numpy.np.flatnonzero(keep).astype("<i8").tobytes())
+    else:
+        result.extend([i for i, k in enumerate(keep) if k])
+
+    return result
+
+
+def _simplify_indices(
+    points: List[Point],
+    epsilon: float,
+    distance_function: DistanceFunc,
+    algorithm: str = "scan",
+) -> array:
+    """Same as `simplify_curve()`, but returns the indices of the kept points.
+
+    Args:
+        points (List[Point]): points describing the curve
+        epsilon (float): minimum distance from the curve
+        distance_function (DistanceFunc): function used for determining
+            distance
+        algorithm (str, optional): "scan" or "hull". Defaults to "scan".
+
+    Returns:
+        array: indices of the points describing the simplified curve, as an
+            `array('q')`
+    """
+
+    _check_arguments(epsilon, distance_function, algorithm)
+
+    if epsilon == 0 or len(points) < 3:
+        result = array("q", range(len(points)))
+    else:
+        result = _kept_indices(
+            _keep_mask(points, epsilon, distance_function, algorithm)
+        )
+
+    return result
+
+
+def _simplify_to_indices(
+    points: List[Point],
+    point_count: int,
+    distance_function: DistanceFunc,
+    exact: bool = False,
+) -> array:
+    """Same as `simplify_curve_to()`, but returns the indices of the kept
+    points.
+
+    Args:
+        points (List[Point]): points describing the curve
+        point_count (int): desired number of points in the simplified curve
+        distance_function (DistanceFunc): function used for determining
+            distance
+        exact (bool, optional): keep exactly `point_count` points. Defaults to
+            False.
+
+    Returns:
+        array: indices of the points describing the simplified curve, as an
+            `array('q')`
+    """
+
+    if len(points) < 3 or point_count >= len(points):
+        result = array("q", range(len(points)))
+    elif point_count < 3:
+        result = array("q", [0, len(points) - 1])
+    elif exact:
+        result = array("q", _top_indices(points, point_count, distance_function))
+    else:
+        result = array("q", _indices_for_count(points, point_count, distance_function))
+
+    return result
+
+
+def _as_index_array(points: Any, indices: array) -> Any:
+    """Hands out kept indices as a NumPy array if `points` is one.
+
+    Args:
+        points (Any): points describing the curve
+        indices (array): indices of the kept points, as an `array('q')`
+
+    Returns:
+        Any: indices, as a NumPy int64 array (sharing the memory of
+            `indices`) if `points` is a NumPy array, else as an `array('q')`
+    """
+
+    if _numpy is not None and _numpy.is_array(points):
+        result = _numpy.np.frombuffer(indices, dtype=_numpy.np.int64)
+    else:
+        result = indices
+
+    return result
+
+
+def simplify_curve_indices(
+    points: List[Point],
+    epsilon: float,
+    distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+    algorithm: str = "scan",
+) -> Any:
+    """Same as `simplify_curve()`, but returns the indices of the kept points
+    instead of copying them, so that other columns of the curve can be sliced
+    with them.
+
+    Args:
+        points (List[Point]): points describing the curve
+        epsilon (float): minimum distance from the curve
+        distance_function (DistanceFunc, optional): Function used for
+            determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+        algorithm (str, optional): "scan" or "hull". Defaults to "scan".
+
+    Returns:
+        Any: indices of the kept points in ascending order, as a NumPy int64
+            array if `points` is a NumPy array, else as an `array('q')`
+    """
+    return _as_index_array(
+        points, _simplify_indices(points, epsilon, distance_function, algorithm)
+    )
+
+
+def simplify_curve_to_indices(
+    points: List[Point],
+    point_count: int,
+    distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+    exact: bool = False,
+) -> Any:
+    """Same as `simplify_curve_to()`, but returns the indices of the kept
+    points instead of copying them.
+
+    Args:
+        points (List[Point]): points describing the curve
+        point_count (int): desired number of points in the simplified curve
+        distance_function (DistanceFunc, optional): Function used for
+            determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+        exact (bool, optional): keep exactly `point_count` points. Defaults to
+            False.
+
+    Returns:
+        Any: indices of the kept points in ascending order, as a NumPy int64
+            array if `points` is a NumPy array, else as an `array('q')`
+    """
+    return _as_index_array(
+        points, _simplify_to_indices(points, point_count, distance_function, exact)
+    )
+
+
+def simplify_curve_mask(
+    points: List[Point],
+    epsilon: float,
+    distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+    algorithm: str = "scan",
+) -> Any:
+    """Same as `simplify_curve()`, but returns a flag for every point, set for
+    the points that are kept.
+
+    Args:
+        points (List[Point]): points describing the curve
+        epsilon (float): minimum distance from the curve
+        distance_function (DistanceFunc, optional): Function used for
+            determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+        algorithm (str, optional): "scan" or "hull". Defaults to "scan".
+
+    Returns:
+        Any: one flag per point, as a NumPy bool array if `points` is a NumPy
+            array, else as a `bytearray` of ones and zeros
+    """
+
+    _check_arguments(epsilon, distance_function, algorithm)
+
+    # know when to stop
+    if epsilon == 0 or len(points) < 3:
+        keep: Any = bytearray(b"\x01") * len(points)
+    else:
+        keep = _keep_mask(points, epsilon, distance_function, algorithm)
+
+    if _numpy is not None and _numpy.is_array(points):
+        result = _numpy.np.asarray(keep, dtype=bool)
+    elif _numpy is not None and _numpy.is_array(keep):
+        result = bytearray(keep.astype(_numpy.np.uint8).tobytes())
+    else:
+        result = bytearray(keep)
+
+    return result
+
+
+def _take(points: Any, indices: List[int]) -> Any:
+    """Copies the points at the given indices out of the curve.
+
+    Args:
+        points (Any): points describing the curve
+        indices (List[int]): indices of the points to copy, in order
+
+    Returns:
+        Any: points, as a NumPy array or `PointArray` if `points` is one, else
+            as a list
+    """
+
+    if _numpy is not None and _numpy.is_array(points):
+        result = points[indices]
+    elif isinstance(points, PointArray):
+        result = points.take(indices)
+    else:
+        result = [points[i] for i in indices]
+
+    return result
+
+
+def _rank(
+    points: List[Point],
+    distance_function: DistanceFunc,
+    epsilon: float = float("-inf"),
+    unsplit: Optional[List[float]] = None,
+) -> Tuple[List[float], List[int]]:
+    """Ranks every point of the curve by significance; see `rank_points()`.
+
+    Args:
+        points (List[Point]): points describing the curve
+        distance_function (DistanceFunc): function used for determining
+            distance
+        epsilon (float, optional): only rank the points kept at this epsilon
+            value, which only breaks down the ranges `simplify_curve()` does.
+            Defaults to ranking every point.
+        unsplit (Optional[List[float]], optional): list to add the furthest
+            distance of every range that isn't broken down to; the most
+            significant points that aren't ranked are among them. Defaults to
+            None.
+
+    Returns:
+        Tuple[List[float], List[int]]: significance of each point in ranked
+            order, and the indices of the points in ranked order
+    """
+
+    kernel = _vectorized_kernel(points, distance_function)
+    stats = current_stats()
+
+    with phase(stats, "rank"):
+
+        # nothing to rank
+        if len(points) < 3:
+            significance = [float("inf")] * len(points)
+            order = list(range(len(points)))
+
+        # build the whole hierarchy in a single vectorized pass per level
+        elif kernel is not None:
+            xs, ys = _numpy.columns(points)
+            ranked, ordered = _numpy.rank_points(
+                xs, ys, kernel, stats, epsilon, unsplit
+            )
+            significance, order = ranked.tolist(), ordered.tolist()
+
+        # break down every range, whatever its distance, with an explicit stack
+        else:
+            unranked = [float("-inf")] * len(points)
+            depth = [0] * len(points)
+
+            # the endpoints are always kept
+            unranked[0] = unranked[-1] = float("inf")
+
+            # ranges still to break down, with the depth of the range and the
+            # significance of the split that produced it
+            stack = [(0, len(points) - 1, 1, float("inf"))]
+
+            while stack:
+                start, end, level, parent = stack.pop()
+
+                # nothing between the endpoints
+                if end - start < 2:
+                    continue
+
+                d, i = _max_distance_between(
+                    points, start, end, distance_function, stats
+                )
+
+                if stats is not None:
+                    stats.ranges += 1
+                    stats.splits += i != start and d > epsilon
+                    stats.max_depth = max(stats.max_depth, level)
+
+                # no distance could be compared, so there is nothing to split on
+                if i == start:
+                    continue
+
+                # or the range isn't broken down at this epsilon value
+                if not d > epsilon:
+                    if unsplit is not None:
+                        unsplit.append(d)
+                    continue
+
+                # a point is only kept while every split above it is kept too
+                unranked[i] = min(d, parent)
+                depth[i] = level
+                stack.append((i, end, level + 1, unranked[i]))
+                stack.append((start, i, level + 1, unranked[i]))
+
+            ranked: Sequence[int] = range(len(points))
+            if epsilon > float("-inf"):
+                ranked = [i for i in ranked if unranked[i] > epsilon]
+
+            order = sorted(ranked, key=lambda i: (-unranked[i], depth[i], i))
+            significance = [unranked[i] for i in order]
+
+    return significance, order
+
+
+def rank_points(
+    points: List[Point], distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC
+) -> List[DistanceIndex]:
+    """Ranks every point of the curve by significance using a single run of
+    the Ramer-Douglas-Peucker algorithm. The significance of a point is the
+    largest epsilon for which `simplify_curve()` still keeps it: the distance
+    at which it splits its range, capped by the significance of the split
+    above it. The endpoints have infinite significance.
+
+    Points are ranked by decreasing significance; ties are broken by how deep
+    in the hierarchy the point was split, then by index, so every prefix of the
+    ranking is a valid simplification of the curve.
+
+    Args:
+        points (List[Point]): points describing the curve
+        distance_function (DistanceFunc, optional): Function used for
+            determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+
+    Returns:
+        List[DistanceIndex]: significance and index of every point, in ranked
+            order
+    """
+
+    significance, order = _rank(points, distance_function)
+    return list(zip(significance, order))
+
+
+def simplify_ranked(
+    points: List[Point], ranking: List[DistanceIndex], epsilon: float
+) -> List[Point]:
+    """Simplifies a curve with an explicit epsilon value using a ranking from
+    `rank_points()`. The result is the same as `simplify_curve()` with the
+    distance function used for the ranking, without measuring any distances.
+
+    Args:
+        points (List[Point]): points describing the curve
+        ranking (List[DistanceIndex]): ranking of the points
+        epsilon (float): minimum distance from the curve
+
+    Returns:
+        List[Point]: points describing the simplified curve
+    """
+
+    # make sure our epsilon value is not negative
+    if epsilon < 0:
+        raise ValueError("Epsilon must not be a negative number.")
+
+    result: List[Point] = []
+
+    # know when to stop
+    if epsilon == 0 or len(points) < 3:
+        result = points[:]
+
+    # keep the significant prefix of the ranking
+    else:
+        indices = []
+        for significance, i in ranking:
+            if not significance > epsilon:
+                break
+            indices.append(i)
+        result = _take(points, sorted(indices))
+
+    return result
+
+
+def simplify_ranked_to(
+    points: List[Point], ranking: List[DistanceIndex], point_count: int
+) -> List[Point]:
+    """Simplifies a curve to exactly the desired number of data points (or all
+    of them, if there are fewer) using a ranking from `rank_points()`.
+
+    Args:
+        points (List[Point]): points describing the curve
+        ranking (List[DistanceIndex]): ranking of the points
+        point_count (int): desired number of points in the simplified curve
+
+    Returns:
+        List[Point]: points describing the simplified curve
+    """
+
+    result: List[Point] = []
+
+    # avoid doing unnecessary work
+    if point_count >= len(points):
+        result = points[:]
+
+    # keep the top of the ranking, which always includes both endpoints
+    else:
+        result = _take(points, sorted(i for _, i in ranking[: max(point_count, 2)]))
+
+    return result
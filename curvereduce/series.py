@@ -0,0 +1,317 @@
+"""Simplification of several series of values sharing an x axis."""
+# pylint: disable=invalid-name
+
+from array import array
+from functools import partial
+from numbers import Real
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+from .distance import DEFAULT_DISTANCE_FUNC, DistanceFunc, DistanceIndex
+from .rdp import (
+    _as_index_array,
+    _kept_indices,
+    _max_distance_between,
+    _simplify_mask,
+    _take,
+    _vectorized_kernel,
+)
+from .stats import SimplificationStats, current_stats, phase
+
+try:
+    from . import _numpy
+except ImportError:  # pragma: no cover
+    _numpy = None  # type: ignore
+
+Epsilon = Union[float, Sequence[float]]
+"""Type representing one epsilon value for every series, or one per series."""
+
+
+def _epsilons(values: Any, epsilon: Epsilon) -> List[float]:
+    """Gets the epsilon value of each series, and makes sure they make sense.
+
+    Args:
+        values (Any): (N, M) values of M series at N points
+        epsilon (Epsilon): minimum distance from the curve of every series, or
+            of each series
+
+    Returns:
+        List[float]: minimum distance from the curve of each series
+    """
+
+    count = len(values[0]) if len(values) else 0
+
+    # NumPy scalars are real numbers too
+    if isinstance(epsilon, Real):
+        result = [float(epsilon)] * count
+    else:
+        result = [float(e) for e in epsilon]
+        if len(result) != count:
+            raise ValueError("There must be one epsilon value per series.")
+
+    # make sure our epsilon values are not negative
+    if any(e < 0 for e in result):
+        raise ValueError("Epsilon must not be a negative number.")
+
+    return result
+
+
+def _joint_farthest(
+    x: Sequence[float],
+    values: Any,
+    epsilons: List[float],
+    distance_function: DistanceFunc,
+    stats: Optional[SimplificationStats],
+    start: int,
+    end: int,
+) -> DistanceIndex:
+    """Finds the point between indices `start` and `end` that is furthest from
+    the line between them in any series, in units of that series' epsilon
+    value.
+
+    Args:
+        x (Sequence[float]): x coordinate of each point
+        values (Any): (N, M) values of M series at N points
+        epsilons (List[float]): minimum distance from the curve of each series
+        distance_function (DistanceFunc): function used for determining
+            distance
+        stats (Optional[SimplificationStats]): stats to count the measured
+            points in, if recording
+        start (int): index of the first point of the range
+        end (int): index of the last point of the range
+
+    Returns:
+        DistanceIndex: largest distance over epsilon, and (absolute) index of
+            the point at that distance
+    """
+
+    ax, first = x[start], values[start]
+    bx, last = x[end], values[end]
+
+    # distance and index of furthest point
+    distance = -1.0
+    index = start
+
+    if stats is not None:
+        stats.distance_evaluations += end - start - 1
+
+    for i in range(start + 1, end):
+        px, row = x[i], values[i]
+
+        for j, e in enumerate(epsilons):
+            d = distance_function((px, row[j]), (ax, first[j]), (bx, last[j]))
+
+            # a zero epsilon value makes any distance at all too far
+            d = d / e if e else d * float("inf")
+
+            # save the distance and index if this is the longest so far
+            if d > distance:
+                distance = d
+                index = i
+
+    return distance, index
+
+
+def _joint_indices(
+    x: Any,
+    values: Any,
+    epsilons: List[float],
+    distance_function: DistanceFunc,
+    stats: Optional[SimplificationStats],
+) -> array:
+    """Finds the points to keep so every series is simplified with its epsilon
+    value, keeping the same points in all of them.
+
+    Args:
+        x (Any): x coordinate of each point
+        values (Any): (N, M) values of M series at N points, N at least three
+        epsilons (List[float]): minimum distance from the curve of each series
+        distance_function (DistanceFunc): function used for determining
+            distance
+        stats (Optional[SimplificationStats]): stats to count the work in, if
+            recording
+
+    Returns:
+        array: indices of the kept points, as an `array('q')`
+    """
+
+    kernel = _vectorized_kernel(values, distance_function, 2) if epsilons else None
+
+    # measure every series of each range at once
+    if kernel is not None:
+        xs = _numpy.np.ascontiguousarray(x, dtype=_numpy.np.float64)
+        ys = _numpy.np.asarray(values, dtype=_numpy.np.float64)
+        keep = _numpy.simplify_mask(
+            xs,
+            ys,
+            1.0,
+            _numpy.joint_kernel(kernel, _numpy.np.array(epsilons)),
+            stats,
+        )
+    else:
+        keep = _simplify_mask(
+            len(x),
+            1.0,
+            lambda start, end: _joint_farthest(
+                x, values, epsilons, distance_function, stats, start, end
+            ),
+            stats,
+        )
+
+    return _kept_indices(keep)
+
+
+def _separate_indices(
+    x: Any,
+    values: Any,
+    epsilons: List[float],
+    distance_function: DistanceFunc,
+    stats: Optional[SimplificationStats],
+) -> List[array]:
+    """Simplifies every series with its epsilon value on its own.
+
+    Args:
+        x (Any): x coordinate of each point
+        values (Any): (N, M) values of M series at N points, N at least three
+        epsilons (List[float]): minimum distance from the curve of each series
+        distance_function (DistanceFunc): function used for determining
+            distance
+        stats (Optional[SimplificationStats]): stats to count the work in, if
+            recording
+
+    Returns:
+        List[array]: indices of the kept points of each series, as
+            `array('q')`s
+    """
+
+    count = len(x)
+    kernel = _vectorized_kernel(values, distance_function, 2)
+    result = []
+
+    # lay the series end to end and break all of them down at once, keeping
+    # every point of a series with a zero epsilon value like simplify_curve()
+    if kernel is not None and epsilons:
+        np = _numpy.np
+        ys = np.asarray(values, dtype=np.float64)
+        thresholds = np.array(epsilons)
+        thresholds[thresholds == 0] = -np.inf
+        starts = np.arange(len(epsilons), dtype=np.int64) * count
+        keep = _numpy.simplify_mask(
+            np.tile(np.asarray(x, dtype=np.float64), len(epsilons)),
+            np.ascontiguousarray(ys.T).ravel(),
+            np.repeat(thresholds, count),
+            kernel,
+            stats,
+            starts,
+            starts + count - 1,
+        ).reshape(len(epsilons), count)
+        result = [_kept_indices(k) for k in keep]
+
+    else:
+        for j, e in enumerate(epsilons):
+            if e == 0:
+                result.append(array("q", range(count)))
+                continue
+
+            points = [(px, row[j]) for px, row in zip(x, values)]
+            keep = _simplify_mask(
+                count,
+                e,
+                partial(
+                    _max_distance_between,
+                    points,
+                    distance_function=distance_function,
+                    stats=stats,
+                ),
+                stats,
+            )
+            result.append(_kept_indices(keep))
+
+    return result
+
+
+def simplify_series_indices(
+    x: Any,
+    values: Any,
+    epsilon: Epsilon,
+    distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+    joint: bool = True,
+) -> Any:
+    """Simplifies several series of values sharing an x axis, such as the
+    value columns of a table with a timestamp column, and returns the indices
+    of the kept points.
+
+    With `joint`, the same points are kept in every series, so that they stay
+    aligned: a point is kept if any series needs it, and every dropped value
+    of every series is within that series' epsilon value of the simplified
+    series. All series are measured in a single pass over the x axis.
+
+    Otherwise each series is simplified on its own, exactly like
+    `simplify_curve_indices()` would, but all of them at once.
+
+    Args:
+        x (Any): x coordinate of each of N points
+        values (Any): (N, M) NumPy array or N rows of the values of M series
+        epsilon (Epsilon): minimum distance from the curve of every series, or
+            of each series
+        distance_function (DistanceFunc, optional): Function used for
+            determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+        joint (bool, optional): keep the same points in every series.
+            Defaults to True.
+
+    Returns:
+        Any: indices of the kept points in ascending order, or a list of them
+            for each series if not `joint`; as NumPy int64 arrays if `values`
+            is a NumPy array, else as `array('q')`s
+    """
+
+    if len(x) != len(values):
+        raise ValueError("x and values must have the same number of points.")
+
+    epsilons = _epsilons(values, epsilon)
+    stats = current_stats()
+
+    with phase(stats, "simplify"):
+
+        # know when to stop
+        if len(x) < 3 or (joint and not any(epsilons)):
+            everything = array("q", range(len(x)))
+            result: Any = everything if joint else [everything[:] for _ in epsilons]
+
+        elif joint:
+            result = _joint_indices(x, values, epsilons, distance_function, stats)
+        else:
+            result = _separate_indices(x, values, epsilons, distance_function, stats)
+
+    if joint:
+        result = _as_index_array(values, result)
+    else:
+        result = [_as_index_array(values, r) for r in result]
+
+    return result
+
+
+def simplify_series(
+    x: Any,
+    values: Any,
+    epsilon: Epsilon,
+    distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+) -> Tuple[Any, Any]:
+    """Simplifies several series of values sharing an x axis, keeping the same
+    points in every series (see `simplify_series_indices()`).
+
+    Args:
+        x (Any): x coordinate of each of N points
+        values (Any): (N, M) NumPy array or N rows of the values of M series
+        epsilon (Epsilon): minimum distance from the curve of every series, or
+            of each series
+        distance_function (DistanceFunc, optional): Function used for
+            determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+
+    Returns:
+        Tuple[Any, Any]: x coordinates and rows of values of the kept points,
+            as NumPy arrays if they are NumPy arrays, else as lists
+    """
+
+    kept = list(simplify_series_indices(x, values, epsilon, distance_function))
+
+    return _take(x, kept), _take(values, kept)
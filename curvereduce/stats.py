@@ -0,0 +1,130 @@
+"""Opt-in counters and timings of the work done while simplifying curves."""
+
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, ContextManager, Dict, Iterator, Optional
+
+
+class SimplificationStats:
+    """Counters and timings of the work done while simplifying curves, filled
+    in while recording with `record_stats()`.
+
+    Attributes:
+        distance_evaluations (int): points measured against a line, which is
+            every point between the endpoints of each range, or only a few
+            candidates per range with the hull algorithm
+        ranges (int): ranges searched for their furthest point
+        splits (int): ranges broken down at their furthest point
+        max_depth (int): deepest level of the split hierarchy reached, where
+            the whole curve is level 1
+        search_iterations (int): runs of the algorithm `simplify_curve_to()`
+            and friends needed to find the epsilon value
+        phases (Dict[str, float]): wall time in seconds spent in each phase:
+            "simplify" (finding the points to keep), "select" (copying them
+            out), "search" (searching for the epsilon value, including the
+            rankings it runs) and "rank" (ranking the points)
+    """
+
+    def __init__(self) -> None:
+        self.distance_evaluations = 0
+        self.ranges = 0
+        self.splits = 0
+        self.max_depth = 0
+        self.search_iterations = 0
+        self.phases: Dict[str, float] = {}
+
+    def __repr__(self) -> str:
+        return f"SimplificationStats({self.as_dict()!r})"
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Adds the wall time spent in the block to a phase.
+
+        Args:
+            name (str): phase name
+        """
+
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + perf_counter() - started
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Exports the counters and timings as a flat dict, with the time spent
+        in each phase under `"<phase>_seconds"`.
+
+        Returns:
+            Dict[str, Any]: counters and timings
+        """
+
+        result: Dict[str, Any] = {
+            "distance_evaluations": self.distance_evaluations,
+            "ranges": self.ranges,
+            "splits": self.splits,
+            "max_depth": self.max_depth,
+            "search_iterations": self.search_iterations,
+        }
+        for name, seconds in self.phases.items():
+            result[f"{name}_seconds"] = seconds
+
+        return result
+
+
+_active: "ContextVar[Optional[SimplificationStats]]" = ContextVar(
+    "curvereduce_stats", default=None
+)
+
+_no_phase: ContextManager[None] = nullcontext()
+
+
+def current_stats() -> Optional[SimplificationStats]:
+    """Gets the stats being recorded in the current context.
+
+    Returns:
+        Optional[SimplificationStats]: the stats, or None when not recording
+    """
+    return _active.get()
+
+
+def phase(stats: Optional[SimplificationStats], name: str) -> ContextManager[None]:
+    """Times a phase if recording, and does nothing otherwise.
+
+    Args:
+        stats (Optional[SimplificationStats]): the stats being recorded, if any
+        name (str): phase name
+
+    Returns:
+        ContextManager[None]: context manager timing the block
+    """
+    return _no_phase if stats is None else stats.phase(name)
+
+
+@contextmanager
+def record_stats(
+    stats: Optional[SimplificationStats] = None,
+) -> Iterator[SimplificationStats]:
+    """Records the work done by every simplification run in the block, in the
+    current thread (or asyncio task). Recording is off by default, which only
+    costs a check per range of the curve.
+
+    Curves simplified by `simplify_many()` or `simplify_curve_parallel()` in
+    worker processes aren't recorded. Nested blocks record into their own stats only.
+
+    Args:
+        stats (Optional[SimplificationStats], optional): stats to add to.
+            Defaults to new stats.
+
+    Yields:
+        SimplificationStats: the stats being recorded
+    """
+
+    if stats is None:
+        stats = SimplificationStats()
+
+    token = _active.set(stats)
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
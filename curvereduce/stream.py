@@ -0,0 +1,171 @@
+"""Online simplification of unbounded streams of points."""
+# pylint: disable=invalid-name
+
+from typing import Iterable, Iterator, List
+
+from .distance import DEFAULT_DISTANCE_FUNC, DistanceFunc, Point
+from .rdp import _simplify_indices
+
+DEFAULT_WINDOW = 4096
+"""Default maximum number of points held by a `StreamingSimplifier`."""
+
+
+class StreamingSimplifier:
+    """Simplifies a curve that arrives one point at a time, holding at most
+    `window` points in memory.
+
+    Points are buffered until the window is full, and then the buffer is
+    simplified with the Ramer-Douglas-Peucker algorithm. The kept points
+    before the last split are committed: they are emitted and dropped from the
+    buffer, even though later points could have changed them. The last range
+    of the buffer stays open for more points, unless that would leave more than
+    half the window buffered. Nothing is emitted between two full windows, so
+    with the default window points come out in bursts, every few thousand
+    points; `flush()` emits the rest.
+
+    A curve of at most `window` points is simplified exactly like
+    `simplify_curve()` does. Longer curves are simplified window by window;
+    every point that is dropped is still within epsilon of the output.
+    """
+
+    def __init__(
+        self,
+        epsilon: float,
+        distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+        window: int = DEFAULT_WINDOW,
+    ):
+        """Creates a streaming simplifier.
+
+        Args:
+            epsilon (float): minimum distance from the curve
+            distance_function (DistanceFunc, optional): Function used for
+                determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+            window (int, optional): maximum number of points to hold. Defaults
+                to DEFAULT_WINDOW.
+        """
+
+        # make sure our epsilon value is not negative
+        if epsilon < 0:
+            raise ValueError("Epsilon must not be a negative number.")
+
+        # make sure the window can hold a range to simplify
+        if window < 3:
+            raise ValueError("Window must hold at least 3 points.")
+
+        self.epsilon = epsilon
+        self.distance_function = distance_function
+        self.window = window
+
+        # points not emitted yet, except for the first one, which was emitted
+        # already if `_anchored` is set
+        self._buffer: List[Point] = []
+        self._anchored = False
+
+    def push(self, point: Point) -> List[Point]:
+        """Adds a point to the curve.
+
+        Args:
+            point (Point): next point of the curve
+
+        Returns:
+            List[Point]: points of the simplified curve committed because the
+                window filled up, usually none
+        """
+
+        self._buffer.append(point)
+
+        result: List[Point] = []
+        if len(self._buffer) >= self.window:
+            result = self._emit(final=False)
+
+        return result
+
+    def extend(self, points: Iterable[Point]) -> List[Point]:
+        """Adds several points to the curve.
+
+        Args:
+            points (Iterable[Point]): next points of the curve
+
+        Returns:
+            List[Point]: points of the simplified curve committed because the
+                window filled up
+        """
+
+        result: List[Point] = []
+        for point in points:
+            result.extend(self.push(point))
+
+        return result
+
+    def flush(self) -> List[Point]:
+        """Ends the curve. The simplifier can then be used for a new curve.
+
+        Returns:
+            List[Point]: remaining points of the simplified curve
+        """
+
+        result = self._emit(final=True)
+
+        self._buffer = []
+        self._anchored = False
+
+        return result
+
+    def _emit(self, final: bool) -> List[Point]:
+        """Simplifies the buffer and emits the points it commits to.
+
+        Args:
+            final (bool): the curve has ended, so every kept point is emitted
+
+        Returns:
+            List[Point]: points of the simplified curve that are committed
+        """
+
+        buffer = self._buffer
+        kept = _simplify_indices(buffer, self.epsilon, self.distance_function)
+
+        # the last range stays open unless the curve has ended, or it's too big
+        # to leave in the buffer
+        if not final and len(buffer) - kept[-2] <= self.window // 2:
+            kept.pop()
+
+        # the first point of the buffer may have been emitted already
+        first = 1 if self._anchored else 0
+        result = [buffer[i] for i in kept[first:]]
+
+        # the last emitted point anchors the rest of the curve
+        if kept:
+            self._buffer = buffer[kept[-1] :]
+            self._anchored = True
+
+        return result
+
+
+def simplify_stream(
+    points: Iterable[Point],
+    epsilon: float,
+    distance_function: DistanceFunc = DEFAULT_DISTANCE_FUNC,
+    window: int = DEFAULT_WINDOW,
+) -> Iterator[Point]:
+    """Simplifies a curve of any length with an explicit epsilon value,
+    yielding points of the simplified curve each time the window fills up and
+    at the end of the curve. See `StreamingSimplifier`.
+
+    Args:
+        points (Iterable[Point]): points describing the curve
+        epsilon (float): minimum distance from the curve
+        distance_function (DistanceFunc, optional): Function used for
+            determining distance. Defaults to DEFAULT_DISTANCE_FUNC.
+        window (int, optional): maximum number of points to hold. Defaults to
+            DEFAULT_WINDOW.
+
+    Yields:
+        Point: points describing the simplified curve
+    """
+
+    simplifier = StreamingSimplifier(epsilon, distance_function, window)
+
+    for point in points:
+        yield from simplifier.push(point)
+
+    yield from simplifier.flush()
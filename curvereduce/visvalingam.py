@@ -0,0 +1,315 @@
+"""Implementation of the Visvalingam-Whyatt algorithm."""
+# pylint: disable=invalid-name
+
+from array import array
+from heapq import heapify, heappop, heappush
+from typing import Any, List, Sequence, Tuple
+
+from .distance import DistanceIndex, Point, triangle_area
+from .points import PointArray
+from .rdp import _as_index_array, _take
+from .stats import current_stats, phase
+
+try:
+    from . import _numpy
+except ImportError:  # pragma: no cover
+    _numpy = None  # type: ignore
+
+
+def _point_list(points: Any) -> Sequence[Point]:
+    """Gets the points of a curve in a form that is quick to index one point at
+    a time.
+
+    Args:
+        points (Any): points describing the curve
+
+    Returns:
+        Sequence[Point]: points describing the curve
+    """
+
+    if _numpy is not None and _numpy.is_array(points):
+        result: Sequence[Point] = points.tolist()
+    elif isinstance(points, PointArray):
+        result = list(points)
+    else:
+        result = points
+
+    return result
+
+
+def _eliminate(
+    points: Any, area: float, point_count: int
+) -> Tuple[List[float], List[int]]:
+    """Removes the point with the smallest effective area until every point
+    left has a larger effective area than `area`, or only `point_count` points
+    are left.
+
+    The effective area of a point is the area of the triangle it forms with
+    its neighbours, but never less than that of a point removed before it, so
+    that points are removed in order of effective area. Points are kept in a
+    heap by effective area, then index; when a point is removed, its
+    neighbours are linked to each other and pushed again with their new area,
+    and their old entries are skipped when they come up.
+
+    Args:
+        points (Any): points describing the curve
+        area (float): largest effective area to remove
+        point_count (int): number of points to keep, at least two
+
+    Returns:
+        Tuple[List[float], List[int]]: effective area and index of the removed
+            points, in the order they were removed
+    """
+
+    points = _point_list(points)
+    count = len(points)
+    stats = current_stats()
+
+    # neighbours of every point that is left, as a doubly linked list
+    previous = list(range(-1, count - 1))
+    following = list(range(1, count + 1))
+
+    # current effective area of every point, or -1 once it's removed
+    areas = [float("inf")] * count
+    for i in range(1, count - 1):
+        areas[i] = triangle_area(points[i - 1], points[i], points[i + 1])
+
+    heap = [(areas[i], i) for i in range(1, count - 1)]
+    heapify(heap)
+    evaluations = len(heap)
+
+    removed_areas: List[float] = []
+    removed: List[int] = []
+    remaining = count
+
+    while heap and remaining > point_count:
+        smallest, i = heap[0]
+
+        # the point was removed or its area changed since this was pushed
+        if smallest != areas[i]:
+            heappop(heap)
+            continue
+
+        # every point left is significant enough
+        if smallest > area:
+            break
+
+        heappop(heap)
+        removed_areas.append(smallest)
+        removed.append(i)
+        areas[i] = -1.0
+        remaining -= 1
+
+        # link the neighbours to each other and update their areas
+        before, after = previous[i], following[i]
+        following[before] = after
+        previous[after] = before
+
+        for j in (before, after):
+            if 0 < j < count - 1:
+                updated = max(
+                    triangle_area(points[previous[j]], points[j], points[following[j]]),
+                    smallest,
+                )
+                evaluations += 1
+                if updated != areas[j]:
+                    areas[j] = updated
+                    heappush(heap, (updated, j))
+
+    if stats is not None:
+        stats.distance_evaluations += evaluations
+
+    return removed_areas, removed
+
+
+def _check_area(area: float) -> None:
+    """Makes sure the area threshold makes sense.
+
+    Args:
+        area (float): minimum effective area of the kept points
+    """
+
+    # make sure our area is not negative
+    if area < 0:
+        raise ValueError("Area must not be a negative number.")
+
+
+def _kept_after(count: int, removed: List[int]) -> array:
+    """Lists the indices of the points that weren't removed.
+
+    Args:
+        count (int): number of points describing the curve
+        removed (List[int]): indices of the removed points
+
+    Returns:
+        array: indices of the kept points in ascending order, as an
+            `array('q')`
+    """
+
+    keep = bytearray(b"\x01") * count
+    for i in removed:
+        keep[i] = 0
+
+    return array("q", [i for i in range(count) if keep[i]])
+
+
+def _vw_indices(points: Any, area: float) -> array:
+    """Same as `simplify_vw()`, but returns the indices of the kept points.
+
+    Args:
+        points (Any): points describing the curve
+        area (float): minimum effective area of the kept points
+
+    Returns:
+        array: indices of the kept points, as an `array('q')`
+    """
+
+    _check_area(area)
+
+    stats = current_stats()
+
+    with phase(stats, "simplify"):
+
+        # know when to stop
+        if area == 0 or len(points) < 3:
+            result = array("q", range(len(points)))
+        else:
+            result = _kept_after(len(points), _eliminate(points, area, 2)[1])
+
+    return result
+
+
+def _vw_to_indices(points: Any, point_count: int) -> array:
+    """Same as `simplify_vw_to()`, but returns the indices of the kept points.
+
+    Args:
+        points (Any): points describing the curve
+        point_count (int): desired number of points in the simplified curve
+
+    Returns:
+        array: indices of the kept points, as an `array('q')`
+    """
+
+    stats = current_stats()
+
+    with phase(stats, "simplify"):
+
+        # avoid doing unnecessary work
+        if point_count >= len(points):
+            result = array("q", range(len(points)))
+        else:
+            removed = _eliminate(points, float("inf"), max(point_count, 2))[1]
+            result = _kept_after(len(points), removed)
+
+    return result
+
+
+def simplify_vw(points: List[Point], area: float) -> List[Point]:
+    """Simplifies a curve using the Visvalingam-Whyatt algorithm, which
+    repeatedly removes the point forming the triangle of smallest area with
+    its neighbours. Points whose effective area is larger than `area` are
+    kept.
+
+    Args:
+        points (List[Point]): points describing the curve
+        area (float): minimum effective area of the kept points
+
+    Returns:
+        List[Point]: points describing the simplified curve
+    """
+
+    _check_area(area)
+
+    result: List[Point] = []
+
+    # know when to stop
+    if area == 0 or len(points) < 3:
+        result = points[:]
+    else:
+        result = _take(points, _vw_indices(points, area).tolist())
+
+    return result
+
+
+def simplify_vw_to(points: List[Point], point_count: int) -> List[Point]:
+    """Simplifies a curve to exactly the desired number of data points (or all
+    of them, if there are fewer, and at least the endpoints) using the
+    Visvalingam-Whyatt algorithm.
+
+    Args:
+        points (List[Point]): points describing the curve
+        point_count (int): desired number of points in the simplified curve
+
+    Returns:
+        List[Point]: points describing the simplified curve
+    """
+
+    result: List[Point] = []
+
+    # avoid doing unnecessary work
+    if point_count >= len(points):
+        result = points[:]
+    else:
+        result = _take(points, _vw_to_indices(points, point_count).tolist())
+
+    return result
+
+
+def simplify_vw_indices(points: List[Point], area: float) -> Any:
+    """Same as `simplify_vw()`, but returns the indices of the kept points
+    instead of copying them.
+
+    Args:
+        points (List[Point]): points describing the curve
+        area (float): minimum effective area of the kept points
+
+    Returns:
+        Any: indices of the kept points in ascending order, as a NumPy int64
+            array if `points` is a NumPy array, else as an `array('q')`
+    """
+    return _as_index_array(points, _vw_indices(points, area))
+
+
+def simplify_vw_to_indices(points: List[Point], point_count: int) -> Any:
+    """Same as `simplify_vw_to()`, but returns the indices of the kept points
+    instead of copying them.
+
+    Args:
+        points (List[Point]): points describing the curve
+        point_count (int): desired number of points in the simplified curve
+
+    Returns:
+        Any: indices of the kept points in ascending order, as a NumPy int64
+            array if `points` is a NumPy array, else as an `array('q')`
+    """
+    return _as_index_array(points, _vw_to_indices(points, point_count))
+
+
+def rank_points_vw(points: List[Point]) -> List[DistanceIndex]:
+    """Ranks every point of the curve by effective area using a single run of
+    the Visvalingam-Whyatt algorithm, the last point removed first. The
+    endpoints have infinite effective area.
+
+    The ranking has the same form as that of `rank_points()`, so
+    `simplify_ranked()` (with an area instead of an epsilon value) and
+    `simplify_ranked_to()` select from it like `simplify_vw()` and
+    `simplify_vw_to()` would.
+
+    Args:
+        points (List[Point]): points describing the curve
+
+    Returns:
+        List[DistanceIndex]: effective area and index of every point, in
+            ranked order
+    """
+
+    stats = current_stats()
+
+    with phase(stats, "rank"):
+        removed_areas, removed = _eliminate(points, float("inf"), 2)
+
+    endpoints = [0, len(points) - 1] if len(points) > 1 else list(range(len(points)))
+    result = [(float("inf"), i) for i in endpoints]
+    result.extend(zip(reversed(removed_areas), reversed(removed)))
+
+    return result